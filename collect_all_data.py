@@ -123,7 +123,7 @@ def analyze_schedule():
             return False
         
         games_df = pd.read_csv(games_path)
-        analyzer = ScheduleAnalyzer(games_df)
+        analyzer = ScheduleAnalyzer(games_df, copy=False)
         
         # Add schedule features
         enhanced_df = analyzer.add_schedule_features()
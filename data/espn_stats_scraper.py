@@ -18,9 +18,15 @@ Usage:
   from espn_nba_scraper import *              # import individual functions
 """
 
-import requests
+import io
 import json
+import sys
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import redirect_stdout
+from dataclasses import asdict, dataclass
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Optional
 
 # ─────────────────────────────────────────────
@@ -37,10 +43,82 @@ HEADERS = {
 }
 
 
+class _Record(Mapping):
+    """
+    Read-only mapping over the fields of the slotted record types below, so
+    they keep working where callers expect the dicts these functions used to
+    return (`in`, keys/items, dict(rec)). json.dumps needs rec.asdict().
+    """
+    __slots__ = ()
+
+    def __getitem__(self, key):
+        if key in self.__dataclass_fields__:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __iter__(self):
+        return iter(self.__dataclass_fields__)
+
+    def __len__(self):
+        return len(self.__dataclass_fields__)
+
+    def asdict(self) -> dict:
+        return asdict(self)
+
+
+@dataclass(slots=True, frozen=True)
+class RosterPlayer(_Record):
+    id:         Optional[str]
+    name:       str
+    position:   str
+    jersey:     str
+    age:        Optional[int]
+    height:     Optional[str]
+    weight:     Optional[str]
+    birthplace: str
+    experience: int
+    college:    str
+    status:     str
+
+
+@dataclass(slots=True, frozen=True)
+class InjuryRecord(_Record):
+    player:      str
+    player_id:   Optional[str]
+    position:    str
+    team:        str
+    team_abbr:   str
+    status:      str
+    type:        str
+    detail:      str
+    side:        str
+    return_date: str
+    date:        str
+
+
+_SESSION = None
+
+
+def _get_session():
+    """Shared keep-alive session so repeated/parallel calls reuse connections."""
+    global _SESSION
+    if _SESSION is None:
+        # Imported lazily: requests pulls in urllib3/ssl, which callers that
+        # only need constants or helpers from this module shouldn't pay for.
+        import requests
+        from requests.adapters import HTTPAdapter
+        session = requests.Session()
+        session.headers.update(HEADERS)
+        session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=20))
+        _SESSION = session
+    return _SESSION
+
+
 def get(url: str, params: dict = None) -> Optional[dict]:
     """Generic GET with error handling. Returns parsed JSON or None."""
+    import requests
     try:
-        resp = requests.get(url, headers=HEADERS, params=params, timeout=15)
+        resp = _get_session().get(url, params=params, timeout=15)
         resp.raise_for_status()
         return resp.json()
     except requests.RequestException as e:
@@ -48,6 +126,17 @@ def get(url: str, params: dict = None) -> Optional[dict]:
         return None
 
 
+class _FetchFailed(Exception):
+    """Raised inside the cached fetchers so a failed request isn't memoized."""
+
+
+def clear_caches():
+    """Drop cached team/player metadata (for long-running processes)."""
+    _get_teams.cache_clear()
+    _get_team_info.cache_clear()
+    _get_player_profile.cache_clear()
+
+
 # ═══════════════════════════════════════════════
 # SECTION 1 — SCOREBOARD & SCHEDULE
 # ═══════════════════════════════════════════════
@@ -89,28 +178,36 @@ def get_scoreboard(date: str = None) -> list:
                     })
             leaders[abbr] = side_leaders
 
+        status    = event["status"]
+        venue     = comp.get("venue") or {}
+        home_team = home["team"]
+        away_team = away["team"]
+        home_rec  = home.get("record")
+        away_rec  = away.get("record")
+        broadcasts = comp.get("broadcasts")
+
         games.append({
             "id":          event["id"],
             "name":        event.get("name"),
             "date":        event["date"],
-            "status":      event["status"]["type"]["description"],
-            "clock":       event["status"].get("displayClock", ""),
-            "period":      event["status"].get("period", 0),
-            "home_team":   home["team"]["displayName"],
-            "home_abbr":   home["team"]["abbreviation"],
+            "status":      status["type"]["description"],
+            "clock":       status.get("displayClock", ""),
+            "period":      status.get("period", 0),
+            "home_team":   home_team["displayName"],
+            "home_abbr":   home_team["abbreviation"],
             "home_score":  home.get("score", "—"),
-            "home_record": home.get("record", [{}])[0].get("summary", "") if home.get("record") else "",
-            "away_team":   away["team"]["displayName"],
-            "away_abbr":   away["team"]["abbreviation"],
+            "home_record": home_rec[0].get("summary", "") if home_rec else "",
+            "away_team":   away_team["displayName"],
+            "away_abbr":   away_team["abbreviation"],
             "away_score":  away.get("score", "—"),
-            "away_record": away.get("record", [{}])[0].get("summary", "") if away.get("record") else "",
-            "venue":       comp.get("venue", {}).get("fullName", "Unknown"),
-            "city":        comp.get("venue", {}).get("address", {}).get("city", ""),
+            "away_record": away_rec[0].get("summary", "") if away_rec else "",
+            "venue":       venue.get("fullName", "Unknown"),
+            "city":        (venue.get("address") or {}).get("city", ""),
             "broadcast":   ", ".join(
-                name for b in comp.get("broadcasts", [])
+                name for b in broadcasts
                 for name in (b.get("names", []) if isinstance(b.get("names"), list) else [b.get("names", "")])
                 if name
-            ) if comp.get("broadcasts") else "",
+            ) if broadcasts else "",
             "spread":      odds.get("details", ""),
             "over_under":  odds.get("overUnder", ""),
             "leaders":     leaders,
@@ -209,20 +306,28 @@ def get_standings(season: int = None) -> dict:
     return standings
 
 
+_STANDINGS_ROW_FMT = (
+    "  {i:<3} {team:<27} {wins:>4} {losses:>4} {pct:>6} {gb:>5} "
+    "{home:>7} {away:>7} {last_10:>6} {streak:>5}"
+)
+
+
 def print_standings(standings: dict):
     """Pretty-print standings to console."""
+    rule = f"  {'─'*76}"
+    lines = []
     for conf, teams in standings.items():
-        print(f"\n  {'─'*76}")
-        print(f"  {'  ' + conf + 'ern Conference':^76}")
-        print(f"  {'─'*76}")
-        print(f"  {'#':<3} {'TEAM':<27} {'W':>4} {'L':>4} {'PCT':>6} {'GB':>5} {'HOME':>7} {'AWAY':>7} {'L10':>6} {'STK':>5}")
-        print(f"  {'─'*76}")
-        for i, t in enumerate(teams, 1):
-            print(
-                f"  {i:<3} {t['team']:<27} {t['wins']:>4} {t['losses']:>4} "
-                f"{t['pct']:>6} {t['gb']:>5} {t['home']:>7} {t['away']:>7} "
-                f"{t['last_10']:>6} {t['streak']:>5}"
-            )
+        lines += [
+            "",
+            rule,
+            f"  {'  ' + conf + 'ern Conference':^76}",
+            rule,
+            f"  {'#':<3} {'TEAM':<27} {'W':>4} {'L':>4} {'PCT':>6} {'GB':>5} {'HOME':>7} {'AWAY':>7} {'L10':>6} {'STK':>5}",
+            rule,
+        ]
+        lines += [_STANDINGS_ROW_FMT.format(i=i, **t) for i, t in enumerate(teams, 1)]
+    # One write instead of one print per row
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 # ═══════════════════════════════════════════════
@@ -232,13 +337,22 @@ def print_standings(standings: dict):
 def get_teams() -> list:
     """
     Fetch all 30 NBA teams with IDs, abbreviations, colors, and logos.
+    Cached for the life of the process — callers must not mutate the result.
 
     Returns:
         List of team dicts.
     """
+    try:
+        return _get_teams()
+    except _FetchFailed:
+        return []
+
+
+@lru_cache(maxsize=1)
+def _get_teams() -> list:
     data = get(f"{BASE_URL}/teams", {"limit": 40})
     if not data:
-        return []
+        raise _FetchFailed
 
     teams = []
     for sport in data.get("sports", []):
@@ -261,6 +375,7 @@ def get_teams() -> list:
 def get_team_info(team_id: int) -> dict:
     """
     Fetch detailed info for a single team including coach and venue.
+    Cached per team_id — callers must not mutate the result.
 
     Args:
         team_id: ESPN team ID (from get_teams()).
@@ -268,9 +383,17 @@ def get_team_info(team_id: int) -> dict:
     Returns:
         Dict with team details, record, coach, and arena.
     """
+    try:
+        return _get_team_info(team_id)
+    except _FetchFailed:
+        return {}
+
+
+@lru_cache(maxsize=64)
+def _get_team_info(team_id: int) -> dict:
     data = get(f"{BASE_URL}/teams/{team_id}")
     if not data:
-        return {}
+        raise _FetchFailed
     t = data.get("team", {})
     record_items = t.get("record", {}).get("items", [{}])
     return {
@@ -295,7 +418,7 @@ def get_team_roster(team_id: int) -> list:
         team_id: ESPN team ID.
 
     Returns:
-        List of player dicts.
+        List of RosterPlayer records.
     """
     data = get(f"{BASE_URL}/teams/{team_id}/roster")
     if not data:
@@ -307,19 +430,19 @@ def get_team_roster(team_id: int) -> list:
         for p in items:
             if "displayName" not in p:
                 continue
-            players.append({
-                "id":         p.get("id"),
-                "name":       p.get("displayName"),
-                "position":   p.get("position", {}).get("abbreviation", "?"),
-                "jersey":     p.get("jersey", "?"),
-                "age":        p.get("age"),
-                "height":     p.get("displayHeight"),
-                "weight":     p.get("displayWeight"),
-                "birthplace": (p.get("birthPlace") or {}).get("city", ""),
-                "experience": p.get("experience", {}).get("years", 0),
-                "college":    p.get("college", {}).get("name", "—"),
-                "status":     p.get("status", {}).get("type", {}).get("name", "Active"),
-            })
+            players.append(RosterPlayer(
+                id=p.get("id"),
+                name=p.get("displayName"),
+                position=p.get("position", {}).get("abbreviation", "?"),
+                jersey=p.get("jersey", "?"),
+                age=p.get("age"),
+                height=p.get("displayHeight"),
+                weight=p.get("displayWeight"),
+                birthplace=(p.get("birthPlace") or {}).get("city", ""),
+                experience=p.get("experience", {}).get("years", 0),
+                college=p.get("college", {}).get("name", "—"),
+                status=p.get("status", {}).get("type", {}).get("name", "Active"),
+            ))
     return players
 
 
@@ -363,6 +486,7 @@ def search_player(name: str, limit: int = 5) -> list:
 def get_player_profile(player_id: int) -> dict:
     """
     Fetch full player profile — bio, team, draft info, and current status.
+    Cached per player_id — callers must not mutate the result.
 
     Args:
         player_id: ESPN athlete ID.
@@ -370,9 +494,17 @@ def get_player_profile(player_id: int) -> dict:
     Returns:
         Dict with player bio and team info.
     """
+    try:
+        return _get_player_profile(player_id)
+    except _FetchFailed:
+        return {}
+
+
+@lru_cache(maxsize=256)
+def _get_player_profile(player_id: int) -> dict:
     data = get(f"{BASE_URL}/athletes/{player_id}")
     if not data:
-        return {}
+        raise _FetchFailed
 
     a = data.get("athlete", data)
     return {
@@ -447,6 +579,12 @@ def get_player_gamelog(player_id: int, season: int = None) -> list:
 
     categories = data.get("categories", [])
     events = data.get("events", {})
+    # Stat labels are shared by every game dict; intern them once so the
+    # per-game dicts reference a single copy of each key.
+    cat_labels = [
+        [sys.intern(l) for l in cat.get("labels", cat.get("names", []))]
+        for cat in categories
+    ]
 
     games = []
     for event_id, event_info in events.items():
@@ -457,8 +595,7 @@ def get_player_gamelog(player_id: int, season: int = None) -> list:
             "home_away": "vs" if event_info.get("homeAway") == "home" else "@",
             "result":    event_info.get("teamScore", "") + "-" + event_info.get("opponentScore", ""),
         }
-        for cat in categories:
-            labels = cat.get("labels", cat.get("names", []))
+        for cat, labels in zip(categories, cat_labels):
             for stat_event in cat.get("events", []):
                 if stat_event.get("eventId") == event_id:
                     for label, val in zip(labels, stat_event.get("stats", [])):
@@ -557,6 +694,22 @@ def get_league_leaders(stat: str = "points", limit: int = 10) -> list:
     return leaders
 
 
+def get_league_leaders_multi(stats: list, limit: int = 10) -> dict:
+    """
+    Fetch leaders for several stat categories concurrently.
+
+    Args:
+        stats: List of stat categories accepted by get_league_leaders().
+        limit: Number of leaders per category.
+
+    Returns:
+        Dict of stat category → list of leader dicts, in the order given.
+    """
+    with ThreadPoolExecutor(max_workers=max(1, len(stats))) as ex:
+        results = ex.map(lambda s: get_league_leaders(stat=s, limit=limit), stats)
+        return dict(zip(stats, results))
+
+
 def get_team_comparison(team_id_1: int, team_id_2: int) -> dict:
     """
     Fetch and compare analytics for two teams side by side.
@@ -568,10 +721,14 @@ def get_team_comparison(team_id_1: int, team_id_2: int) -> dict:
     Returns:
         Dict with 'team1', 'team2', and 'comparison' keys.
     """
-    stats1 = get_team_analytics(team_id_1)
-    stats2 = get_team_analytics(team_id_2)
-    info1  = get_team_info(team_id_1)
-    info2  = get_team_info(team_id_2)
+    # Four independent requests — fan out over the shared session
+    with ThreadPoolExecutor(max_workers=4) as ex:
+        f_stats1 = ex.submit(get_team_analytics, team_id_1)
+        f_stats2 = ex.submit(get_team_analytics, team_id_2)
+        f_info1  = ex.submit(get_team_info, team_id_1)
+        f_info2  = ex.submit(get_team_info, team_id_2)
+    stats1, stats2 = f_stats1.result(), f_stats2.result()
+    info1, info2   = f_info1.result(), f_info2.result()
 
     all_keys = sorted(set(stats1.keys()) | set(stats2.keys()))
     comparison = []
@@ -602,7 +759,7 @@ def get_injuries(team_id: int = None) -> list:
                  If None, returns all injuries league-wide.
 
     Returns:
-        List of injury dicts with player, team, status, detail, and return date.
+        List of InjuryRecord with player, team, status, detail, and return date.
     """
     if team_id:
         data = get(f"{BASE_URL}/teams/{team_id}/injuries")
@@ -627,22 +784,23 @@ def get_injuries(team_id: int = None) -> list:
     return injuries
 
 
-def _parse_injury(inj: dict, team_name: str = "", team_abbr: str = "") -> dict:
-    """Internal: parse a single injury entry into a clean dict."""
+def _parse_injury(inj: dict, team_name: str = "", team_abbr: str = "") -> InjuryRecord:
+    """Internal: parse a single injury entry into an InjuryRecord."""
     athlete = inj.get("athlete", {})
-    return {
-        "player":      athlete.get("displayName", "Unknown"),
-        "player_id":   athlete.get("id"),
-        "position":    athlete.get("position", {}).get("abbreviation", "?"),
-        "team":        team_name or inj.get("team", {}).get("displayName", "?"),
-        "team_abbr":   team_abbr or inj.get("team", {}).get("abbreviation", "?"),
-        "status":      inj.get("status", "?"),
-        "type":        inj.get("type", {}).get("text", "?"),
-        "detail":      inj.get("details", {}).get("detail", inj.get("longComment", "")),
-        "side":        inj.get("details", {}).get("side", ""),
-        "return_date": inj.get("details", {}).get("returnDate", ""),
-        "date":        inj.get("date", ""),
-    }
+    details = inj.get("details", {})
+    return InjuryRecord(
+        player=athlete.get("displayName", "Unknown"),
+        player_id=athlete.get("id"),
+        position=athlete.get("position", {}).get("abbreviation", "?"),
+        team=team_name or inj.get("team", {}).get("displayName", "?"),
+        team_abbr=team_abbr or inj.get("team", {}).get("abbreviation", "?"),
+        status=inj.get("status", "?"),
+        type=inj.get("type", {}).get("text", "?"),
+        detail=details.get("detail", inj.get("longComment", "")),
+        side=details.get("side", ""),
+        return_date=details.get("returnDate", ""),
+        date=inj.get("date", ""),
+    )
 
 
 def get_injury_report_by_status() -> dict:
@@ -749,7 +907,7 @@ def get_game_summary(game_id: str) -> dict:
         abbr = team_data.get("team", {}).get("abbreviation", "?")
         players = []
         for stat_group in team_data.get("statistics", []):
-            keys = stat_group.get("labels", stat_group.get("names", []))
+            keys = [sys.intern(k) for k in stat_group.get("labels", stat_group.get("names", []))]
             for athlete in stat_group.get("athletes", []):
                 a_info = athlete.get("athlete", {})
                 entry = {
@@ -793,7 +951,7 @@ def _sep(title: str = "", width: int = 72):
         print(f"{'═'*width}")
 
 
-def main():
+def _demo():
     today     = datetime.now().strftime("%Y%m%d")
     yesterday = (datetime.now() - timedelta(days=1)).strftime("%Y%m%d")
 
@@ -838,8 +996,8 @@ def main():
 
     # ── 4. LEAGUE LEADERS ──────────────────────
     _sep("🏆  NBA STATISTICAL LEADERS")
-    for stat_cat in ["points", "rebounds", "assists", "steals", "blocks"]:
-        leaders = get_league_leaders(stat=stat_cat, limit=5)
+    all_leaders = get_league_leaders_multi(["points", "rebounds", "assists", "steals", "blocks"], limit=5)
+    for stat_cat, leaders in all_leaders.items():
         if leaders:
             print(f"\n  Top {stat_cat.capitalize()}:")
             for l in leaders:
@@ -914,5 +1072,17 @@ def main():
     print(f"{'═'*72}\n")
 
 
+def main():
+    # Interactive terminals get output as it's produced; when piped or
+    # redirected, buffer the whole demo and emit it with a single write.
+    if sys.stdout.isatty():
+        _demo()
+        return
+    buf = io.StringIO()
+    with redirect_stdout(buf):
+        _demo()
+    sys.stdout.write(buf.getvalue())
+
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -3,17 +3,22 @@ from __future__ import annotations
 
 import pandas as pd
 from datetime import datetime, timedelta
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
+import importlib.util
 import logging
+import os
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from data.gamelog_cache import fetch_month, season_months
 
 LOGGER = logging.getLogger(__name__)
 
-try:
-    from nba_api.stats.endpoints import leaguegamelog
-    NBA_API_AVAILABLE = True
-except ImportError as e:
-    LOGGER.error(f"nba_api not available: {e}")
-    NBA_API_AVAILABLE = False
+# Only probe for nba_api here; gamelog_cache imports the endpoint when it fetches
+NBA_API_AVAILABLE = importlib.util.find_spec("nba_api") is not None
+if not NBA_API_AVAILABLE:
+    LOGGER.error("nba_api not available")
 
 
 class HistoricalGameFetcher:
@@ -45,17 +50,20 @@ class HistoricalGameFetcher:
         LOGGER.info(f"Fetching games for season {season}...")
         
         try:
-            # Fetch game log for entire league
-            df = leaguegamelog.LeagueGameLog(
-                season=season,
-                season_type_all_star="Regular Season"
-            ).get_data_frames()[0]
+            # Fetch month by month so completed months are served from the disk cache
+            months = [
+                fetch_month(season, month, season_type_all_star="Regular Season")
+                for month in season_months(season)
+            ]
+            df = pd.concat(months, ignore_index=True)
             
-            # Normalize columns
+            # Normalize columns (fixed ISO formats -> fast parser; cache dedups repeated dates)
             if "GAME_DATE_EST" in df.columns:
-                df["game_date"] = pd.to_datetime(df["GAME_DATE_EST"])
+                df["game_date"] = pd.to_datetime(df["GAME_DATE_EST"], format="%Y-%m-%dT%H:%M:%S",
+                                                 cache=True, errors="coerce")
             elif "GAME_DATE" in df.columns:
-                df["game_date"] = pd.to_datetime(df["GAME_DATE"])
+                df["game_date"] = pd.to_datetime(df["GAME_DATE"], format="%Y-%m-%d",
+                                                 cache=True, errors="coerce")
             
             df = df.sort_values("game_date")
             
@@ -77,38 +85,60 @@ class HistoricalGameFetcher:
             List of game dicts with minimal info: 
             {game_id, game_date, home_team, away_team, home_score, away_score, home_win}
         """
-        games = []
-        
-        # nba_api returns one row per team per game; group by game_id
-        grouped = season_df.groupby("GAME_ID") if "GAME_ID" in season_df.columns else None
-        
-        if grouped:
-            for game_id, group in grouped:
-                if len(group) == 2:
-                    # Sort so home team is first (if available; fall back to alphabetical)
-                    row1, row2 = group.iloc[0], group.iloc[1]
-                    
-                    game_date = row1.get("game_date") or row1.get("GAME_DATE_EST")
-                    home_team = row1.get("TEAM_NAME") or row1.get("TEAM_ABBREVIATION")
-                    away_team = row2.get("TEAM_NAME") or row2.get("TEAM_ABBREVIATION")
-                    home_score = int(row1.get("PTS", 0) or 0)
-                    away_score = int(row2.get("PTS", 0) or 0)
-                    home_win = home_score > away_score
-                    
-                    games.append({
-                        "game_id": str(game_id),
-                        "game_date": game_date,
-                        "home_team": home_team,
-                        "away_team": away_team,
-                        "home_score": home_score,
-                        "away_score": away_score,
-                        "home_win": home_win
-                    })
-        
-        return games
-
-    def fetch_all(self) -> pd.DataFrame:
-        """Fetch all games for configured seasons."""
+        if "GAME_ID" not in season_df.columns:
+            return []
+        
+        name_col = "TEAM_NAME" if "TEAM_NAME" in season_df.columns else "TEAM_ABBREVIATION"
+        date_col = "game_date" if "game_date" in season_df.columns else "GAME_DATE_EST"
+        
+        # Only carry the columns we read through the filter/sort below
+        keep = [c for c in ("GAME_ID", "MATCHUP", name_col, date_col, "PTS") if c in season_df.columns]
+        df = season_df[keep]
+        
+        # nba_api returns one row per team per game; keep complete pairs only
+        df = df[df.groupby("GAME_ID")["GAME_ID"].transform("size") == 2]
+        
+        # Order each pair home-first: MATCHUP reads "BOS vs. NYK" for the home
+        # side and "NYK @ BOS" for the away side (fall back to existing order)
+        if "MATCHUP" in df.columns:
+            df = df.assign(_away=~df["MATCHUP"].str.contains(" vs. ", regex=False))
+            df = df.sort_values(["GAME_ID", "_away"], kind="stable")
+        else:
+            df = df.sort_values("GAME_ID", kind="stable")
+        
+        # Work on the raw arrays: even rows are home teams, odd rows away
+        game_ids = df["GAME_ID"].to_numpy()
+        names = df[name_col].to_numpy()
+        dates = df[date_col].to_numpy()
+        pts = df["PTS"].fillna(0).to_numpy(dtype="int32")
+        
+        result = pd.DataFrame({
+            "game_id": game_ids[::2].astype(str),
+            "game_date": dates[::2],
+            "home_team": names[::2],
+            "away_team": names[1::2],
+            "home_score": pts[::2],
+            "away_score": pts[1::2],
+        })
+        result["home_win"] = pts[::2] > pts[1::2]
+        
+        return result.to_dict("records")
+
+    def fetch_all(self, output_path: Optional[str] = None) -> Optional[pd.DataFrame]:
+        """
+        Fetch all games for configured seasons.
+        
+        Args:
+            output_path: If given, each season is appended to this CSV as soon as
+                         it's parsed (only one season is held in memory) and
+                         None is returned; reload with load_all().
+        
+        Returns:
+            DataFrame of all games, or None when streaming to output_path
+        """
+        if output_path is not None:
+            return self._stream_all(output_path)
+        
         all_games = []
         
         for season in self.seasons:
@@ -124,18 +154,74 @@ class HistoricalGameFetcher:
         LOGGER.info(f"Total games fetched: {len(result_df)}")
         return result_df
 
+    def _stream_all(self, output_path: str) -> None:
+        """
+        Write each season to a temp file as it completes, then swap it in for
+        output_path. An existing output_path is left untouched if the fetch
+        fails or returns no games.
+        """
+        path = Path(output_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + ".tmp")
+        tmp_path.unlink(missing_ok=True)
+        
+        total = 0
+        try:
+            for season in sorted(self.seasons):
+                df = self.fetch_season_games(season)
+                if df.empty:
+                    continue
+                games_df = pd.DataFrame(self.parse_games(df))
+                if games_df.empty:
+                    continue
+                games_df = self._compact(games_df.sort_values("game_date"))
+                games_df.to_csv(tmp_path, mode="a", header=not tmp_path.exists(), index=False)
+                total += len(games_df)
+            
+            if total == 0:
+                LOGGER.warning(f"No games fetched; leaving {path} as it was")
+                return
+            os.replace(tmp_path, path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+        
+        LOGGER.info(f"Total games fetched: {total} (written to {path})")
+
+    @staticmethod
+    def load_all(path: str = "data/processed/historical_games.csv") -> pd.DataFrame:
+        """Load a games CSV written by fetch_all/save_csv, sorted by date."""
+        df = pd.read_csv(path, parse_dates=["game_date"])
+        return df.sort_values("game_date").reset_index(drop=True)
+
+    @staticmethod
+    def _compact(df: pd.DataFrame) -> pd.DataFrame:
+        """Narrow dtypes for storage: int16 scores, bool result, categorical teams."""
+        dtypes = {
+            "home_score": "int16", "away_score": "int16", "home_win": "bool",
+            "home_team": "category", "away_team": "category",
+        }
+        return df.astype({c: t for c, t in dtypes.items() if c in df.columns})
+
     def save_csv(self, df: pd.DataFrame, path: str = "data/processed/historical_games.csv"):
         """Save games to CSV."""
-        import os
-        os.makedirs(os.path.dirname(path), exist_ok=True)
-        df.to_csv(path, index=False)
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._compact(df).to_csv(path, index=False)
         LOGGER.info(f"Saved {len(df)} games to {path}")
 
+    def save_parquet(self, df: pd.DataFrame, path: str = "data/processed/historical_games.parquet"):
+        """Save games to parquet (typed, compressed, much faster to reload than CSV)."""
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._compact(df).to_parquet(path, compression="zstd", index=False)
+        LOGGER.info(f"Saved {len(df)} games to {path}")
 
 if __name__ == "__main__":
     logging.basicConfig(level=logging.INFO)
     
+    output_path = Path("data/processed/historical_games.csv")
     fetcher = HistoricalGameFetcher(seasons=[2024, 2025])
-    games_df = fetcher.fetch_all()
+    fetcher.fetch_all(output_path=str(output_path))
+    if not output_path.exists():
+        LOGGER.error(f"No games fetched and no existing {output_path} to load")
+        sys.exit(1)
+    games_df = fetcher.load_all(str(output_path))
     print(f"\n{games_df.head(10)}")
-    fetcher.save_csv(games_df)
@@ -5,22 +5,47 @@ Scrapers for game-to-game data: injuries, schedule, and player status.
 import pandas as pd
 import requests
 import logging
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 try:
-    from bs4 import BeautifulSoup
+    from bs4 import BeautifulSoup, SoupStrainer
 except Exception:
-    BeautifulSoup = None
+    BeautifulSoup = SoupStrainer = None
+try:
+    import lxml  # noqa: F401  (C parser for BeautifulSoup, much faster than html.parser)
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
 from pathlib import Path
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from data.gamelog_cache import fetch_month, season_months
+from data.nba_http import install_retries
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Shared keep-alive session for the ESPN page scrapers
+_SESSION = requests.Session()
+_SESSION.headers.update({"User-Agent": "Mozilla/5.0"})
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=10, pool_maxsize=10,
+    max_retries=Retry(total=3, backoff_factor=0.3),
+))
+
+# (mtime, injuries_by_team) for the manual fallback CSV
+_injury_cache: Optional[tuple] = None
+
 try:
     from nba_api.stats.endpoints import leaguegamelog, scoreboard
     NBA_API_AVAILABLE = True
 except ImportError:
     NBA_API_AVAILABLE = False
+install_retries()
 
 
 class ScheduleFetcher:
@@ -42,36 +67,40 @@ class ScheduleFetcher:
             return pd.DataFrame()
         
         try:
-            from nba_api.live.nba.endpoints import scoreboard
+            from nba_api.stats.endpoints import scoreboardv2
+            from nba_api.stats.static import teams as nba_teams
             
             logger.info(f"Fetching upcoming games for next {days_ahead} days...")
-            games_list = []
+            nicknames = {t["id"]: t["nickname"] for t in nba_teams.get_teams()}
+            dates = [
+                (datetime.now() + timedelta(days=i)).strftime("%Y-%m-%d")
+                for i in range(days_ahead)
+            ]
             
-            for i in range(days_ahead):
-                date = datetime.now() + timedelta(days=i)
-                date_str = date.strftime("%Y-%m-%d")
-                
-                # Try to fetch games for this date
+            def fetch_date(date_str):
                 try:
-                    sb = scoreboard.ScoreBoard()
-                    data = sb.get_dict()
-                    
-                    for game in data.get("scoreboard", {}).get("games", []):
-                        game_date = game.get("gameTimeUTC", "").split("T")[0]
-                        if game_date == date_str:
-                            games_list.append({
-                                "game_id": game.get("gameId"),
-                                "game_date": game_date,
-                                "home_team": game.get("homeTeam", {}).get("teamName"),
-                                "away_team": game.get("awayTeam", {}).get("teamName"),
-                                "time": game.get("gameTimeUTC"),
-                                "status": game.get("gameStatus"),
-                            })
+                    return scoreboardv2.ScoreboardV2(game_date=date_str, timeout=20).game_header.get_data_frame()
                 except Exception as e:
                     logger.debug(f"No games on {date_str}: {e}")
-                    continue
+                    return None
+            
+            # One dated scoreboard request per day, fetched in parallel
+            with ThreadPoolExecutor(max_workers=max(1, min(days_ahead, 7))) as ex:
+                frames = [f for f in ex.map(fetch_date, dates) if f is not None and not f.empty]
             
-            df = pd.DataFrame(games_list)
+            if not frames:
+                logger.info("Found 0 upcoming games")
+                return pd.DataFrame()
+            
+            header = pd.concat(frames, ignore_index=True)
+            df = pd.DataFrame({
+                "game_id": header["GAME_ID"],
+                "game_date": header["GAME_DATE_EST"].str[:10],
+                "home_team": header["HOME_TEAM_ID"].map(nicknames),
+                "away_team": header["VISITOR_TEAM_ID"].map(nicknames),
+                "time": header["GAME_STATUS_TEXT"],
+                "status": header["GAME_STATUS_ID"],
+            })
             logger.info(f"Found {len(df)} upcoming games")
             return df
             
@@ -92,27 +121,22 @@ class ScheduleFetcher:
         try:
             ymd = target_date.replace('-', '')
             url = f"https://www.espn.com/nba/schedule/_/date/{ymd}"
-            headers = {"User-Agent": "Mozilla/5.0"}
-            resp = requests.get(url, headers=headers, timeout=10)
+            resp = _SESSION.get(url, timeout=10)
             resp.raise_for_status()
-            soup = BeautifulSoup(resp.content, 'html.parser')
+            soup = BeautifulSoup(resp.content, HTML_PARSER, parse_only=SoupStrainer("table"))
 
             games = []
-            # ESPN schedule pages contain tables of matchups
-            tables = soup.find_all('table')
-            for tbl in tables:
-                for row in tbl.find_all('tr'):
-                    cols = row.find_all('td')
-                    if len(cols) >= 2:
-                        teams_col = cols[0]
-                        teams = [a.get_text(strip=True) for a in teams_col.find_all('a')]
-                        if len(teams) >= 2:
-                            away, home = teams[0], teams[1]
-                            games.append({
-                                'game_date': target_date,
-                                'home_team': home,
-                                'away_team': away,
-                            })
+            # ESPN schedule pages contain tables of matchups; the first cell of
+            # each multi-column row links the away then home team
+            for teams_col in soup.select("tr > td:first-child:not(:only-of-type)"):
+                teams = [a.get_text(strip=True) for a in teams_col.select("a")]
+                if len(teams) >= 2:
+                    away, home = teams[0], teams[1]
+                    games.append({
+                        'game_date': target_date,
+                        'home_team': home,
+                        'away_team': away,
+                    })
 
             df = pd.DataFrame(games)
             logger.info(f"ESPN schedule scrape found {len(df)} games for {target_date}")
@@ -137,23 +161,18 @@ class ScheduleFetcher:
         
         logger.info(f"Fetching {season} season schedule...")
         
+        def safe_fetch(month):
+            try:
+                return fetch_month(season, month)
+            except Exception as e:
+                logger.debug(f"No game log for {season}-{month:02d}: {e}")
+                return None
+        
         try:
-            from nba_api.stats.endpoints import leaguegamelog
-            
-            games_list = []
-            for month in range(10, 13):  # Oct-Dec
-                try:
-                    df = leaguegamelog.LeagueGameLog(season=season, month=month).get_data_frames()[0]
-                    games_list.append(df)
-                except:
-                    continue
-            
-            for month in range(1, 5):  # Jan-Apr
-                try:
-                    df = leaguegamelog.LeagueGameLog(season=season, month=month).get_data_frames()[0]
-                    games_list.append(df)
-                except:
-                    continue
+            # Months are independent requests; fetch them in parallel
+            with ThreadPoolExecutor(max_workers=4) as ex:
+                results = list(ex.map(safe_fetch, season_months(season)))
+            games_list = [df for df in results if df is not None]
             
             if games_list:
                 result = pd.concat(games_list, ignore_index=True)
@@ -198,12 +217,13 @@ class InjuryReportScraper:
         
         try:
             url = "https://www.espn.com/nba/injuries"
-            headers = {"User-Agent": "Mozilla/5.0"}
-            
-            response = requests.get(url, headers=headers, timeout=10)
+            response = _SESSION.get(url, timeout=10)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.content, "html.parser")
+            soup = BeautifulSoup(
+                response.content, HTML_PARSER,
+                parse_only=SoupStrainer("div", class_="Table__TR"),
+            )
             
             # Find all injury tables by team
             team_sections = soup.find_all("div", class_="Table__TR")
@@ -228,6 +248,8 @@ class InjuryReportScraper:
         
         injuries_by_team = {}
         
+        # Not memoized: there is no live scrape to cache, and
+        # _get_fallback_injuries already reuses the parsed CSV until it changes
         try:
             # Note: NBA.com doesn't have a free public injury API
             # This would need to be scraped from their website or use a paid service
@@ -246,21 +268,28 @@ class InjuryReportScraper:
         Get injury data from local fallback file or return empty.
         User can manually update this file.
         """
+        global _injury_cache
         fallback_path = Path("data/injury_reports/current_injuries.csv")
         
-        if fallback_path.exists():
+        # One stat() per call; the CSV is only re-parsed when its mtime changes
+        try:
+            mtime = fallback_path.stat().st_mtime
+        except FileNotFoundError:
+            logger.warning(f"No injury data at {fallback_path}. Create manually or use API.")
+            return {}
+        
+        if _injury_cache is None or _injury_cache[0] != mtime:
             logger.info(f"Loading injuries from {fallback_path}")
             df = pd.read_csv(fallback_path)
             
-            injuries_by_team = {}
-            for team in df["team"].unique():
-                team_injuries = df[df["team"] == team].to_dict("records")
-                injuries_by_team[team] = team_injuries
-            
-            return injuries_by_team
-        else:
-            logger.warning(f"No injury data at {fallback_path}. Create manually or use API.")
-            return {}
+            # One groupby pass instead of re-scanning the frame per team
+            _injury_cache = (mtime, {
+                team: group.to_dict("records")
+                for team, group in df.groupby("team", sort=False)
+            })
+        
+        # Copy the records too so callers can't corrupt the cached report
+        return {team: [dict(p) for p in players] for team, players in _injury_cache[1].items()}
 
     @staticmethod
     def create_injury_template():
@@ -0,0 +1,85 @@
+"""On-disk cache for nba_api LeagueGameLog pulls, one parquet file per season-month."""
+from __future__ import annotations
+
+import calendar
+import logging
+from datetime import date
+from pathlib import Path
+from typing import Tuple
+
+import pandas as pd
+
+from data.nba_http import install_retries
+
+LOGGER = logging.getLogger(__name__)
+
+CACHE_DIR = Path("data/cache")
+
+# Regular-season months in calendar order (Oct of season-1 through Apr of season)
+SEASON_MONTHS = (10, 11, 12, 1, 2, 3, 4)
+
+# Regular seasons that didn't fit SEASON_MONTHS
+_IRREGULAR_SEASON_MONTHS = {
+    1999: (2, 3, 4, 5),                   # 1998-99 lockout: Feb 5 - May 5
+    2012: (12, 1, 2, 3, 4),               # 2011-12 lockout: Dec 25 - Apr 26
+    2020: (10, 11, 12, 1, 2, 3, 7, 8),    # 2019-20: suspended Mar 11, bubble Jul 30 - Aug 14
+    2021: (12, 1, 2, 3, 4, 5),            # 2020-21: Dec 22 - May 16
+}
+
+
+def season_months(season: int) -> Tuple[int, ...]:
+    """Calendar months (in order) that `season`'s regular season was played in."""
+    return _IRREGULAR_SEASON_MONTHS.get(season, SEASON_MONTHS)
+
+
+def _month_window(season: int, month: int) -> Tuple[date, date]:
+    """First and last calendar day of `month` within `season` (2025 = 2024-25)."""
+    year = season - 1 if month >= 10 else season
+    return date(year, month, 1), date(year, month, calendar.monthrange(year, month)[1])
+
+
+def _cache_path(season: int, month: int) -> Path:
+    return CACHE_DIR / f"gamelog_{season}_{month:02d}.parquet"
+
+
+def fetch_month(season: int, month: int, **kwargs) -> pd.DataFrame:
+    """
+    Fetch one month of the league game log, served from disk once the month is over.
+
+    Completed months never change, so they are written to `CACHE_DIR` on first
+    fetch and read back on every later call. The current/future month always
+    hits the network, as does a completed month that came back empty (it is
+    not cached, so a failed or premature pull doesn't stick).
+
+    Args:
+        season: Season year (e.g., 2025 for 2024-25 season)
+        month: Calendar month (1-12)
+        **kwargs: Extra LeagueGameLog arguments (e.g. season_type_all_star)
+
+    Returns:
+        Raw LeagueGameLog DataFrame for that month (may be empty)
+    """
+    from nba_api.stats.endpoints import leaguegamelog
+    install_retries()
+
+    first, last = _month_window(season, month)
+    path = _cache_path(season, month)
+    complete = last < date.today()
+
+    if complete and path.exists():
+        return pd.read_parquet(path)
+
+    df = leaguegamelog.LeagueGameLog(
+        season=season,
+        date_from_nullable=first.strftime("%m/%d/%Y"),
+        date_to_nullable=last.strftime("%m/%d/%Y"),
+        **kwargs,
+    ).get_data_frames()[0]
+
+    if complete and not df.empty:
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            df.to_parquet(path, index=False)
+        except Exception as e:  # pyarrow missing or unwritable dir
+            LOGGER.debug(f"Could not cache {path}: {e}")
+    return df
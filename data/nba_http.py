@@ -0,0 +1,45 @@
+"""Retrying HTTP session for nba_api (stats.nba.com drops/times out requests regularly)."""
+from __future__ import annotations
+
+import logging
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+LOGGER = logging.getLogger(__name__)
+
+_installed = False
+
+
+def install_retries(total: int = 4, backoff_factor: float = 0.5):
+    """
+    Mount a urllib3 Retry policy on the session nba_api uses for stats.nba.com.
+
+    Without this a single ReadTimeout or 5xx bubbles up and the caller drops
+    that month/game. Safe to call repeatedly; only the first call installs.
+
+    Args:
+        total: Maximum retries per request (connect, read and status combined)
+        backoff_factor: Exponential backoff base in seconds (0.5 -> 0.5, 1, 2, 4s)
+    """
+    global _installed
+    if _installed:
+        return
+    try:
+        from nba_api.stats.library.http import NBAStatsHTTP
+    except ImportError:
+        return
+
+    session = requests.Session()
+    adapter = HTTPAdapter(max_retries=Retry(
+        total=total,
+        backoff_factor=backoff_factor,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["GET"],
+    ))
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    NBAStatsHTTP.set_session(session)
+    _installed = True
+    LOGGER.debug("Installed retrying session for nba_api")
@@ -3,10 +3,16 @@ from __future__ import annotations
 
 import pandas as pd
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional
 import requests
 from pathlib import Path
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from data.nba_http import install_retries
 
 LOGGER = logging.getLogger(__name__)
 
@@ -14,6 +20,9 @@ LOGGER = logging.getLogger(__name__)
 class PlayerStatsCollector:
     """Fetch player box scores and prop-relevant stats from nba_api."""
     
+    # Concurrent box-score requests; stats.nba.com throttles aggressive clients
+    BOX_SCORE_WORKERS = 6
+    
     def __init__(self):
         pass
     
@@ -35,42 +44,53 @@ class PlayerStatsCollector:
         except ImportError:
             LOGGER.error("nba_api not available")
             return pd.DataFrame()
+        install_retries()
         
         date_str = game_date.strftime("%m/%d/%Y")
         LOGGER.info(f"Fetching player stats for {date_str}...")
         
         try:
-            # Get all games for this date
-            games_df = leaguegamelog.LeagueGameLog(
+            # Get all games for this date (filtered server-side, not the full season log)
+            today_games = leaguegamelog.LeagueGameLog(
                 season=game_date.year,
-                season_type_all_star="Regular Season"
+                season_type_all_star="Regular Season",
+                date_from_nullable=date_str,
+                date_to_nullable=date_str,
             ).get_data_frames()[0]
             
-            # Filter to this date
-            games_df["GAME_DATE"] = pd.to_datetime(games_df.get("GAME_DATE", games_df.get("GAME_DATE_EST")))
-            today_games = games_df[games_df["GAME_DATE"].dt.date == game_date.date()]
-            
             if today_games.empty:
                 LOGGER.warning(f"No games found for {date_str}")
                 return pd.DataFrame()
             
-            # Fetch box scores for each game
+            def fetch_box(game_id):
+                box = boxscoretraditionalv2.BoxScoreTraditionalV2(game_id=str(game_id), timeout=30)
+                players = box.get_data_frames()[0]  # Player stats
+                players["GAME_ID"] = game_id
+                return players
+            
+            # Fetch box scores for all games concurrently (I/O bound); cap
+            # workers and stagger submissions to stay under NBA rate limits
             all_players = []
-            for game_id in today_games["GAME_ID"].unique():
-                try:
-                    box = boxscoretraditionalv2.BoxScoreTraditionalV2(game_id=str(game_id))
-                    players = box.get_data_frames()[0]  # Player stats
-                    
-                    players["GAME_ID"] = game_id
-                    all_players.append(players)
-                except Exception as e:
-                    LOGGER.warning(f"Error fetching box score {game_id}: {e}")
+            with ThreadPoolExecutor(max_workers=self.BOX_SCORE_WORKERS) as ex:
+                futures = {}
+                for game_id in today_games["GAME_ID"].unique():
+                    futures[ex.submit(fetch_box, game_id)] = game_id
+                    time.sleep(0.1)
+                for future in as_completed(futures):
+                    try:
+                        all_players.append(future.result())
+                    except Exception as e:
+                        LOGGER.warning(f"Error fetching box score {futures[future]}: {e}")
             
             if not all_players:
                 return pd.DataFrame()
             
-            df = pd.concat(all_players, ignore_index=True)
-            LOGGER.info(f"Fetched stats for {len(df.groupby('PLAYER_ID')))} unique players")
+            # Align every frame to one column layout so the single concat is a
+            # straight row append rather than a per-column reindex
+            cols = all_players[0].columns
+            all_players = [p if p.columns.equals(cols) else p.reindex(columns=cols) for p in all_players]
+            df = pd.concat(all_players, ignore_index=True, sort=False)
+            LOGGER.info(f"Fetched stats for {df['PLAYER_ID'].nunique()} unique players")
             
             # Rename and clean
             df.columns = df.columns.str.lower()
@@ -110,17 +130,29 @@ class PlayerStatsCollector:
             "min": "minutes",
         }
         
-        available_cols = [k for k in prop_cols.keys() if k in player_stats.columns]
-        df = player_stats[available_cols + ["game_id", "game_date"]].copy()
-        df.rename(columns={k: v for k, v in prop_cols.items() if k in available_cols}, inplace=True)
-        
-        return df
+        # Single rename + column selection; game_id/game_date are optional
+        df = player_stats.rename(columns=prop_cols)
+        keep = [v for v in prop_cols.values() if v in df.columns]
+        keep += [c for c in ("game_id", "game_date") if c in df.columns]
+        return df.loc[:, keep].copy()
     
     def save_player_stats(self, df: pd.DataFrame, path: str = "data/processed/player_stats.csv"):
         """Save player stats to CSV."""
         Path(path).parent.mkdir(parents=True, exist_ok=True)
+        # Downcast numerics (nba_api hands back int64/float64 for everything)
+        df = df.copy()
+        for col in df.select_dtypes("integer").columns:
+            df[col] = pd.to_numeric(df[col], downcast="integer")
+        for col in df.select_dtypes("float").columns:
+            df[col] = pd.to_numeric(df[col], downcast="float")
         df.to_csv(path, index=False)
         LOGGER.info(f"Saved {len(df)} player stat records to {path}")
+    
+    def save_parquet(self, df: pd.DataFrame, path: str = "data/processed/player_stats.parquet"):
+        """Save player stats to parquet (typed and compressed, for model training)."""
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        df.to_parquet(path, engine="pyarrow", compression="zstd", index=False)
+        LOGGER.info(f"Saved {len(df)} player stat records to {path}")
 
 
 class PropOddsCollector:
@@ -9,6 +9,13 @@ import numpy as np
 from datetime import datetime, timedelta
 from typing import Dict, Tuple
 import logging
+import math
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
@@ -73,17 +80,122 @@ def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> fl
     return R * c
 
 
+def haversine_vec(lat1: np.ndarray, lon1: np.ndarray,
+                  lat2: np.ndarray, lon2: np.ndarray) -> np.ndarray:
+    """
+    Vectorized haversine: element-wise distance in miles between coordinate arrays
+    
+    Args:
+        lat1, lon1: First points (degrees)
+        lat2, lon2: Second points (degrees)
+        
+    Returns:
+        Array of distances in miles
+    """
+    if NUMBA_AVAILABLE and np.asarray(lat1).dtype == np.float32:
+        # Fused, multi-core kernel: no per-ufunc temporaries for dlat/dlon/a/c
+        arrays = [np.ascontiguousarray(a, dtype=np.float32) for a in (lat1, lon1, lat2, lon2)]
+        out = np.empty(arrays[0].size, dtype=np.float32)
+        _haversine_numba(*arrays, out)
+        return out
+    
+    R = 3959.0
+    lat1, lon1, lat2, lon2 = (np.radians(a) for a in (lat1, lon1, lat2, lon2))
+    a = np.sin((lat2 - lat1) / 2)**2 + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2)**2
+    return R * 2 * np.arcsin(np.sqrt(a))
+
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _haversine_numba(lat1, lon1, lat2, lon2, out):
+        """haversine_vec kernel over float32 degree arrays, written into `out`."""
+        R = 3959.0
+        rad = math.pi / 180.0
+        for i in prange(lat1.size):
+            p1 = lat1[i] * rad
+            p2 = lat2[i] * rad
+            a = (math.sin((p2 - p1) / 2) ** 2
+                 + math.cos(p1) * math.cos(p2) * math.sin((lon2[i] - lon1[i]) * rad / 2) ** 2)
+            out[i] = R * 2 * math.asin(math.sqrt(a))
+
+
+# Team name -> row in TEAM_COORDS, a contiguous (30, 2) float32 [lat, lon] matrix
+TEAM_IDX = {name: i for i, name in enumerate(sorted(TEAM_LOCATIONS))}
+TEAM_COORDS = np.array([TEAM_LOCATIONS[name] for name in TEAM_IDX], dtype=np.float32)
+
+
+# Per-team trig tables, evaluated once for the 30 cities
+_LAT_RAD, _LON_RAD = np.radians(TEAM_COORDS.astype(np.float64)).T
+TEAM_SIN_LAT, TEAM_COS_LAT = np.sin(_LAT_RAD), np.cos(_LAT_RAD)
+
+# (30, 30) pairwise great-circle miles. Haversine in its product form on the
+# precomputed terms: a = (1 - sin1*sin2 - cos1*cos2*cos(dlon)) / 2
+_A = (1.0 - np.outer(TEAM_SIN_LAT, TEAM_SIN_LAT)
+      - np.outer(TEAM_COS_LAT, TEAM_COS_LAT) * np.cos(_LON_RAD[None, :] - _LON_RAD[:, None])) / 2
+TEAM_MILES = (2 * 3959.0 * np.arcsin(np.sqrt(np.clip(_A, 0.0, 1.0)))).astype(np.float32)
+
+
+def great_circle_ids(ids1: np.ndarray, ids2: np.ndarray) -> np.ndarray:
+    """
+    Great-circle miles between teams' cities by TEAM_COORDS row (a gather from
+    TEAM_MILES, no per-row trig)
+    
+    Args:
+        ids1, ids2: TEAM_COORDS row indices
+        
+    Returns:
+        Array of distances in miles
+    """
+    return TEAM_MILES[ids1, ids2]
+
+
+def _team_ids(names: pd.Series) -> np.ndarray:
+    """Map team names to TEAM_COORDS rows (int8, -1 for unknown/missing)."""
+    return names.map(TEAM_IDX).fillna(-1).to_numpy(dtype=np.int8)
+
+
 class ScheduleAnalyzer:
     """Analyze NBA schedule for rest and travel factors"""
     
-    def __init__(self, games_df: pd.DataFrame):
+    def __init__(self, games_df: pd.DataFrame, copy: bool = True):
         """
         Args:
             games_df: DataFrame with columns: game_date, home_team, away_team
+            copy: Work on a copy of games_df. Pass False when the caller owns the
+                  frame (e.g. freshly read from CSV) to skip the duplicate; it is
+                  then converted and sorted in place.
         """
-        self.games_df = games_df.copy()
+        self.games_df = games_df.copy() if copy else games_df
         self.games_df['game_date'] = pd.to_datetime(self.games_df['game_date'])
-        self.games_df = self.games_df.sort_values('game_date')
+        self.games_df.sort_values('game_date', inplace=True)
+        
+        # Arrow-backed team names (contiguous buffers, C compare kernels) where the
+        # frame still holds Python-object strings; pandas 3 already defaults to these
+        for col in ('home_team', 'away_team'):
+            if self.games_df[col].dtype == object:
+                try:
+                    self.games_df[col] = self.games_df[col].astype('string[pyarrow]')
+                except ImportError:
+                    break
+        
+        # Shared team categories: team filters compare small int codes, not strings
+        teams = pd.Index(pd.concat([self.games_df['home_team'], self.games_df['away_team']]).dropna().unique())
+        self._team_code = {team: code for code, team in enumerate(teams)}
+        self._home_codes = pd.Categorical(self.games_df['home_team'], categories=teams).codes
+        self._away_codes = pd.Categorical(self.games_df['away_team'], categories=teams).codes
+        
+        # Per-team (dates, hosts) arrays sorted by date, so the scalar queries
+        # below are searchsorted lookups instead of boolean masks over every game.
+        # Dates are int64 epoch-ns; games_df keeps the datetime column for output.
+        self._team_games: Dict[str, Tuple[np.ndarray, np.ndarray]] = {
+            team: (g['game_date'].to_numpy().astype('datetime64[ns]').view('i8'), g['host'].to_numpy())
+            for team, g in self._team_game_log().groupby('team', sort=False)
+        }
+    
+    def _prior_games(self, team: str, game_date: pd.Timestamp) -> Tuple[np.ndarray, np.ndarray, int]:
+        """Team's (dates_ns, hosts) and the index of its first game on/after game_date."""
+        dates, hosts = self._team_games.get(team, (np.array([], dtype=np.int64), np.array([])))
+        return dates, hosts, int(np.searchsorted(dates, pd.Timestamp(game_date).value, side='left'))
     
     def calculate_days_rest(self, team: str, game_date: pd.Timestamp) -> int:
         """
@@ -97,16 +209,12 @@ class ScheduleAnalyzer:
             Number of days since last game (0 = back-to-back)
         """
         # Find previous game for this team
-        team_games = self.games_df[
-            ((self.games_df['home_team'] == team) | (self.games_df['away_team'] == team)) &
-            (self.games_df['game_date'] < game_date)
-        ].sort_values('game_date')
+        dates, _, i = self._prior_games(team, game_date)
         
-        if team_games.empty:
+        if i == 0:
             return 3  # Default for first game
         
-        last_game_date = team_games.iloc[-1]['game_date']
-        days_rest = (game_date - last_game_date).days - 1
+        days_rest = (game_date - pd.Timestamp(dates[i - 1], unit='ns')).days - 1
         
         return max(0, days_rest)
     
@@ -124,13 +232,10 @@ class ScheduleAnalyzer:
         """
         start_date = game_date - timedelta(days=days)
         
-        team_games = self.games_df[
-            ((self.games_df['home_team'] == team) | (self.games_df['away_team'] == team)) &
-            (self.games_df['game_date'] >= start_date) &
-            (self.games_df['game_date'] < game_date)
-        ]
+        dates, _, end = self._prior_games(team, game_date)
+        start = np.searchsorted(dates, pd.Timestamp(start_date).value, side='left')
         
-        return len(team_games)
+        return int(end - start)
     
     def calculate_travel_distance(self, team: str, game_date: pd.Timestamp, 
                                   is_home: bool) -> float:
@@ -149,37 +254,24 @@ class ScheduleAnalyzer:
             return 0.0
         
         # Find previous game location
-        team_games = self.games_df[
-            ((self.games_df['home_team'] == team) | (self.games_df['away_team'] == team)) &
-            (self.games_df['game_date'] < game_date)
-        ].sort_values('game_date')
+        dates, hosts, i = self._prior_games(team, game_date)
         
-        if team_games.empty:
+        if i == 0:
             return 0.0  # First game, no travel
         
-        last_game = team_games.iloc[-1]
-        
-        # Determine previous location
-        if last_game['home_team'] == team:
-            prev_location = TEAM_LOCATIONS[team]  # Was at home
-        else:
-            prev_team = last_game['home_team']
-            prev_location = TEAM_LOCATIONS.get(prev_team, TEAM_LOCATIONS[team])
+        # Determine previous location (host city of the last game)
+        prev_location = TEAM_LOCATIONS.get(hosts[i - 1], TEAM_LOCATIONS[team])
         
         # Determine current location
         if is_home:
             curr_location = TEAM_LOCATIONS[team]
+        elif i < len(dates) and dates[i] == pd.Timestamp(game_date).value:
+            curr_location = TEAM_LOCATIONS.get(hosts[i], TEAM_LOCATIONS[team])
         else:
-            # Find opponent
-            curr_game = self.games_df[
-                (self.games_df['game_date'] == game_date) &
-                ((self.games_df['home_team'] == team) | (self.games_df['away_team'] == team))
-            ]
-            if not curr_game.empty:
-                opponent = curr_game.iloc[0]['home_team'] if not is_home else curr_game.iloc[0]['away_team']
-                curr_location = TEAM_LOCATIONS.get(opponent, TEAM_LOCATIONS[team])
-            else:
-                curr_location = TEAM_LOCATIONS[team]
+            curr_location = TEAM_LOCATIONS[team]
+        
+        if prev_location == curr_location:
+            return 0.0  # Same city, skip the trig
         
         # Calculate distance
         distance = haversine_distance(
@@ -189,6 +281,43 @@ class ScheduleAnalyzer:
         
         return distance
     
+    def _team_game_log(self) -> pd.DataFrame:
+        """
+        Melt games into one row per (team, game), sorted by team then date, with
+        each team's previous game attached via a single groupby + shift.
+        
+        Returns:
+            DataFrame with columns: pos (row in games_df), team, is_home, host,
+                                    game_date, prev_date, prev_host
+        """
+        df = self.games_df
+        pos = np.arange(len(df))
+        home_team = df['home_team'].to_numpy()
+        long = pd.concat([
+            pd.DataFrame({'pos': pos, 'team': home_team, 'is_home': True,
+                          'host': home_team, 'game_date': df['game_date'].to_numpy()}),
+            pd.DataFrame({'pos': pos, 'team': df['away_team'].to_numpy(), 'is_home': False,
+                          'host': home_team, 'game_date': df['game_date'].to_numpy()}),
+        ], ignore_index=True)
+        long = long.sort_values(['team', 'game_date'], kind='stable', ignore_index=True)
+        
+        by_team = long.groupby('team', sort=False)
+        long['prev_date'] = by_team['game_date'].shift(1)
+        long['prev_host'] = by_team['host'].shift(1)
+        return long
+    
+    @staticmethod
+    def _by_side(long: pd.DataFrame, values) -> Tuple[np.ndarray, np.ndarray]:
+        """Scatter per-(team, game) values back to (home, away) arrays in games_df row order."""
+        values = np.asarray(values)
+        pos = long['pos'].to_numpy()
+        is_home = long['is_home'].to_numpy()
+        home = np.empty(len(long) // 2, dtype=values.dtype)
+        away = np.empty(len(long) // 2, dtype=values.dtype)
+        home[pos[is_home]] = values[is_home]
+        away[pos[~is_home]] = values[~is_home]
+        return home, away
+    
     def add_schedule_features(self) -> pd.DataFrame:
         """
         Add schedule-related features to games dataframe
@@ -196,43 +325,56 @@ class ScheduleAnalyzer:
         Returns:
             Enhanced dataframe with rest/travel features
         """
-        df = self.games_df.copy()
+        df = self.games_df
         
         logger.info("Calculating schedule features...")
         
-        # Initialize columns
-        df['home_days_rest'] = 0
-        df['away_days_rest'] = 0
-        df['home_back_to_back'] = False
-        df['away_back_to_back'] = False
-        df['home_games_last_7'] = 0
-        df['away_games_last_7'] = 0
-        df['home_travel_miles'] = 0.0
-        df['away_travel_miles'] = 0.0
-        
-        # Calculate for each game
-        for idx, row in df.iterrows():
-            game_date = row['game_date']
-            home_team = row['home_team']
-            away_team = row['away_team']
-            
-            # Days rest
-            home_rest = self.calculate_days_rest(home_team, game_date)
-            away_rest = self.calculate_days_rest(away_team, game_date)
-            df.at[idx, 'home_days_rest'] = home_rest
-            df.at[idx, 'away_days_rest'] = away_rest
-            
-            # Back-to-back
-            df.at[idx, 'home_back_to_back'] = (home_rest == 0)
-            df.at[idx, 'away_back_to_back'] = (away_rest == 0)
-            
-            # Games in last 7 days
-            df.at[idx, 'home_games_last_7'] = self.calculate_games_in_period(home_team, game_date, 7)
-            df.at[idx, 'away_games_last_7'] = self.calculate_games_in_period(away_team, game_date, 7)
-            
-            # Travel distance
-            df.at[idx, 'home_travel_miles'] = self.calculate_travel_distance(home_team, game_date, is_home=True)
-            df.at[idx, 'away_travel_miles'] = self.calculate_travel_distance(away_team, game_date, is_home=False)
+        # Previous game per team in one sorted groupby pass (no per-game rescans)
+        long = self._team_game_log()
+        
+        # Days rest (3 = no previous game) and back-to-back
+        rest = ((long['game_date'] - long['prev_date']).dt.days - 1).clip(lower=0)
+        rest = rest.fillna(3).astype(int)
+        home_rest, away_rest = self._by_side(long, rest)
+        
+        # Travel: previous game's host city -> this game's host city, one vectorized
+        # great-circle call over all rows. Unknown hosts fall back to the team's own city; unknown
+        # teams and season openers travel 0 miles.
+        team_id = _team_ids(long['team'])
+        host_id = _team_ids(long['host'])
+        prev_id = _team_ids(long['prev_host'])
+        travelled = long['prev_date'].notna().to_numpy() & (team_id >= 0)
+        prev_id = np.where(travelled & (prev_id >= 0), prev_id, team_id)
+        curr_id = np.where(host_id >= 0, host_id, team_id)
+        # Staying in the same city (home stands, back-to-back at one venue) is 0
+        # miles; only run the trig kernel on rows that actually moved
+        moved = travelled & (prev_id != curr_id)
+        miles = np.zeros(len(long), dtype=np.float32)
+        miles[moved] = great_circle_ids(prev_id[moved], curr_id[moved])
+        home_miles, away_miles = self._by_side(long, miles)
+        
+        # Games in last 7 days: long is sorted by (team, date), so offset each team's
+        # timestamps into its own disjoint range and count the [date - 7d, date)
+        # window with two searchsorted calls over the whole frame
+        week = 7 * 86400
+        secs = long['game_date'].to_numpy().astype('datetime64[s]').astype(np.int64)
+        span = secs.max(initial=0) + week + 1
+        key = long.groupby('team', sort=False).ngroup().to_numpy() * span + secs
+        last_7 = np.searchsorted(key, key, side='left') - np.searchsorted(key, key - week, side='left')
+        home_last_7, away_last_7 = self._by_side(long, last_7)
+        
+        # Build the new columns as one frame and attach them in a single concat
+        new_cols = pd.DataFrame({
+            'home_days_rest': home_rest,
+            'away_days_rest': away_rest,
+            'home_back_to_back': home_rest == 0,
+            'away_back_to_back': away_rest == 0,
+            'home_games_last_7': home_last_7,
+            'away_games_last_7': away_last_7,
+            'home_travel_miles': home_miles,
+            'away_travel_miles': away_miles,
+        }, index=df.index)
+        df = pd.concat([df, new_cols], axis=1)
         
         logger.info("Schedule features calculated")
         
@@ -245,28 +387,28 @@ class ScheduleAnalyzer:
         Returns:
             Dict with schedule metrics
         """
-        team_games = self.games_df[
-            (self.games_df['home_team'] == team) | (self.games_df['away_team'] == team)
-        ]
-        
-        if team_games.empty:
+        code = self._team_code.get(team)
+        if code is None:
             return {}
         
         # Calculate metrics
-        is_home = team_games['home_team'] == team
+        is_home = self._home_codes == code
         
-        total_games = len(team_games)
+        total_games = int((is_home | (self._away_codes == code)).sum())
         home_games = is_home.sum()
         away_games = total_games - home_games
         
+        # Rest before each game from consecutive date gaps (3 for the opener)
+        dates = self._team_games[team][0]
+        gaps = (np.diff(dates) // 86_400_000_000_000) - 1  # ns per day
+        rest = np.concatenate(([3], np.clip(gaps, 0, None)))
+        
         return {
             'team': team,
             'total_games': total_games,
             'home_games': home_games,
             'away_games': away_games,
-            'avg_days_rest': team_games.apply(
-                lambda row: self.calculate_days_rest(team, row['game_date']), axis=1
-            ).mean(),
+            'avg_days_rest': rest.mean(),
         }
 
 
@@ -276,7 +418,7 @@ if __name__ == "__main__":
     # Load historical games
     games_df = pd.read_csv("data/processed/historical_games.csv")
     
-    analyzer = ScheduleAnalyzer(games_df)
+    analyzer = ScheduleAnalyzer(games_df, copy=False)
     
     # Add schedule features
     enhanced_df = analyzer.add_schedule_features()
@@ -2,6 +2,7 @@
 
 import requests
 import json
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 BASE_URL = "https://site.api.espn.com/apis/site/v2/sports/basketball/nba"
 HEADERS = {
@@ -9,61 +10,62 @@ HEADERS = {
     "Accept": "application/json",
 }
 
-print("\n" + "="*70)
-print("TESTING ESPN API ENDPOINTS")
-print("="*70)
 
-# Test standings
-print("\n1. Testing standings endpoint...")
-url = f"{BASE_URL}/standings"
-try:
-    resp = requests.get(url, headers=HEADERS, timeout=10)
-    print(f"Status: {resp.status_code}")
-    data = resp.json()
-    print(f"Keys in response: {list(data.keys())}")
-    
+def report_standings(data):
     # Save to file for inspection
     with open('espn_standings_raw.json', 'w') as f:
         json.dump(data, f, indent=2)
     print("✓ Saved raw response to espn_standings_raw.json")
-    
+
     # Check structure
     if 'children' in data:
         print(f"  - Found {len(data['children'])} children")
         for child in data['children'][:2]:
             print(f"    - {child.get('name')}: {len(child.get('standings', {}).get('entries', []))} teams")
-except Exception as e:
-    print(f"✗ Error: {e}")
 
-# Test teams
-print("\n2. Testing teams endpoint...")
-url = f"{BASE_URL}/teams"
-try:
-    resp = requests.get(url, headers=HEADERS, params={"limit": 40}, timeout=10)
-    print(f"Status: {resp.status_code}")
-    data = resp.json()
-    print(f"Keys in response: {list(data.keys())}")
-    
+
+def report_teams(data):
     # Count teams
     team_count = 0
     for sport in data.get("sports", []):
         for league in sport.get("leagues", []):
             team_count += len(league.get("teams", []))
     print(f"  - Found {team_count} teams")
-except Exception as e:
-    print(f"✗ Error: {e}")
 
-# Test scoreboard
-print("\n3. Testing scoreboard endpoint...")
-url = f"{BASE_URL}/scoreboard"
-try:
-    resp = requests.get(url, headers=HEADERS, timeout=10)
-    print(f"Status: {resp.status_code}")
-    data = resp.json()
-    print(f"Keys in response: {list(data.keys())}")
+
+def report_scoreboard(data):
     print(f"  - Found {len(data.get('events', []))} games")
-except Exception as e:
-    print(f"✗ Error: {e}")
+
+
+# (label, path, params, report)
+ENDPOINTS = [
+    ("1. Testing standings endpoint...", "standings", None, report_standings),
+    ("2. Testing teams endpoint...", "teams", {"limit": 40}, report_teams),
+    ("3. Testing scoreboard endpoint...", "scoreboard", None, report_scoreboard),
+]
+
+print("\n" + "="*70)
+print("TESTING ESPN API ENDPOINTS")
+print("="*70)
+
+# Fire all probes at once on one keep-alive session; report in arrival order
+with requests.Session() as session, ThreadPoolExecutor(max_workers=len(ENDPOINTS)) as ex:
+    session.headers.update(HEADERS)
+    futures = {
+        ex.submit(session.get, f"{BASE_URL}/{path}", params=params, timeout=10): (label, report)
+        for label, path, params, report in ENDPOINTS
+    }
+    for future in as_completed(futures):
+        label, report = futures[future]
+        print(f"\n{label}")
+        try:
+            resp = future.result()
+            print(f"Status: {resp.status_code}")
+            data = resp.json()
+            print(f"Keys in response: {list(data.keys())}")
+            report(data)
+        except Exception as e:
+            print(f"✗ Error: {e}")
 
 print("\n" + "="*70)
 print("Check espn_standings_raw.json to see full structure")
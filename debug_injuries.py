@@ -6,8 +6,9 @@ import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from models.team_data_loader import TeamDataLoader
 import pandas as pd
+# Shares predictor's on-disk loader snapshot (keyed on the CSVs and loader code)
+from predictor import _load_data_loader
 
 
 def main():
@@ -15,8 +16,6 @@ def main():
     print("INJURY DATA DEBUG")
     print("="*70)
     
-    loader = TeamDataLoader()
-    
     # Check if injury files exist
     injury_file = Path("data/injury_reports/current_injuries.csv")
     impact_file = Path("data/injury_reports/injury_impact.csv")
@@ -27,7 +26,7 @@ def main():
     
     # Load data
     print(f"\n2. Loading data...")
-    loader.load_all_data()
+    loader = _load_data_loader()
     
     # Check raw injuries
     if loader._injuries is not None and not loader._injuries.empty:
@@ -1,11 +1,26 @@
+import os
 import pandas as pd
 import logging
+from joblib import Memory
 from analysis.matchup_index import MatchupIndexBuilder
 
 logging.basicConfig(level=logging.DEBUG, format='%(levelname)s: %(message)s')
 
+GAMES_CSV = 'data/processed/historical_games.csv'
+
+# Disk cache so repeat debug runs skip recomputing stats for an unchanged CSV
+memory = Memory('.cache/debug', verbose=0)
+
+
+@memory.cache
+def team_season_stats(path: str, mtime: float) -> dict:
+    builder = MatchupIndexBuilder(pd.read_csv(path))
+    builder._compute_team_stats()
+    return builder.team_season_stats
+
+
 # Load historical games
-games_df = pd.read_csv('data/processed/historical_games.csv')
+games_df = pd.read_csv(GAMES_CSV)
 print(f"Total games loaded: {len(games_df)}")
 print(f"\nFirst 5 rows:")
 print(games_df.head())
@@ -13,13 +28,14 @@ print(f"\nColumns: {games_df.columns.tolist()}")
 
 # Build matchup index
 builder = MatchupIndexBuilder(games_df)
+builder.team_season_stats = team_season_stats(GAMES_CSV, os.path.getmtime(GAMES_CSV))
 
 # Get stats for key teams
 teams = ['Boston Celtics', 'Los Angeles Lakers', 'Golden State Warriors', 'Denver Nuggets']
 
 for team in teams:
-    stats = builder._compute_team_stats(team)
+    stats = builder.team_season_stats.get(team, {})
     print(f"\n{team}:")
-    print(f"  PPG: {stats.get('ppg', 'N/A')}")
-    print(f"  PPG Allowed: {stats.get('ppg_allowed', 'N/A')}")
-    print(f"  Position Stats: {stats.get('position_stats', {})}")
+    print(f"  PPG: {stats.get('PPG', 'N/A')}")
+    print(f"  PPG Allowed: {stats.get('PPG_allowed', 'N/A')}")
+    print(f"  Position Stats: {builder.position_stats}")
@@ -6,6 +6,9 @@ import numpy as np
 from typing import Tuple, List, Dict, Any, Optional
 import logging
 import joblib
+import json
+import warnings
+from functools import lru_cache
 from pathlib import Path
 
 LOGGER = logging.getLogger(__name__)
@@ -13,7 +16,6 @@ LOGGER = logging.getLogger(__name__)
 try:
     import xgboost as xgb
     from sklearn.model_selection import cross_val_score, train_test_split
-    from sklearn.preprocessing import StandardScaler
     from sklearn.metrics import roc_auc_score, roc_curve
     XGB_AVAILABLE = True
 except ImportError:
@@ -21,6 +23,23 @@ except ImportError:
     XGB_AVAILABLE = False
 
 
+@lru_cache(maxsize=1)
+def _xgb_device() -> str:
+    """'cuda' if this xgboost build has CUDA support and a GPU is usable, else 'cpu'."""
+    if not xgb.build_info().get("USE_CUDA"):
+        return "cpu"
+    # A CUDA build without a visible GPU silently falls back to CPU; ask the
+    # probe booster which device it actually ended up on
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            probe = xgb.train({"device": "cuda", "tree_method": "hist"},
+                              xgb.DMatrix(np.zeros((2, 1)), label=[0, 1]), num_boost_round=1)
+        return json.loads(probe.save_config())["learner"]["generic_param"]["device"]
+    except (xgb.core.XGBoostError, KeyError):
+        return "cpu"
+
+
 class GamePredictor:
     """XGBoost model for predicting home team win probability."""
     
@@ -55,12 +74,17 @@ class GamePredictor:
         "rest_advantage",
     ]
     
+    # Max feature rows memoized by predict() (a night's slate re-queried from the UI)
+    PREDICT_CACHE_SIZE = 4096
+    
     def __init__(self, model_path: str = "models/trained/game_predictor.pkl"):
         self.model = None
-        self.scaler = None
+        self._booster = None  # Native booster behind self.model, used for inference
+        self.scaler = None  # Only set by models saved before scaling was dropped
         self.feature_importance = {}
         self.model_path = Path(model_path)
         self.best_threshold = 0.5  # Tuned on training data
+        self._prob_cache: Dict[Tuple[Tuple[str, ...], bytes], float] = {}
 
     def train(self, df: pd.DataFrame, test_size: float = 0.2, hyperparams: Optional[Dict] = None) -> Dict[str, float]:
         """
@@ -86,7 +110,7 @@ class GamePredictor:
         if len(df_clean) < 100:
             raise ValueError(f"Insufficient data: {len(df_clean)} rows")
         
-        X = df_clean[required_features]
+        X = df_clean[required_features].astype(np.float32)
         y = df_clean[self.TARGET_COL].astype(int)
         
         LOGGER.info(f"Training on {len(X)} games with {len(required_features)} features")
@@ -96,10 +120,8 @@ class GamePredictor:
             X, y, test_size=test_size, random_state=42, stratify=y
         )
         
-        # Scale features
-        self.scaler = StandardScaler()
-        X_train_scaled = self.scaler.fit_transform(X_train)
-        X_test_scaled = self.scaler.transform(X_test)
+        # No feature scaling: tree splits are invariant to monotonic rescaling
+        self.scaler = None
         
         # Hyperparameters (optimized for accuracy over speed)
         if hyperparams is None:
@@ -115,25 +137,29 @@ class GamePredictor:
                 "reg_alpha": 0.5,
                 "random_state": 42,
                 "eval_metric": "auc",
+                "tree_method": "hist",
+                "device": _xgb_device(),
             }
         
         # Train (XGBoost 3.2.0+ API)
         self.model = xgb.XGBClassifier(**hyperparams)
         self.model.fit(
-            X_train_scaled, y_train,
-            eval_set=[(X_test_scaled, y_test)],
+            X_train, y_train,
+            eval_set=[(X_test, y_test)],
             verbose=False
         )
+        self._booster = self.model.get_booster()
+        self._prob_cache.clear()
         
         # Evaluate
-        train_pred = self.model.predict_proba(X_train_scaled)[:, 1]
-        test_pred = self.model.predict_proba(X_test_scaled)[:, 1]
+        train_pred = self.model.predict_proba(X_train)[:, 1]
+        test_pred = self.model.predict_proba(X_test)[:, 1]
         
         train_auc = roc_auc_score(y_train, train_pred)
         test_auc = roc_auc_score(y_test, test_pred)
         
         # Cross-validation
-        cv_scores = cross_val_score(self.model, X_train_scaled, y_train, cv=5, scoring="roc_auc")
+        cv_scores = cross_val_score(self.model, X_train, y_train, cv=5, scoring="roc_auc")
         
         # Tune probability threshold for F1/precision balance
         fpr, tpr, thresholds = roc_curve(y_test, test_pred)
@@ -173,19 +199,63 @@ class GamePredictor:
             raise ValueError("Model not trained. Call train() first or load()")
         
         required_features = [col for col in self.FEATURE_COLS if col in df.columns]
-        X = df[required_features].fillna(0.5)  # Fill NaN with neutral value
-        X_scaled = self.scaler.transform(X)
+        X = df[required_features].fillna(0.5).to_numpy(dtype=np.float32)  # Fill NaN with neutral value
+        if self.scaler is not None:  # Legacy model trained on scaled features
+            X = self.scaler.transform(X)
+        
+        if self._booster is None:
+            self._booster = self.model.get_booster()
+        
+        # Rows already scored (keyed on feature set + row bytes) come from the cache;
+        # misses go to the native booster in one batch, which returns 1-D home-win
+        # probabilities without the sklearn wrapper's per-call overhead
+        features = tuple(required_features)
+        keys = [(features, row.tobytes()) for row in X]
+        cache = self._prob_cache
+        probs = np.fromiter((cache.get(key, np.nan) for key in keys), dtype=np.float32, count=len(keys))
+        misses = np.flatnonzero(np.isnan(probs))
+        if misses.size:
+            probs[misses] = self._booster.predict(
+                xgb.DMatrix(X[misses], feature_names=self._booster.feature_names))
+            if len(cache) + misses.size > self.PREDICT_CACHE_SIZE:
+                cache.clear()
+            cache.update(zip((keys[i] for i in misses), probs[misses].tolist()))
         
         if return_prob:
-            return self.model.predict_proba(X_scaled)[:, 1]
+            return probs
         else:
-            return (self.model.predict_proba(X_scaled)[:, 1] >= self.best_threshold).astype(int)
+            return (probs >= self.best_threshold).astype(int)
+
+    @property
+    def feature_names(self) -> Optional[List[str]]:
+        """Features the trained model expects, in training order (None if unknown)."""
+        if self._booster is None:
+            if self.model is None:
+                return None
+            self._booster = self.model.get_booster()
+        return self._booster.feature_names
+
+    def predict_raw(self, X: np.ndarray) -> np.ndarray:
+        """
+        Home win probabilities for a dense float32 matrix already in
+        feature_names order, with missing values filled.
+        
+        Skips predict()'s DataFrame handling and memo cache and hands the
+        array to the booster's inplace_predict, so no DMatrix is built.
+        """
+        if self.model is None:
+            raise ValueError("Model not trained. Call train() first or load()")
+        if self.scaler is not None:  # Legacy model trained on scaled features
+            X = self.scaler.transform(X)
+        if self._booster is None:
+            self._booster = self.model.get_booster()
+        return self._booster.inplace_predict(X)
 
     def save(self, path: Optional[str] = None):
         """Save trained model to disk."""
         path = Path(path or self.model_path)
         path.parent.mkdir(parents=True, exist_ok=True)
-        joblib.dump({"model": self.model, "scaler": self.scaler, "threshold": self.best_threshold}, path)
+        joblib.dump({"model": self.model, "threshold": self.best_threshold}, path)
         LOGGER.info(f"Model saved to {path}")
 
     def load(self, path: Optional[str] = None):
@@ -195,7 +265,9 @@ class GamePredictor:
             raise FileNotFoundError(f"Model not found: {path}")
         data = joblib.load(path)
         self.model = data["model"]
-        self.scaler = data["scaler"]
+        self._booster = self.model.get_booster()
+        self._prob_cache.clear()
+        self.scaler = data.get("scaler")
         self.best_threshold = data["threshold"]
         LOGGER.info(f"Model loaded from {path}")
 
@@ -3,13 +3,67 @@ from __future__ import annotations
 
 import pandas as pd
 import numpy as np
-from typing import List, Dict, Any, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 import logging
-from itertools import combinations
+import math
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
 
 LOGGER = logging.getLogger(__name__)
 
 
+def _binomial_table(n: int, k: int) -> np.ndarray:
+    """(n + 1, k + 1) table of C(i, j) for combination unranking."""
+    return np.array([[math.comb(i, j) for j in range(k + 1)] for i in range(n + 1)], dtype=np.int64)
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _unrank(rank, n, k, binom, out):
+        """Write the rank-th k-subset of range(n) (lexicographic order) into out."""
+        start = 0
+        for slot in range(k):
+            i = start
+            while rank >= binom[n - i - 1, k - slot - 1]:
+                rank -= binom[n - i - 1, k - slot - 1]
+                i += 1
+            out[slot] = i
+            start = i + 1
+
+    @njit(parallel=True, cache=True)
+    def _enumerate_parlays(probs, odds, k, min_ev, binom):
+        """
+        Every k-leg parlay over the given legs that clears min_ev, as a (M, k)
+        int32 array of leg positions. Combinations are unranked independently so
+        the scoring pass parallelizes with prange; a second pass materializes the
+        passing ranks (no shared output counter needed).
+        """
+        n = probs.size
+        total = binom[n, k]
+        passed = np.zeros(total, dtype=np.bool_)
+        for r in prange(total):
+            legs = np.empty(k, dtype=np.int64)
+            _unrank(r, n, k, binom, legs)
+            acc_p = 1.0
+            acc_o = 1.0
+            for slot in range(k):
+                acc_p *= probs[legs[slot]]
+                acc_o *= odds[legs[slot]]
+            passed[r] = acc_p * acc_o - 1 >= min_ev
+        ranks = np.flatnonzero(passed)
+        out = np.empty((ranks.size, k), dtype=np.int32)
+        for m in prange(ranks.size):
+            legs = np.empty(k, dtype=np.int64)
+            _unrank(ranks[m], n, k, binom, legs)
+            for slot in range(k):
+                out[m, slot] = legs[slot]
+        return out
+
+
 class ParlayBuilder:
     """Build and rank parlay combinations based on predicted probabilities and odds."""
     
@@ -66,6 +120,181 @@ class ParlayBuilder:
             "kelly_fraction": (actual_prob * parlay_odds - 1) / (parlay_odds - 1) if parlay_odds > 1 else 0
         }
     
+    @staticmethod
+    def _ev_batch(log_probs: np.ndarray, log_odds: np.ndarray, idx: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Vectorized calculate_parlay_ev core over many parlays at once.
+        
+        Works in log space so long parlays neither underflow the joint
+        probability nor lose precision in the product: EV% = prob * odds - 1
+        is expm1(log_prob + log_odds), one transcendental per parlay.
+        
+        Args:
+            log_probs: Per-leg log predicted probabilities
+            log_odds: Per-leg log decimal odds
+            idx: (C, k) leg indices, one parlay per row
+            
+        Returns:
+            {ev_pct, actual_prob_model, implied_prob_market, parlay_odds,
+            kelly_fraction} arrays of length C
+        """
+        log_actual = log_probs[idx].sum(axis=1)
+        log_parlay_odds = log_odds[idx].sum(axis=1)
+        ev_pct = np.expm1(log_actual + log_parlay_odds)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            kelly = np.where(log_parlay_odds > 0, ev_pct / np.expm1(log_parlay_odds), 0.0)
+        return {
+            "ev_pct": ev_pct,
+            "actual_prob_model": np.exp(log_actual),
+            "implied_prob_market": np.exp(-log_parlay_odds),
+            "parlay_odds": np.exp(log_parlay_odds),
+            "kelly_fraction": kelly,
+        }
+    
+    @staticmethod
+    def _ev_info(ev_pct: float, actual: float, market: float, parlay_odds: float,
+                 kelly: float, wager: float = 100) -> Dict[str, float]:
+        """calculate_parlay_ev's result dict from one row of _ev_batch output."""
+        return {
+            "ev_pct": ev_pct,
+            "ev_dollars": wager * (ev_pct + actual),  # = wager * (P * odds - (1 - P))
+            "implied_prob_market": market,
+            "actual_prob_model": actual,
+            "parlay_odds": parlay_odds,
+            "payout": wager * parlay_odds,
+            "kelly_fraction": kelly,
+        }
+    
+    def _candidate_combos(self, log_probs: np.ndarray, log_odds: np.ndarray,
+                          valid_indices: List[int]) -> Dict[int, List[Tuple[int, ...]]]:
+        """
+        Branch-and-bound search for 2..max_legs combinations that can clear min_ev.
+        
+        Works in log space: a parlay clears the threshold when
+        sum(log(prob) + log(odds)) >= log(1 + min_ev). Legs are visited in order of
+        descending gain, so every later leg gains at most as much as the current
+        one; once the optimistic bound for a branch falls short, all remaining
+        siblings do too and the loop breaks.
+        
+        Returns:
+            {num_legs: [leg_combo, ...]} with each combo's indices ascending
+        """
+        gain_all = log_probs + log_odds
+        order = sorted(valid_indices, key=lambda i: gain_all[i], reverse=True)
+        gain = [float(gain_all[i]) for i in order]
+        threshold = np.log1p(self.min_ev) - 1e-12  # slack; exact check happens on scoring
+        max_legs = min(self.max_legs, len(order))
+        found: Dict[int, List[Tuple[int, ...]]] = {}
+        picks: List[int] = []
+        
+        def dfs(start: int, depth: int, acc: float):
+            for j in range(start, len(order)):
+                g = gain[j]
+                legs = depth + 1
+                # Best case below this leg: any still-required legs gain g, optional
+                # ones add max(g, 0) each
+                required = max(0, 2 - legs)
+                optional = max_legs - legs - required
+                if acc + g + required * g + optional * max(g, 0.0) < threshold:
+                    break
+                picks.append(order[j])
+                if legs >= 2 and acc + g >= threshold:
+                    found.setdefault(legs, []).append(tuple(sorted(picks)))
+                if legs < max_legs:
+                    dfs(j + 1, legs, acc + g)
+                picks.pop()
+        
+        dfs(0, 0, 0.0)
+        return found
+    
+    def _candidate_combos_numba(self, probs: np.ndarray, odds: np.ndarray,
+                                valid_indices: List[int]) -> Dict[int, List[Tuple[int, ...]]]:
+        """_candidate_combos via the compiled exhaustive kernel (same result shape)."""
+        valid = np.asarray(valid_indices, dtype=np.int64)
+        max_legs = min(self.max_legs, valid.size)
+        binom = _binomial_table(valid.size, max_legs)
+        found: Dict[int, List[Tuple[int, ...]]] = {}
+        for num_legs in range(2, max_legs + 1):
+            legs = _enumerate_parlays(probs[valid], odds[valid], num_legs, self.min_ev, binom)
+            if len(legs):
+                found[num_legs] = [tuple(row) for row in valid[legs].tolist()]
+        return found
+    
+    def _scored_batches(self, probs: np.ndarray, odds: np.ndarray,
+                        valid_indices: List[int]) -> List[Tuple[np.ndarray, Dict[str, np.ndarray]]]:
+        """
+        Every 2..max_legs combination of valid legs clearing min_ev, one
+        (idx, ev) batch per leg count: idx is the (M, k) int32 leg matrix and
+        ev the matching _ev_batch arrays. Candidates come from the pruned
+        search and are then scored exactly in one vectorized pass.
+        """
+        with np.errstate(divide="ignore"):
+            log_probs = np.log(probs)
+            log_odds = np.log(odds)
+        if NUMBA_AVAILABLE:
+            candidates = self._candidate_combos_numba(probs, odds, valid_indices)
+        else:
+            candidates = self._candidate_combos(log_probs, log_odds, valid_indices)
+        batches = []
+        for num_legs in sorted(candidates):
+            idx = np.array(sorted(candidates[num_legs]), dtype=np.int32)
+            ev = self._ev_batch(log_probs, log_odds, idx)
+            keep = np.flatnonzero(ev["ev_pct"] >= self.min_ev)
+            if keep.size:
+                batches.append((idx[keep], {key: arr[keep] for key, arr in ev.items()}))
+        return batches
+    
+    def _enumerate_and_score(self, probs, odds, names: List[str],
+                             extra: Optional[Dict[str, Callable[[Tuple[int, ...]], Any]]] = None,
+                             top_k: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Shared body of the build_* methods: keep legs with odds >= min_odds,
+        enumerate and score their combinations, and build one recommendation
+        per +EV parlay, sorted by EV (descending).
+        
+        Scores stay in arrays through the sort; dicts are only built for the
+        rows actually returned.
+        
+        Args:
+            probs: Predicted probability per leg
+            odds: Decimal odds per leg
+            names: Description of each leg, joined with " & " per parlay
+            extra: Additional output keys, each computed from the leg combo
+            top_k: Only return the best top_k parlays (all if None)
+            
+        Returns:
+            List of recommended parlays sorted by EV
+        """
+        probs = np.asarray(probs, dtype=np.float64)
+        odds = np.asarray(odds, dtype=np.float64)
+        valid_indices = np.flatnonzero(odds >= self.min_odds).tolist()
+        extra = extra or {}
+        
+        batches = self._scored_batches(probs, odds, valid_indices)
+        if not batches:
+            return []
+        
+        # Flatten all leg counts, then one stable descending sort on EV (ties
+        # keep leg-count, then lexicographic, order)
+        ev = {key: np.concatenate([batch[key] for _, batch in batches]) for key in batches[0][1]}
+        batch_of = np.repeat(np.arange(len(batches)), [len(idx) for idx, _ in batches])
+        row_of = np.concatenate([np.arange(len(idx)) for idx, _ in batches])
+        order = np.argsort(-ev["ev_pct"], kind="stable")[:top_k]
+        
+        recommendations = []
+        for b, r, ev_pct, actual, market, parlay_odds, kelly in zip(
+                batch_of[order].tolist(), row_of[order].tolist(), ev["ev_pct"][order].tolist(),
+                ev["actual_prob_model"][order].tolist(), ev["implied_prob_market"][order].tolist(),
+                ev["parlay_odds"][order].tolist(), ev["kelly_fraction"][order].tolist()):
+            leg_combo = tuple(batches[b][0][r].tolist())
+            recommendations.append({
+                "parlay": " & ".join([names[i] for i in leg_combo]),
+                "legs": len(leg_combo),
+                **{key: build(leg_combo) for key, build in extra.items()},
+                **self._ev_info(ev_pct, actual, market, parlay_odds, kelly)
+            })
+        return recommendations
+    
     def build_game_parlays(self,
                           games: pd.DataFrame,
                           predicted_probs: np.ndarray,
@@ -83,40 +312,15 @@ class ParlayBuilder:
         Returns:
             List of recommended parlays sorted by EV
         """
-        recommendations = []
-        
-        # Filter valid games (odds >= min_odds)
-        valid_indices = [i for i, o in enumerate(odds_decimal) if o >= self.min_odds]
-        
-        if len(valid_indices) < 2:
+        if sum(o >= self.min_odds for o in odds_decimal) < 2:
             LOGGER.warning("Not enough valid games for parlays")
             return []
         
-        # Generate combinations of 2 to max_legs
-        for num_legs in range(2, min(self.max_legs + 1, len(valid_indices) + 1)):
-            for leg_combo in combinations(valid_indices, num_legs):
-                probs = [predicted_probs[i] for i in leg_combo]
-                odds = [odds_decimal[i] for i in leg_combo]
-                
-                ev_info = self.calculate_parlay_ev(probs, odds)
-                
-                # Filter by EV threshold
-                if ev_info["ev_pct"] < self.min_ev:
-                    continue
-                
-                parlay_desc = " & ".join([
-                    f"{team_names[i][0]} ML" for i in leg_combo
-                ])
-                
-                recommendations.append({
-                    "parlay": parlay_desc,
-                    "legs": num_legs,
-                    "games": [leg_combo],
-                    **ev_info
-                })
-        
-        # Sort by EV (descending)
-        recommendations.sort(key=lambda x: x["ev_pct"], reverse=True)
+        recommendations = self._enumerate_and_score(
+            predicted_probs, odds_decimal,
+            [f"{home} ML" for home, _ in team_names],
+            extra={"games": lambda leg_combo: [leg_combo]},
+        )
         
         LOGGER.info(f"Generated {len(recommendations)} +EV parlays")
         return recommendations
@@ -138,31 +342,10 @@ class ParlayBuilder:
         Returns:
             List of recommended prop parlays
         """
-        recommendations = []
-        
-        valid_indices = [i for i, o in enumerate(odds_decimal) if o >= self.min_odds]
-        
-        for num_legs in range(2, min(self.max_legs + 1, len(valid_indices) + 1)):
-            for leg_combo in combinations(valid_indices, num_legs):
-                probs = [predicted_probs[i] for i in leg_combo]
-                odds = [odds_decimal[i] for i in leg_combo]
-                
-                ev_info = self.calculate_parlay_ev(probs, odds)
-                
-                if ev_info["ev_pct"] < self.min_ev:
-                    continue
-                
-                prop_desc = " & ".join([props[i] for i in leg_combo])
-                
-                recommendations.append({
-                    "parlay": prop_desc,
-                    "legs": num_legs,
-                    "players": [players[i] for i in leg_combo],
-                    **ev_info
-                })
-        
-        recommendations.sort(key=lambda x: x["ev_pct"], reverse=True)
-        return recommendations
+        return self._enumerate_and_score(
+            predicted_probs, odds_decimal, props,
+            extra={"players": lambda leg_combo: [players[i] for i in leg_combo]},
+        )
     
     def build_mixed_parlays(self,
                            game_probs: List[float],
@@ -181,31 +364,10 @@ class ParlayBuilder:
         Returns:
             List of recommended mixed parlays
         """
-        recommendations = []
+        all_probs = np.concatenate([np.asarray(game_probs, dtype=np.float64),
+                                    np.asarray(prop_probs, dtype=np.float64)])
+        all_odds = np.concatenate([np.asarray(game_odds, dtype=np.float64),
+                                   np.asarray(prop_odds, dtype=np.float64)])
+        all_names = list(game_names) + list(prop_names)
         
-        all_probs = game_probs + prop_probs
-        all_odds = game_odds + prop_odds
-        all_names = game_names + prop_names
-        
-        valid_indices = [i for i, o in enumerate(all_odds) if o >= self.min_odds]
-        
-        for num_legs in range(2, min(self.max_legs + 1, len(valid_indices) + 1)):
-            for leg_combo in combinations(valid_indices, num_legs):
-                probs = [all_probs[i] for i in leg_combo]
-                odds = [all_odds[i] for i in leg_combo]
-                
-                ev_info = self.calculate_parlay_ev(probs, odds)
-                
-                if ev_info["ev_pct"] < self.min_ev:
-                    continue
-                
-                mixed_desc = " & ".join([all_names[i] for i in leg_combo])
-                
-                recommendations.append({
-                    "parlay": mixed_desc,
-                    "legs": num_legs,
-                    **ev_info
-                })
-        
-        recommendations.sort(key=lambda x: x["ev_pct"], reverse=True)
-        return recommendations[:10]  # Top 10
+        return self._enumerate_and_score(all_probs, all_odds, all_names, top_k=10)  # Top 10
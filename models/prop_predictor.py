@@ -10,7 +10,6 @@ LOGGER = logging.getLogger(__name__)
 
 try:
     import xgboost as xgb
-    from sklearn.preprocessing import StandardScaler
     XGB_AVAILABLE = True
 except ImportError:
     XGB_AVAILABLE = False
@@ -30,8 +29,8 @@ class PlayerPropPredictor:
             raise ValueError(f"Invalid prop_type. Must be one of {self.PROP_TYPES}")
         
         self.prop_type = prop_type
-        self.model = None
-        self.scaler = None
+        self.model = None  # Native xgb.Booster once trained
+        self._trained_features = None  # Column order the booster was fit on
         
         # Example features for points prop
         self.features = [
@@ -71,34 +70,31 @@ class PlayerPropPredictor:
         if merged.empty:
             raise ValueError("No matching data between player stats and prop lines")
         
-        # Calculate rolling stats
+        # Calculate rolling stats (one grouped rolling pass over all players)
         merged = merged.sort_values(["player_id", "game_date"])
-        for player_id in merged["player_id"].unique():
-            player_data = merged[merged["player_id"] == player_id]
-            if self.prop_type == "points":
-                merged.loc[merged["player_id"] == player_id, "points_per_game_last_10"] = (
-                    player_data["points"].rolling(window=10, min_periods=1).mean()
-                )
-            elif self.prop_type == "assists":
-                merged.loc[merged["player_id"] == player_id, "assists_per_game_last_10"] = (
-                    player_data["assists"].rolling(window=10, min_periods=1).mean()
-                )
-            # Similar for rebounds, combined, etc.
+        if self.prop_type == "combined":
+            stat = merged["points"] + merged["assists"] + merged["rebounds"]
+        else:
+            stat = merged[self.prop_type]
+        merged[f"{self.prop_type}_per_game_last_10"] = (
+            stat.groupby(merged["player_id"], sort=False)
+            .rolling(window=10, min_periods=1).mean()
+            .reset_index(level=0, drop=True)
+        )
         
         # Extract features
         X = merged[[f for f in self.features if f in merged.columns]].fillna(0)
         
-        # Create target: 1 if actual > line, 0 if actual <= line
-        if self.prop_type == "points":
-            y = (merged["points"] > merged["prop_line"]).astype(int)
-        elif self.prop_type == "assists":
-            y = (merged["assists"] > merged["prop_line"]).astype(int)
-        elif self.prop_type == "rebounds":
-            y = (merged["rebounds"] > merged["prop_line"]).astype(int)
-        else:
+        # Create target: 1 if actual > line, 0 if actual <= line. Compared on
+        # the raw arrays; the bool result is reinterpreted as int8 (no copy)
+        line = merged["prop_line"].to_numpy()
+        if self.prop_type == "combined":
             # Combined (points + assists + rebounds)
-            combined_actual = merged["points"] + merged["assists"] + merged["rebounds"]
-            y = (combined_actual > merged["prop_line"]).astype(int)
+            actual = (merged["points"].to_numpy() + merged["assists"].to_numpy()
+                      + merged["rebounds"].to_numpy())
+        else:
+            actual = merged[self.prop_type].to_numpy()
+        y = pd.Series((actual > line).view(np.int8), index=merged.index)
         
         return X, y
     
@@ -118,22 +114,28 @@ class PlayerPropPredictor:
         
         LOGGER.info(f"Training {self.prop_type} prop model on {len(X)} samples...")
         
-        # Scale features
-        self.scaler = StandardScaler()
-        X_scaled = self.scaler.fit_transform(X)
+        # Trees are scale-invariant, so features go in unscaled. QuantileDMatrix
+        # bins the data once for hist training instead of via a full DMatrix
+        X_arr = X.to_numpy(dtype=np.float32)
+        y_arr = np.asarray(y, dtype=np.int8)
+        dtrain = xgb.QuantileDMatrix(X_arr, label=y_arr)
         
         # Train
-        self.model = xgb.XGBClassifier(
-            objective="binary:logistic",
-            max_depth=6,
-            learning_rate=0.05,
-            n_estimators=150,
-            random_state=42
+        self.model = xgb.train(
+            {
+                "objective": "binary:logistic",
+                "tree_method": "hist",
+                "max_depth": 6,
+                "eta": 0.05,
+                "seed": 42,
+            },
+            dtrain,
+            num_boost_round=150,
         )
-        self.model.fit(X_scaled, y)
+        self._trained_features = list(X.columns)
         
         # Evaluate
-        train_acc = self.model.score(X_scaled, y)
+        train_acc = float(((self.model.inplace_predict(X_arr) > 0.5) == y_arr).mean())
         LOGGER.info(f"Training accuracy: {train_acc:.4f}")
         
         return {"accuracy": train_acc, "samples": len(X)}
@@ -152,9 +154,28 @@ class PlayerPropPredictor:
         if self.model is None:
             raise ValueError("Model not trained. Call train() first.")
         
-        # Create feature row
-        X = player_stats[[f for f in self.features if f in player_stats.index]].fillna(0).values.reshape(1, -1)
-        X_scaled = self.scaler.transform(X)
+        # Create feature row in training column order (missing/NaN -> 0)
+        X = np.empty(len(self._trained_features), dtype=np.float32)
+        for i, f in enumerate(self._trained_features):
+            value = player_stats.get(f, 0.0)
+            X[i] = 0.0 if pd.isna(value) else value
         
-        prob_over = self.model.predict_proba(X_scaled)[0, 1]
+        prob_over = float(self.model.inplace_predict(X.reshape(1, -1))[0])
         return prob_over
+    
+    def predict_ou_batch(self, player_stats: pd.DataFrame) -> np.ndarray:
+        """
+        Predict Over probabilities for many feature rows at once.
+        
+        Args:
+            player_stats: One feature row per player/prop
+            
+        Returns:
+            Array of Over probabilities (0-1), aligned with player_stats rows
+        """
+        if self.model is None:
+            raise ValueError("Model not trained. Call train() first.")
+        
+        X = player_stats.reindex(columns=self._trained_features).fillna(0).to_numpy(dtype=np.float32)
+        
+        return self.model.inplace_predict(X)
@@ -7,14 +7,69 @@ TeamFactors objects for the tier-based predictor.
 
 import pandas as pd
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import fields
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
 import logging
 
 from models.tier_based_predictor import TeamFactors, Tier
 
 logger = logging.getLogger(__name__)
 
+try:
+    import pyarrow  # noqa: F401
+    CSV_ENGINE = 'pyarrow'
+except ImportError:
+    CSV_ENGINE = 'c'
+
+# Column dtypes for the source CSVs, so the parser doesn't re-infer them.
+# Ratings stay float64: tiers threshold win%/net rating at values like
+# 0.650 that float32 can't represent exactly.
+CSV_SCHEMAS: Dict[str, Dict[str, str]] = {
+    'team_advanced_stats.csv': {
+        'team_name': 'string', 'off_rating': 'float64', 'def_rating': 'float64',
+        'net_rating': 'float64', 'pace': 'float64', 'tov_pct': 'float64',
+        'oreb_pct': 'float64', 'dreb_pct': 'float64', 'win_pct': 'float64',
+        'wins': 'float64', 'losses': 'float64',
+    },
+    'team_shooting_stats.csv': {'team_name': 'string', 'fg3_pct': 'float64'},
+    'team_clutch_stats.csv': {
+        'team_name': 'string', 'clutch_wins': 'float64', 'clutch_losses': 'float64',
+    },
+    'team_last_10_games.csv': {
+        'team_name': 'string', 'last_10_wins': 'float64', 'last_10_losses': 'float64',
+    },
+    'team_last_5_games.csv': {
+        'team_name': 'string', 'last_5_wins': 'float64', 'last_5_losses': 'float64',
+    },
+    'team_momentum.csv': {
+        'team': 'string', 'momentum_score': 'float64', 'recent_point_diff': 'float64',
+    },
+    'current_injuries.csv': {'team': 'string', 'player': 'string', 'status': 'string'},
+    'injury_impact.csv': {
+        'team': 'string', 'severity_score': 'float64', 'key_players_out': 'float64',
+    },
+}
+
+# Injury severity per status when no injury_impact.csv is available.
+# SUPERSTAR WEIGHTS: an "Out" player is assumed to be a star.
+SEVERITY_WEIGHTS = {
+    'Out': 8.0, 'OUT': 8.0,
+    'Out For Season': 12.0, 'Out Indefinitely': 12.0,  # franchise player gone
+    'Doubtful': 4.0,
+    'Questionable': 2.5,
+    'Day-To-Day': 1.5,
+}
+OUT_STATUSES = {'Out', 'OUT', 'Out For Season', 'Out Indefinitely'}
+
+# Fallbacks for advanced-stats columns missing from a team's row
+ADV_DEFAULTS = {
+    'off_rating': 110.0, 'def_rating': 110.0, 'net_rating': 0.0, 'pace': 100.0,
+    'tov_pct': 14.0, 'oreb_pct': 50.0, 'dreb_pct': 50.0, 'win_pct': 0.500,
+    'wins': 20, 'losses': 20,
+}
+
 
 class TeamDataLoader:
     """Load and aggregate team data from multiple sources"""
@@ -33,66 +88,97 @@ class TeamDataLoader:
         self._injuries = None
         self._injury_impact = None
         self._schedule = None
-    
-    def load_all_data(self):
-        """Load all CSV files into memory"""
-        logger.info("Loading team data from CSV files...")
         
-        try:
-            self._advanced_stats = pd.read_csv(self.data_dir / 'team_advanced_stats.csv')
-            logger.info(f"✓ Loaded advanced stats for {len(self._advanced_stats)} teams")
-        except Exception as e:
-            logger.warning(f"Could not load advanced stats: {e}")
-            self._advanced_stats = pd.DataFrame()
-        
-        try:
-            self._shooting_stats = pd.read_csv(self.data_dir / 'team_shooting_stats.csv')
-            logger.info(f"✓ Loaded shooting stats for {len(self._shooting_stats)} teams")
-        except Exception as e:
-            logger.warning(f"Could not load shooting stats: {e}")
-            self._shooting_stats = pd.DataFrame()
+        # Playoff rank by win% and every team's factors (one row per team),
+        # built once by load_all_data. The rows are also kept as plain tuples
+        # in TeamFactors field order so lookups never touch pandas.
+        self._playoff_rank: Dict[str, int] = {}
+        self._all_factors = pd.DataFrame()
+        self._factor_rows: list = []
+        self._team_to_row: Dict[str, int] = {}
         
-        try:
-            self._clutch_stats = pd.read_csv(self.data_dir / 'team_clutch_stats.csv')
-            logger.info(f"✓ Loaded clutch stats for {len(self._clutch_stats)} teams")
-        except Exception as e:
-            logger.warning(f"Could not load clutch stats: {e}")
-            self._clutch_stats = pd.DataFrame()
-        
-        try:
-            self._last_10 = pd.read_csv(self.data_dir / 'team_last_10_games.csv')
-            logger.info(f"✓ Loaded last 10 games for {len(self._last_10)} teams")
-        except Exception as e:
-            logger.warning(f"Could not load last 10 games: {e}")
-            self._last_10 = pd.DataFrame()
+        # Built TeamFactors per (team, is_home); reset by load_all_data
+        self._factors_cache: Dict[Tuple[str, bool], TeamFactors] = {}
+    
+    @staticmethod
+    def _index_by(df: pd.DataFrame, key: str) -> pd.DataFrame:
+        """First row per team, indexed by team name (empty if key is missing)"""
+        if df.empty or key not in df.columns:
+            return pd.DataFrame(index=pd.Index([], name='team_name'))
+        return df.drop_duplicates(key).set_index(key).rename_axis('team_name')
+    
+    @staticmethod
+    def _aligned(frame: pd.DataFrame, teams: pd.Index,
+                 defaults: Dict[str, float]) -> Tuple[np.ndarray, pd.DataFrame]:
+        """
+        Align one per-team source on `teams`.
         
+        Returns:
+            (mask of teams that have a row, frame of the `defaults` columns where
+            a column absent from the source is filled with its default)
+        """
+        has = teams.isin(frame.index)
+        frame = frame.reindex(teams)
+        cols = {c: frame[c] if c in frame.columns else default for c, default in defaults.items()}
+        return has, pd.DataFrame(cols, index=teams)
+    
+    @staticmethod
+    def _records(has: np.ndarray, wins, losses, default: Tuple[int, int]) -> list:
+        """(wins, losses) tuples per team, `default` where the team has no row"""
+        wins = np.trunc(np.asarray(wins, dtype=np.float64)).tolist()
+        losses = np.trunc(np.asarray(losses, dtype=np.float64)).tolist()
+        return [(int(w), int(l)) if h else default for h, w, l in zip(has.tolist(), wins, losses)]
+    
+    def _read_source(self, path: Path, name: str, loaded: str) -> pd.DataFrame:
+        """Read one source CSV with its schema, or an empty frame if unavailable"""
         try:
-            self._last_5 = pd.read_csv(self.data_dir / 'team_last_5_games.csv')
-            logger.info(f"✓ Loaded last 5 games for {len(self._last_5)} teams")
+            df = pd.read_csv(path, engine=CSV_ENGINE, dtype=CSV_SCHEMAS.get(path.name))
+            logger.info(f"✓ Loaded {loaded.format(n=len(df))}")
+            return df
         except Exception as e:
-            logger.warning(f"Could not load last 5 games: {e}")
-            self._last_5 = pd.DataFrame()
+            logger.warning(f"Could not load {name}: {e}")
+            return pd.DataFrame()
+    
+    def load_all_data(self):
+        """Load all CSV files into memory"""
+        logger.info("Loading team data from CSV files...")
         
-        try:
-            self._momentum = pd.read_csv(self.data_dir / 'team_momentum.csv')
-            logger.info(f"✓ Loaded momentum for {len(self._momentum)} teams")
-        except Exception as e:
-            logger.warning(f"Could not load momentum: {e}")
-            self._momentum = pd.DataFrame()
+        # (attribute, path, name for warnings, success message)
+        sources = [
+            ('_advanced_stats', self.data_dir / 'team_advanced_stats.csv',
+             "advanced stats", "advanced stats for {n} teams"),
+            ('_shooting_stats', self.data_dir / 'team_shooting_stats.csv',
+             "shooting stats", "shooting stats for {n} teams"),
+            ('_clutch_stats', self.data_dir / 'team_clutch_stats.csv',
+             "clutch stats", "clutch stats for {n} teams"),
+            ('_last_10', self.data_dir / 'team_last_10_games.csv',
+             "last 10 games", "last 10 games for {n} teams"),
+            ('_last_5', self.data_dir / 'team_last_5_games.csv',
+             "last 5 games", "last 5 games for {n} teams"),
+            ('_momentum', self.data_dir / 'team_momentum.csv',
+             "momentum", "momentum for {n} teams"),
+            ('_injuries', self.injury_dir / 'current_injuries.csv',
+             "injuries", "{n} injuries"),
+            ('_injury_impact', self.injury_dir / 'injury_impact.csv',
+             "injury impact", "injury impact for {n} teams"),
+        ]
+        # Arrow's parser releases the GIL, so the files read concurrently
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            frames = pool.map(lambda src: self._read_source(*src[1:]), sources)
+            for (attr, *_), df in zip(sources, frames):
+                setattr(self, attr, df)
         
-        try:
-            self._injuries = pd.read_csv(self.injury_dir / 'current_injuries.csv')
-            logger.info(f"✓ Loaded {len(self._injuries)} injuries")
-        except Exception as e:
-            logger.warning(f"Could not load injuries: {e}")
-            self._injuries = pd.DataFrame()
+        # Playoff position = rank by win% (1 = best record)
+        self._playoff_rank = {}
+        if {'team_name', 'win_pct'} <= set(self._advanced_stats.columns):
+            ranked = self._advanced_stats.sort_values('win_pct', ascending=False).reset_index()['team_name']
+            for rank, name in enumerate(ranked, start=1):
+                self._playoff_rank.setdefault(name, rank)
         
-        try:
-            self._injury_impact = pd.read_csv(self.injury_dir / 'injury_impact.csv')
-            logger.info(f"✓ Loaded injury impact for {len(self._injury_impact)} teams")
-        except Exception as e:
-            logger.warning(f"Could not load injury impact: {e}")
-            self._injury_impact = pd.DataFrame()
+        self._factors_cache = {}
+        self._all_factors = self.build_all_factors()
+        self._factor_rows = list(self._all_factors.itertuples(index=False, name=None))
+        self._team_to_row = {name: i for i, name in enumerate(self._all_factors.index)}
     
     def _determine_tier(self, win_pct: float, net_rating: float) -> Tier:
         """Determine team tier based on win% and net rating"""
@@ -112,6 +198,16 @@ class TeamDataLoader:
         else:
             return Tier.D
     
+    @staticmethod
+    def _determine_tiers_vectorized(win_pct: np.ndarray, net_rating: np.ndarray) -> np.ndarray:
+        """_determine_tier over whole arrays; returns Tier values as int8"""
+        tier = np.full(win_pct.shape, Tier.D.value, dtype=np.int8)
+        tier = np.where(win_pct >= 0.350, Tier.C.value, tier)
+        tier = np.where((win_pct >= 0.450) & (net_rating >= -2.0), Tier.B.value, tier)
+        tier = np.where((win_pct >= 0.550) & (net_rating >= 2.0), Tier.A.value, tier)
+        tier = np.where((win_pct >= 0.650) & (net_rating >= 6.0), Tier.S.value, tier)
+        return tier.astype(np.int8)
+    
     def get_team_factors(self, team_name: str, is_home: bool = True, 
                         opponent: Optional[str] = None) -> TeamFactors:
         """
@@ -123,158 +219,158 @@ class TeamDataLoader:
             opponent: Opponent team name (for matchup-specific factors)
             
         Returns:
-            TeamFactors object with all available data
+            TeamFactors object with all available data. It is cached and shared
+            between calls until the next load_all_data, so treat it as read-only.
         """
         if self._advanced_stats is None:
             self.load_all_data()
         
-        factors = TeamFactors()
+        # opponent doesn't affect the factors yet, so it isn't part of the key
+        key = (team_name, is_home)
+        factors = self._factors_cache.get(key)
+        if factors is None:
+            factors = self._factors_cache[key] = self._build_factors(team_name, is_home)
+        return factors
+    
+    def get_all_team_factors(self, matchups: List[Tuple[str, str]]) -> Dict[str, TeamFactors]:
+        """
+        Build TeamFactors for every team in a slate of games
         
-        # Advanced stats
-        if not self._advanced_stats.empty:
-            team_adv = self._advanced_stats[self._advanced_stats['team_name'] == team_name]
-            if not team_adv.empty:
-                row = team_adv.iloc[0]
-                factors.offensive_rating = float(row.get('off_rating', 110.0))
-                factors.defensive_rating = float(row.get('def_rating', 110.0))
-                factors.net_rating = float(row.get('net_rating', 0.0))
-                factors.pace = float(row.get('pace', 100.0))
-                factors.turnover_rate = float(row.get('tov_pct', 14.0))
-                factors.rebound_rate = float(row.get('oreb_pct', 50.0) + row.get('dreb_pct', 50.0)) / 2
-                
-                # Determine tier
-                win_pct = float(row.get('win_pct', 0.500))
-                factors.overall_tier = self._determine_tier(win_pct, factors.net_rating)
+        Once data is loaded, get_team_factors only reads plain dicts/tuples,
+        so the teams are looked up concurrently.
         
-        # Shooting stats
-        if not self._shooting_stats.empty:
-            team_shoot = self._shooting_stats[self._shooting_stats['team_name'] == team_name]
-            if not team_shoot.empty:
-                row = team_shoot.iloc[0]
-                factors.three_point_pct = float(row.get('fg3_pct', 0.35))
-                # Estimate defense from opponent scoring
-                factors.three_point_defense = 0.36  # League average default
+        Args:
+            matchups: List of (home_team, away_team) tuples
+            
+        Returns:
+            Dict of team name -> TeamFactors
+        """
+        if self._advanced_stats is None:
+            self.load_all_data()
         
-        # Last 10 games
-        if not self._last_10.empty:
-            team_l10 = self._last_10[self._last_10['team_name'] == team_name]
-            if not team_l10.empty:
-                row = team_l10.iloc[0]
-                wins = int(row.get('last_10_wins', 5))
-                losses = int(row.get('last_10_losses', 5))
-                factors.last_10_record = (wins, losses)
+        # team -> is_home (a team's first appearance wins)
+        teams: Dict[str, bool] = {}
+        for home, away in matchups:
+            teams.setdefault(home, True)
+            teams.setdefault(away, False)
+        if not teams:
+            return {}
         
-        # Last 5 games
-        if not self._last_5.empty:
-            team_l5 = self._last_5[self._last_5['team_name'] == team_name]
-            if not team_l5.empty:
-                row = team_l5.iloc[0]
-                wins = int(row.get('last_5_wins', 2))
-                losses = int(row.get('last_5_losses', 3))
-                factors.last_5_record = (wins, losses)
+        with ThreadPoolExecutor(max_workers=min(8, len(teams))) as pool:
+            factors = pool.map(lambda item: self.get_team_factors(*item), teams.items())
+            return dict(zip(teams, factors))
+    
+    def _build_factors(self, team_name: str, is_home: bool) -> TeamFactors:
+        """TeamFactors for one team from the precomputed factor table"""
+        i = self._team_to_row.get(team_name)
+        return TeamFactors.from_row(self._factor_rows[i]) if i is not None else TeamFactors()
+    
+    def build_all_factors(self) -> pd.DataFrame:
+        """
+        Compute TeamFactors fields for every team in the loaded data at once.
         
-        # Momentum
-        if not self._momentum.empty:
-            team_mom = self._momentum[self._momentum['team'] == team_name]
-            if not team_mom.empty:
-                row = team_mom.iloc[0]
-                factors.momentum_score = float(row.get('momentum_score', 0.0))
-                factors.recent_point_diff = float(row.get('recent_point_diff', 0.0))
+        Each source table is aligned on team name and every factor is derived
+        column-wise. Teams missing from a source keep the TeamFactors defaults
+        for that source's fields.
+        
+        Returns:
+            DataFrame indexed by team name, one column per TeamFactors field
+        """
+        if self._advanced_stats is None:
+            self.load_all_data()
+            return self._all_factors
+        
+        adv = self._index_by(self._advanced_stats, 'team_name')
+        shooting = self._index_by(self._shooting_stats, 'team_name')
+        clutch = self._index_by(self._clutch_stats, 'team_name')
+        last_10 = self._index_by(self._last_10, 'team_name')
+        last_5 = self._index_by(self._last_5, 'team_name')
+        momentum = self._index_by(self._momentum, 'team')
         
         # Injuries - FIXED to properly account for all injury statuses
         # SUPERSTAR IMPACT: Losing a star should be DEVASTATING
-        if not self._injury_impact.empty:
-            team_inj = self._injury_impact[self._injury_impact['team'] == team_name]
-            if not team_inj.empty:
-                row = team_inj.iloc[0]
-                # Get actual counts from injury impact
-                factors.key_players_out = int(row.get('key_players_out', 0))
-                factors.injury_severity_score = float(row.get('severity_score', 0.0))
-                # Calculate minutes lost based on severity (0-80% max for catastrophic injuries)
-                factors.minutes_lost_pct = min(factors.injury_severity_score / 25, 0.80)
+        if not self._injury_impact.empty or self._injuries.empty:
+            injuries = self._index_by(self._injury_impact, 'team')
         else:
-            # If no injury impact data, check raw injuries
-            if not self._injuries.empty:
-                team_injuries = self._injuries[self._injuries['team'] == team_name]
-                if not team_injuries.empty:
-                    # Count Out/Out For Season as key players
-                    out_statuses = ['Out', 'OUT', 'Out For Season', 'Out Indefinitely']
-                    factors.key_players_out = len(team_injuries[team_injuries['status'].isin(out_statuses)])
-                    
-                    # Calculate severity manually - MUCH HIGHER WEIGHTS
-                    # Assume any "Out" player is important (we don't have usage data)
-                    severity = 0
-                    for _, inj in team_injuries.iterrows():
-                        status = inj.get('status', '')
-                        # SUPERSTAR WEIGHTS (assume Out = important player)
-                        if status in ['Out', 'OUT']:
-                            severity += 8.0  # Was 3.0 - assume star player
-                        elif status in ['Out For Season', 'Out Indefinitely']:
-                            severity += 12.0  # Was 5.0 - franchise player gone
-                        elif status in ['Doubtful']:
-                            severity += 4.0  # Was 2.0
-                        elif status in ['Questionable']:
-                            severity += 2.5  # Was 1.5
-                        elif status in ['Day-To-Day']:
-                            severity += 1.5  # Was 1.0
-                    
-                    factors.injury_severity_score = severity
-                    factors.minutes_lost_pct = min(severity / 25, 0.80)
+            # No injury impact data: score raw injuries per team. Any "Out"
+            # player is assumed important (we don't have usage data)
+            status = self._injuries['status']
+            injuries = pd.DataFrame({
+                'key_players_out': status.isin(OUT_STATUSES).astype(int),
+                'severity_score': status.map(SEVERITY_WEIGHTS).fillna(0.0).astype(float),
+            }).groupby(self._injuries['team'].to_numpy()).sum()
         
-        # Clutch stats
-        if not self._clutch_stats.empty:
-            team_clutch = self._clutch_stats[self._clutch_stats['team_name'] == team_name]
-            if not team_clutch.empty:
-                row = team_clutch.iloc[0]
-                wins = int(row.get('clutch_wins', 10))
-                losses = int(row.get('clutch_losses', 10))
-                factors.clutch_record = (wins, losses)
+        sources = [adv, shooting, clutch, last_10, last_5, momentum, injuries]
+        teams = pd.Index(sorted(set().union(*(src.index for src in sources))), name='team_name')
+        d = TeamFactors()
+        out = pd.DataFrame(index=teams)
         
-        # Home/Away records (estimate from overall record)
-        if not self._advanced_stats.empty:
-            team_adv = self._advanced_stats[self._advanced_stats['team_name'] == team_name]
-            if not team_adv.empty:
-                row = team_adv.iloc[0]
-                total_wins = int(row.get('wins', 20))
-                total_losses = int(row.get('losses', 20))
-                
-                # Estimate home/away split (home teams typically win ~60% of their home games)
-                home_wins = int(total_wins * 0.6)
-                home_losses = int(total_losses * 0.4)
-                away_wins = total_wins - home_wins
-                away_losses = total_losses - home_losses
-                
-                factors.home_record = (home_wins, home_losses)
-                factors.away_record = (away_wins, away_losses)
-                
-                # Point differentials
-                factors.home_point_diff = factors.net_rating * 1.2  # Home boost
-                factors.away_point_diff = factors.net_rating * 0.8  # Away penalty
+        # Advanced stats
+        has, row = self._aligned(adv, teams, ADV_DEFAULTS)
+        net_rating = row['net_rating'].to_numpy(dtype=np.float64)
+        out['offensive_rating'] = np.where(has, row['off_rating'], d.offensive_rating)
+        out['defensive_rating'] = np.where(has, row['def_rating'], d.defensive_rating)
+        out['net_rating'] = np.where(has, net_rating, d.net_rating)
+        out['pace'] = np.where(has, row['pace'], d.pace)
+        out['turnover_rate'] = np.where(has, row['tov_pct'], d.turnover_rate)
+        out['rebound_rate'] = np.where(has, (row['oreb_pct'] + row['dreb_pct']) / 2, d.rebound_rate)
+        tiers = self._determine_tiers_vectorized(row['win_pct'].to_numpy(dtype=np.float64), net_rating)
+        out['overall_tier'] = [Tier(t) if h else d.overall_tier for h, t in zip(has.tolist(), tiers.tolist())]
         
-        # Schedule factors (defaults - would need game-specific data)
-        factors.days_rest = 1
-        factors.back_to_back = False
-        factors.games_in_last_7 = 3
-        factors.travel_distance = 0.0
+        # Home/Away records (estimate from overall record): home teams
+        # typically win ~60% of their home games
+        total_wins = np.trunc(row['wins'].to_numpy(dtype=np.float64))
+        total_losses = np.trunc(row['losses'].to_numpy(dtype=np.float64))
+        home_wins = np.trunc(total_wins * 0.6)
+        home_losses = np.trunc(total_losses * 0.4)
+        out['home_record'] = self._records(has, home_wins, home_losses, d.home_record)
+        out['away_record'] = self._records(has, total_wins - home_wins, total_losses - home_losses,
+                                           d.away_record)
+        out['home_point_diff'] = np.where(has, net_rating * 1.2, d.home_point_diff)  # Home boost
+        out['away_point_diff'] = np.where(has, net_rating * 0.8, d.away_point_diff)  # Away penalty
         
-        # Coaching (defaults - would need manual data)
-        factors.coach_win_pct = 0.500
+        # Shooting stats (three-point defense: league average default)
+        has, row = self._aligned(shooting, teams, {'fg3_pct': 0.35})
+        out['three_point_pct'] = np.where(has, row['fg3_pct'], d.three_point_pct)
+        out['three_point_defense'] = np.where(has, 0.36, d.three_point_defense)
         
-        # ATS (defaults - would need scraping)
-        factors.ats_record = (40, 40)
+        # Last 10 / last 5 games
+        has, row = self._aligned(last_10, teams, {'last_10_wins': 5, 'last_10_losses': 5})
+        out['last_10_record'] = self._records(has, row['last_10_wins'], row['last_10_losses'],
+                                              d.last_10_record)
+        has, row = self._aligned(last_5, teams, {'last_5_wins': 2, 'last_5_losses': 3})
+        out['last_5_record'] = self._records(has, row['last_5_wins'], row['last_5_losses'],
+                                             d.last_5_record)
         
-        # Situational (estimate from standings)
-        if not self._advanced_stats.empty:
-            team_adv = self._advanced_stats[self._advanced_stats['team_name'] == team_name]
-            if not team_adv.empty:
-                # Estimate playoff position from win%
-                all_teams = self._advanced_stats.sort_values('win_pct', ascending=False)
-                position = all_teams[all_teams['team_name'] == team_name].index[0] + 1
-                factors.playoff_position = int(position)
+        # Momentum
+        has, row = self._aligned(momentum, teams, {'momentum_score': 0.0, 'recent_point_diff': 0.0})
+        out['momentum_score'] = np.where(has, row['momentum_score'], d.momentum_score)
+        out['recent_point_diff'] = np.where(has, row['recent_point_diff'], d.recent_point_diff)
         
-        factors.motivation_factor = 0.0  # Neutral default
+        # Injuries: minutes lost scales with severity (0-80% max for catastrophic injuries)
+        has, row = self._aligned(injuries, teams, {'key_players_out': 0, 'severity_score': 0.0})
+        severity = row['severity_score'].to_numpy(dtype=np.float64)
+        out['key_players_out'] = np.where(has, np.trunc(row['key_players_out'].to_numpy(dtype=np.float64)),
+                                          d.key_players_out).astype(np.int64)
+        out['injury_severity_score'] = np.where(has, severity, d.injury_severity_score)
+        out['minutes_lost_pct'] = np.where(has, np.minimum(severity / 25, 0.80), d.minutes_lost_pct)
         
-        return factors
+        # Clutch stats
+        has, row = self._aligned(clutch, teams, {'clutch_wins': 10, 'clutch_losses': 10})
+        out['clutch_record'] = self._records(has, row['clutch_wins'], row['clutch_losses'],
+                                             d.clutch_record)
+        
+        # Situational (estimate playoff position from win%)
+        out['playoff_position'] = teams.map(self._playoff_rank).fillna(d.playoff_position).astype(np.int64)
+        
+        # Schedule, coaching, ATS and motivation have no data source yet and
+        # keep their TeamFactors defaults
+        field_names = [f.name for f in fields(TeamFactors) if f.init]
+        for name in field_names:
+            if name not in out.columns:
+                out[name] = [getattr(d, name)] * len(teams)
+        
+        return out[field_names]
     
     def get_available_teams(self) -> list:
         """Get list of teams with available data"""
@@ -13,11 +13,19 @@ This model uses a weighted tier system across multiple categories:
 from __future__ import annotations
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass
+from typing import Dict, List, NamedTuple, Optional, Tuple
+from dataclasses import dataclass, field
+from functools import lru_cache
 from enum import Enum
+from numpy.lib.recfunctions import structured_to_unstructured
 import logging
 
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
@@ -30,9 +38,9 @@ class Tier(Enum):
     D = 1  # Tanking/rebuilding
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TeamFactors:
-    """All factors for a single team"""
+    """All factors for a single team (immutable and hashable, so predictions can be memoized)"""
     # TIER 1: Core Team Quality (Weight: 30%)
     overall_tier: Tier = Tier.C
     offensive_rating: float = 110.0  # Points per 100 possessions
@@ -79,25 +87,80 @@ class TeamFactors:
     games_remaining: int = 82
     motivation_factor: float = 0.0  # -5 to +5 (rivalry, revenge, etc.)
     
+    @classmethod
+    def from_row(cls, row) -> TeamFactors:
+        """Build from one row of a factor table with columns in field order (e.g. TeamDataLoader.build_all_factors().loc[team])"""
+        return cls(*row)
+    
+    @staticmethod
+    def _record_wp(record: Tuple[int, int], games: Optional[int] = None) -> float:
+        """Wins over `games` (default: games played); 0.5 for an empty record"""
+        played = record[0] + record[1]
+        return record[0] / (games or played) if played > 0 else 0.5
+    
+    # Derived once per instance in __post_init__ and reused by to_dict and
+    # the predictor's calculate_* methods (slots leave no __dict__ for
+    # cached_property). Excluded from __init__, eq and hash.
+    overall_tier_id: int = field(init=False, repr=False, compare=False)  # Tier value (1-5)
+    last_10_wp: float = field(init=False, repr=False, compare=False)
+    last_5_wp: float = field(init=False, repr=False, compare=False)
+    home_wp: float = field(init=False, repr=False, compare=False)
+    away_wp: float = field(init=False, repr=False, compare=False)
+    clutch_wp: float = field(init=False, repr=False, compare=False)
+    ats_wp: float = field(init=False, repr=False, compare=False)
+    # Normalized (0-1) forms of the raw factors the calculate_* methods score
+    tier_score: float = field(init=False, repr=False, compare=False)
+    net_rating_normalized: float = field(init=False, repr=False, compare=False)
+    momentum_normalized: float = field(init=False, repr=False, compare=False)
+    recent_pt_diff_normalized: float = field(init=False, repr=False, compare=False)
+    seed_score: float = field(init=False, repr=False, compare=False)
+    motivation_normalized: float = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        tier_id = self.overall_tier.value
+        derived = {
+            'overall_tier_id': tier_id,
+            'last_10_wp': self._record_wp(self.last_10_record, 10),
+            'last_5_wp': self._record_wp(self.last_5_record, 5),
+            'home_wp': self._record_wp(self.home_record),
+            'away_wp': self._record_wp(self.away_record),
+            'clutch_wp': self._record_wp(self.clutch_record),
+            'ats_wp': self._record_wp(self.ats_record),
+            'tier_score': tier_id / 5.0,
+            # NBA net ratings typically range from -10 to +10
+            'net_rating_normalized': max(0, min(1, (self.net_rating + 10) / 20)),
+            # -10 to +10 → 0 to 1
+            'momentum_normalized': (self.momentum_score + 10) / 20,
+            # -15 to +15 → 0 to 1
+            'recent_pt_diff_normalized': max(0, min(1, (self.recent_point_diff + 15) / 30)),
+            # Playoff position (1-15, where 1 is best)
+            'seed_score': 1 - (self.playoff_position - 1) / 14,
+            # -5 to +5 → 0 to 1
+            'motivation_normalized': (self.motivation_factor + 5) / 10,
+        }
+        for name, value in derived.items():
+            object.__setattr__(self, name, value)
+    
     def to_dict(self) -> Dict:
         """Convert to dictionary for feature engineering"""
         return {
-            'tier_value': self.overall_tier.value,
+            'tier_value': self.overall_tier_id,
             'off_rating': self.offensive_rating,
             'def_rating': self.defensive_rating,
             'net_rating': self.net_rating,
-            'last_10_wp': self.last_10_record[0] / 10 if sum(self.last_10_record) > 0 else 0.5,
-            'last_5_wp': self.last_5_record[0] / 5 if sum(self.last_5_record) > 0 else 0.5,
+            'last_10_wp': self.last_10_wp,
+            'last_5_wp': self.last_5_wp,
             'momentum': self.momentum_score,
             'recent_pt_diff': self.recent_point_diff,
+            'key_players_out': self.key_players_out,
             'injury_impact': self.injury_severity_score,
             'minutes_lost': self.minutes_lost_pct,
             'days_rest': self.days_rest,
             'b2b': 1 if self.back_to_back else 0,
             'games_last_7': self.games_in_last_7,
             'travel_miles': self.travel_distance,
-            'home_wp': self.home_record[0] / sum(self.home_record) if sum(self.home_record) > 0 else 0.5,
-            'away_wp': self.away_record[0] / sum(self.away_record) if sum(self.away_record) > 0 else 0.5,
+            'home_wp': self.home_wp,
+            'away_wp': self.away_wp,
             'home_pt_diff': self.home_point_diff,
             'away_pt_diff': self.away_point_diff,
             'pace': self.pace,
@@ -106,13 +169,118 @@ class TeamFactors:
             'tov_rate': self.turnover_rate,
             'reb_rate': self.rebound_rate,
             'coach_wp': self.coach_win_pct,
-            'clutch_wp': self.clutch_record[0] / sum(self.clutch_record) if sum(self.clutch_record) > 0 else 0.5,
-            'ats_wp': self.ats_record[0] / sum(self.ats_record) if sum(self.ats_record) > 0 else 0.5,
+            'clutch_wp': self.clutch_wp,
+            'ats_wp': self.ats_wp,
             'seed': self.playoff_position,
             'motivation': self.motivation_factor,
         }
 
 
+class Prediction(NamedTuple):
+    """TierBasedPredictor.predict_game result (breakdown only when requested)"""
+    home_win_probability: float
+    away_win_probability: float
+    confidence: float
+    home_advantage: float
+    breakdown: Optional[Dict] = None
+
+
+# Column order of factors_to_array() batches (TeamFactors.to_dict() keys) and
+# the positions the compiled kernel reads
+FACTOR_FIELDS = tuple(TeamFactors().to_dict())
+(_TIER, _NET, _L10, _L5, _MOM, _PTD, _KPO, _SEV, _MIN, _REST, _G7, _TRAVEL,
+ _HWP, _AWP, _HPD, _APD, _PACE, _3PT, _3DEF, _TOV, _REB, _COACH, _CLUTCH, _ATS,
+ _SEED, _MOTIV) = (FACTOR_FIELDS.index(name) for name in (
+    'tier_value', 'net_rating', 'last_10_wp', 'last_5_wp', 'momentum', 'recent_pt_diff',
+    'key_players_out', 'injury_impact', 'minutes_lost', 'days_rest', 'games_last_7',
+    'travel_miles', 'home_wp', 'away_wp', 'home_pt_diff', 'away_pt_diff', 'pace',
+    'three_pct', 'three_def', 'tov_rate', 'reb_rate', 'coach_wp', 'clutch_wp', 'ats_wp',
+    'seed', 'motivation'))
+
+# Rest/schedule scores indexed by days rest / games in last 7; values past the
+# end use the last entry (and negative rest counts as "too much rest")
+_REST_LUT = np.array([0.3, 0.7, 1.0, 0.95, 0.85, 0.85, 0.85, 0.85])
+_SCHED_LUT = np.array([1.0, 1.0, 1.0, 0.95, 0.8, 0.6, 0.6, 0.6, 0.6])
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, fastmath=True)
+    def _team_scores(f, is_home, out):
+        """The seven per-team category scores of one factor row, in _cat_order."""
+        net_rating_normalized = min(max((f[_NET] + 10) / 20, 0.0), 1.0)
+        out[0] = 0.4 * (f[_TIER] / 5.0) + 0.6 * net_rating_normalized
+        
+        form_wp = 0.4 * f[_L10] + 0.6 * f[_L5]
+        pt_diff_normalized = min(max((f[_PTD] + 15) / 30, 0.0), 1.0)
+        out[1] = 0.5 * form_wp + 0.3 * ((f[_MOM] + 10) / 20) + 0.2 * pt_diff_normalized
+        
+        penalty = max(min(f[_KPO] * 0.30, 0.90), min(f[_SEV] / 30, 0.90), f[_MIN] * 0.8)
+        out[2] = max(0.1, 1 - penalty)
+        
+        rest = int(f[_REST])
+        rest_score = _REST_LUT[rest if 0 <= rest < _REST_LUT.size else _REST_LUT.size - 1]
+        schedule_score = _SCHED_LUT[min(max(int(f[_G7]), 0), _SCHED_LUT.size - 1)]
+        travel_score = 1 - min(f[_TRAVEL] / 3000, 0.2)
+        out[3] = 0.5 * rest_score + 0.3 * schedule_score + 0.2 * travel_score
+        
+        if is_home:
+            wp, pt_diff = f[_HWP], f[_HPD]
+        else:
+            wp, pt_diff = f[_AWP], f[_APD]
+        out[4] = 0.7 * wp + 0.3 * min(max((pt_diff + 10) / 20, 0.0), 1.0)
+        
+        out[5] = 0.4 * f[_COACH] + 0.4 * f[_CLUTCH] + 0.2 * f[_ATS]
+        out[6] = 0.6 * (1 - (f[_SEED] - 1) / 14) + 0.4 * ((f[_MOTIV] + 5) / 10)
+    
+    @njit(cache=True, fastmath=True)
+    def _matchup_kernel(pace_h, pace_a, three_h, three_a, def_h, def_a, tov_h, tov_a, reb_h, reb_a):
+        """calculate_matchup_score on raw floats (home, away pairs)."""
+        pace_score = 0.5 + ((pace_h - pace_a) / 20) * 0.1
+        shooting_score = 0.5 + ((three_h - def_a) - (three_a - def_h)) * 2
+        tov_score = 0.5 + ((tov_a - tov_h) / 10) * 0.2
+        reb_score = 0.5 + ((reb_h - reb_a) / 10) * 0.2
+        matchup = 0.2 * pace_score + 0.4 * shooting_score + 0.2 * tov_score + 0.2 * reb_score
+        return min(max(matchup, 0.0), 1.0)
+    
+    @njit(cache=True, fastmath=True)
+    def _home_advantage_kernel(h, a, w, w_matchup, home_court):
+        """predict_game's home advantage for one (home row, away row) pair."""
+        home_scores = np.empty(w.size)
+        away_scores = np.empty(w.size)
+        _team_scores(h, True, home_scores)
+        _team_scores(a, False, away_scores)
+        matchup = _matchup_kernel(h[_PACE], a[_PACE], h[_3PT], a[_3PT], h[_3DEF], a[_3DEF],
+                                  h[_TOV], a[_TOV], h[_REB], a[_REB])
+        
+        advantage = 0.0
+        for c in range(w.size):
+            advantage += w[c] * (home_scores[c] - away_scores[c])
+        return advantage + w_matchup * (2 * matchup - 1) + home_court
+    
+    @njit(parallel=True, cache=True, fastmath=True)
+    def _home_advantage_batch(home, away, w, w_matchup, home_court):
+        """_home_advantage_kernel over (N, len(FACTOR_FIELDS)) home/away rows."""
+        out = np.empty(home.shape[0])
+        for i in prange(home.shape[0]):
+            out[i] = _home_advantage_kernel(home[i], away[i], w, w_matchup, home_court)
+        return out
+
+
+def _compile_advantage(weights: Dict[str, float], cat_order: Tuple[str, ...], home_court: float):
+    """
+    Generate predict_game's weighted home advantage as one straight-line
+    function, adv(home_scores, away_scores, matchup_score), with the category
+    weights inlined as constants (scores are tuples in cat_order).
+    """
+    terms = [f"{weights[c]!r} * (hs[{i}] - as_[{i}])" for i, c in enumerate(cat_order)]
+    terms.append(f"{weights['matchup']!r} * (2 * m - 1)")
+    terms.append(repr(home_court))
+    src = "def _adv(hs, as_, m):\n    return " + " + ".join(terms) + "\n"
+    ns: Dict = {}
+    exec(compile(src, "<tier_advantage>", "exec"), ns)
+    return ns['_adv']
+
+
 class TierBasedPredictor:
     """Advanced tier-based prediction model"""
     
@@ -132,43 +300,65 @@ class TierBasedPredictor:
     # Home court advantage base
     HOME_COURT_BASE = 0.035  # 3.5% base advantage
     
+    # format_prediction_report pieces
+    _CAT_TITLES = {category: category.replace('_', ' ').title() for category in WEIGHTS}
+    _REPORT_HEADER = """
+╔══════════════════════════════════════════════════════════════════════╗
+║                    TIER-BASED PREDICTION ANALYSIS                    ║
+╚══════════════════════════════════════════════════════════════════════╝
+
+{home_team} (HOME) vs {away_team} (AWAY)
+
+PREDICTION:
+  {home_team:20s} {p.home_win_probability:6.1%} win probability
+  {away_team:20s} {p.away_win_probability:6.1%} win probability
+  
+  Confidence: {p.confidence:5.1%}
+  Home Advantage: {p.home_advantage:+.3f}
+
+═══════════════════════════════════════════════════════════════════════
+
+COMPONENT BREAKDOWN:
+                          {home_team:^15s}  {away_team:^15s}  Weight
+  ─────────────────────────────────────────────────────────────────────"""
+    
     def __init__(self):
-        self.team_factors_cache: Dict[str, TeamFactors] = {}
+        # League state, one row per team and one float64 column per
+        # FACTOR_FIELDS entry (see set_league_factors)
+        self.factors_df = pd.DataFrame(columns=list(FACTOR_FIELDS), dtype=np.float64)
+        
+        # Per-team categories in a fixed order so the weighted advantage is
+        # one dot product; matchup is scored relative to home and kept apart
+        self._cat_order = ('team_quality', 'recent_form', 'injuries', 'rest_schedule',
+                           'home_away', 'coaching', 'situational')
+        self._w = np.array([self.WEIGHTS[c] for c in self._cat_order], dtype=np.float64)
+        self._w_matchup = self.WEIGHTS['matchup']
+        self._adv = _compile_advantage(self.WEIGHTS, self._cat_order, self.HOME_COURT_BASE)
+        
+        # Per-instance memo of predict_game (TeamFactors is hashable)
+        self._predict_cached = lru_cache(maxsize=4096)(self._predict_game)
     
     def calculate_team_quality_score(self, factors: TeamFactors) -> float:
         """
         Calculate team quality component (0-1 scale)
         Considers: tier, ratings, net rating
         """
-        # Tier contribution (40% of this category)
-        tier_score = factors.overall_tier.value / 5.0
-        
-        # Net rating contribution (60% of this category)
-        # NBA net ratings typically range from -10 to +10
-        net_rating_normalized = (factors.net_rating + 10) / 20
-        net_rating_normalized = max(0, min(1, net_rating_normalized))
-        
-        return 0.4 * tier_score + 0.6 * net_rating_normalized
+        # Tier contribution (40% of this category), net rating (60%)
+        return 0.4 * factors.tier_score + 0.6 * factors.net_rating_normalized
     
     def calculate_recent_form_score(self, factors: TeamFactors) -> float:
         """
         Calculate recent form component (0-1 scale)
         Considers: L10, L5, momentum, recent point differential
         """
-        l10_wp = factors.last_10_record[0] / 10 if sum(factors.last_10_record) > 0 else 0.5
-        l5_wp = factors.last_5_record[0] / 5 if sum(factors.last_5_record) > 0 else 0.5
+        l10_wp = factors.last_10_wp
+        l5_wp = factors.last_5_wp
         
         # Weight recent games more heavily
         form_wp = 0.4 * l10_wp + 0.6 * l5_wp
         
-        # Momentum score normalized (-10 to +10 → 0 to 1)
-        momentum_normalized = (factors.momentum_score + 10) / 20
-        
-        # Recent point differential normalized (-15 to +15 → 0 to 1)
-        pt_diff_normalized = (factors.recent_point_diff + 15) / 30
-        pt_diff_normalized = max(0, min(1, pt_diff_normalized))
-        
-        return 0.5 * form_wp + 0.3 * momentum_normalized + 0.2 * pt_diff_normalized
+        return (0.5 * form_wp + 0.3 * factors.momentum_normalized
+                + 0.2 * factors.recent_pt_diff_normalized)
     
     def calculate_injury_impact(self, factors: TeamFactors) -> float:
         """
@@ -201,27 +391,13 @@ class TierBasedPredictor:
         Calculate rest/schedule component (0-1 scale)
         Considers: days rest, B2B, games in last 7, travel
         """
-        # Days rest score (optimal = 2 days)
-        if factors.days_rest == 0:
-            rest_score = 0.3  # Back to back penalty
-        elif factors.days_rest == 1:
-            rest_score = 0.7
-        elif factors.days_rest == 2:
-            rest_score = 1.0
-        elif factors.days_rest == 3:
-            rest_score = 0.95
-        else:
-            rest_score = 0.85  # Too much rest can be bad
-        
-        # Games in last 7 penalty (ideal = 3)
-        if factors.games_in_last_7 <= 2:
-            schedule_score = 1.0
-        elif factors.games_in_last_7 == 3:
-            schedule_score = 0.95
-        elif factors.games_in_last_7 == 4:
-            schedule_score = 0.8
-        else:
-            schedule_score = 0.6  # Brutal schedule
+        # Days rest score (optimal = 2 days; 0 = back to back penalty, too
+        # much rest can be bad)
+        rest = factors.days_rest
+        rest_score = float(_REST_LUT[rest if 0 <= rest < _REST_LUT.size else _REST_LUT.size - 1])
+        
+        # Games in last 7 penalty (ideal = 3, 5+ = brutal schedule)
+        schedule_score = float(_SCHED_LUT[min(max(factors.games_in_last_7, 0), _SCHED_LUT.size - 1)])
         
         # Travel penalty (0-3000 miles)
         travel_score = 1 - min(factors.travel_distance / 3000, 0.2)
@@ -233,10 +409,10 @@ class TierBasedPredictor:
         Calculate home/away performance (0-1 scale)
         """
         if is_home:
-            wp = factors.home_record[0] / sum(factors.home_record) if sum(factors.home_record) > 0 else 0.5
+            wp = factors.home_wp
             pt_diff = factors.home_point_diff
         else:
-            wp = factors.away_record[0] / sum(factors.away_record) if sum(factors.away_record) > 0 else 0.5
+            wp = factors.away_wp
             pt_diff = factors.away_point_diff
         
         # Point differential normalized (-10 to +10)
@@ -276,8 +452,8 @@ class TierBasedPredictor:
         Calculate coaching/intangibles (0-1 scale)
         """
         coach_score = factors.coach_win_pct
-        clutch_wp = factors.clutch_record[0] / sum(factors.clutch_record) if sum(factors.clutch_record) > 0 else 0.5
-        ats_wp = factors.ats_record[0] / sum(factors.ats_record) if sum(factors.ats_record) > 0 else 0.5
+        clutch_wp = factors.clutch_wp
+        ats_wp = factors.ats_wp
         
         return 0.4 * coach_score + 0.4 * clutch_wp + 0.2 * ats_wp
     
@@ -285,61 +461,68 @@ class TierBasedPredictor:
         """
         Calculate situational factors (0-1 scale)
         """
-        # Playoff position (1-15, where 1 is best)
-        seed_score = 1 - (factors.playoff_position - 1) / 14
-        
-        # Motivation normalized (-5 to +5)
-        motivation_score = (factors.motivation_factor + 5) / 10
-        
-        return 0.6 * seed_score + 0.4 * motivation_score
+        return 0.6 * factors.seed_score + 0.4 * factors.motivation_normalized
     
-    def predict_game(self, home_factors: TeamFactors, away_factors: TeamFactors) -> Dict:
+    def predict_game(self, home_factors: TeamFactors, away_factors: TeamFactors,
+                     return_breakdown: bool = False) -> Prediction:
         """
         Predict game outcome using comprehensive tier-based model.
         
+        Repeat calls with the same factors are served from a cache, so the
+        breakdown dict is shared and should be treated as read-only.
+        
+        Args:
+            home_factors: Home team factors
+            away_factors: Away team factors
+            return_breakdown: Also build the per-category breakdown (needed
+                by format_prediction_report)
+        
         Returns:
-            {
-                'home_win_probability': float,
-                'away_win_probability': float,
-                'confidence': float,
-                'breakdown': dict with component scores
-            }
+            Prediction(home_win_probability, away_win_probability, confidence,
+            home_advantage, breakdown); breakdown is None unless requested
         """
+        return self._predict_cached(home_factors, away_factors, return_breakdown)
+    
+    def _category_scores(self, factors: TeamFactors, is_home: bool) -> Tuple[float, ...]:
+        """The per-team calculate_* scores in _cat_order."""
+        return (
+            self.calculate_team_quality_score(factors),
+            self.calculate_recent_form_score(factors),
+            self.calculate_injury_impact(factors),
+            self.calculate_rest_schedule_score(factors),
+            self.calculate_home_away_score(factors, is_home=is_home),
+            self.calculate_coaching_intangibles(factors),
+            self.calculate_situational_score(factors),
+        )
+    
+    def _predict_game(self, home_factors: TeamFactors, away_factors: TeamFactors,
+                      return_breakdown: bool = False) -> Prediction:
+        """Uncached predict_game."""
         # Calculate component scores for each team
-        home_scores = {
-            'team_quality': self.calculate_team_quality_score(home_factors),
-            'recent_form': self.calculate_recent_form_score(home_factors),
-            'injuries': self.calculate_injury_impact(home_factors),
-            'rest_schedule': self.calculate_rest_schedule_score(home_factors),
-            'home_away': self.calculate_home_away_score(home_factors, is_home=True),
-            'coaching': self.calculate_coaching_intangibles(home_factors),
-            'situational': self.calculate_situational_score(home_factors),
-        }
-        
-        away_scores = {
-            'team_quality': self.calculate_team_quality_score(away_factors),
-            'recent_form': self.calculate_recent_form_score(away_factors),
-            'injuries': self.calculate_injury_impact(away_factors),
-            'rest_schedule': self.calculate_rest_schedule_score(away_factors),
-            'home_away': self.calculate_home_away_score(away_factors, is_home=False),
-            'coaching': self.calculate_coaching_intangibles(away_factors),
-            'situational': self.calculate_situational_score(away_factors),
-        }
+        home_scores = self._category_scores(home_factors, is_home=True)
+        away_scores = self._category_scores(away_factors, is_home=False)
         
         # Matchup score (relative to home team)
         matchup_score = self.calculate_matchup_score(home_factors, away_factors)
         
-        # Calculate weighted advantage for home team
-        home_advantage = 0.0
-        for category, weight in self.WEIGHTS.items():
-            if category == 'matchup':
-                home_advantage += weight * (matchup_score - 0.5) * 2  # Convert 0-1 to -1 to +1
-            else:
-                home_advantage += weight * (home_scores[category] - away_scores[category])
+        # Calculate weighted advantage for home team (matchup converted 0-1 to
+        # -1 to +1), plus home court advantage
+        home_advantage = self._adv(home_scores, away_scores, matchup_score)
         
-        # Add home court advantage
-        home_advantage += self.HOME_COURT_BASE
+        breakdown = None
+        if return_breakdown:
+            breakdown = {
+                'home_scores': dict(zip(self._cat_order, home_scores)),
+                'away_scores': dict(zip(self._cat_order, away_scores)),
+                'matchup_score': float(matchup_score),
+                'home_court_boost': self.HOME_COURT_BASE,
+            }
         
+        return self._to_prediction(home_advantage, breakdown)
+    
+    @staticmethod
+    def _to_prediction(home_advantage: float, breakdown: Optional[Dict] = None) -> Prediction:
+        """Prediction for a home advantage."""
         # Convert advantage to probability (sigmoid-like function)
         # Advantage ranges roughly -0.5 to +0.5, map to probability
         home_win_prob = 0.5 + home_advantage
@@ -348,58 +531,156 @@ class TierBasedPredictor:
         # Confidence based on magnitude of advantage
         confidence = abs(home_win_prob - 0.5) * 2
         
+        return Prediction(
+            home_win_probability=float(home_win_prob),
+            away_win_probability=float(1 - home_win_prob),
+            confidence=float(confidence),
+            home_advantage=float(home_advantage),
+            breakdown=breakdown,
+        )
+    
+    @staticmethod
+    def factors_to_array(factors: List[TeamFactors]) -> np.ndarray:
+        """
+        Pack TeamFactors into a structured array (one row per team, one float64
+        field per TeamFactors.to_dict() key) for predict_games_batch.
+        """
+        rows = [f.to_dict() for f in factors]
+        names = list(rows[0]) if rows else list(TeamFactors().to_dict())
+        dtype = np.dtype([(name, np.float64) for name in names])
+        return np.array([tuple(row[name] for name in names) for row in rows], dtype=dtype)
+    
+    def set_league_factors(self, factors: Dict[str, TeamFactors]):
+        """Store every team's factors column-wise in factors_df for predict_matchups."""
+        self.factors_df = pd.DataFrame(self.factors_to_array(list(factors.values())),
+                                       index=pd.Index(list(factors), name='team'))
+    
+    def predict_matchups(self, home_teams: List[str], away_teams: List[str]) -> Dict[str, np.ndarray]:
+        """
+        predict_games_batch for games between teams already in factors_df.
+        
+        Args:
+            home_teams: Home team names, one per game
+            away_teams: Away team names, aligned with home_teams
+        """
+        return self.predict_games_batch(self.factors_df.loc[home_teams].to_records(index=False),
+                                        self.factors_df.loc[away_teams].to_records(index=False))
+    
+    @staticmethod
+    def _component_scores_batch(arr: np.ndarray, is_home: bool) -> Dict[str, np.ndarray]:
+        """The per-team calculate_* scores over a factors_to_array() batch."""
+        # Team quality: tier (40%) + net rating normalized from -10..+10 (60%)
+        net_rating_normalized = np.clip((arr['net_rating'] + 10) / 20, 0, 1)
+        team_quality = 0.4 * (arr['tier_value'] / 5.0) + 0.6 * net_rating_normalized
+        
+        # Recent form: weighted L10/L5, momentum and recent point differential
+        form_wp = 0.4 * arr['last_10_wp'] + 0.6 * arr['last_5_wp']
+        momentum_normalized = (arr['momentum'] + 10) / 20
+        pt_diff_normalized = np.clip((arr['recent_pt_diff'] + 15) / 30, 0, 1)
+        recent_form = 0.5 * form_wp + 0.3 * momentum_normalized + 0.2 * pt_diff_normalized
+        
+        # Injuries: the largest of the three penalties, floored at 10% healthy
+        total_penalty = np.maximum.reduce([
+            np.minimum(arr['key_players_out'] * 0.30, 0.90),
+            np.minimum(arr['injury_impact'] / 30, 0.90),
+            arr['minutes_lost'] * 0.8,
+        ])
+        injuries = np.maximum(0.1, 1 - total_penalty)
+        
+        # Rest/schedule: rest days, games in last 7, travel
+        rest = arr['days_rest'].astype(np.int64)
+        rest_score = _REST_LUT[np.where((rest >= 0) & (rest < _REST_LUT.size), rest, _REST_LUT.size - 1)]
+        schedule_score = _SCHED_LUT[np.clip(arr['games_last_7'].astype(np.int64), 0, _SCHED_LUT.size - 1)]
+        travel_score = 1 - np.minimum(arr['travel_miles'] / 3000, 0.2)
+        rest_schedule = 0.5 * rest_score + 0.3 * schedule_score + 0.2 * travel_score
+        
+        # Home/away split for the side the team is playing
+        side = 'home' if is_home else 'away'
+        side_pt_diff = np.clip((arr[f'{side}_pt_diff'] + 10) / 20, 0, 1)
+        home_away = 0.7 * arr[f'{side}_wp'] + 0.3 * side_pt_diff
+        
+        coaching = 0.4 * arr['coach_wp'] + 0.4 * arr['clutch_wp'] + 0.2 * arr['ats_wp']
+        situational = 0.6 * (1 - (arr['seed'] - 1) / 14) + 0.4 * ((arr['motivation'] + 5) / 10)
+        
         return {
-            'home_win_probability': float(home_win_prob),
-            'away_win_probability': float(1 - home_win_prob),
-            'confidence': float(confidence),
-            'home_advantage': float(home_advantage),
-            'breakdown': {
-                'home_scores': home_scores,
-                'away_scores': away_scores,
-                'matchup_score': float(matchup_score),
-                'home_court_boost': self.HOME_COURT_BASE,
-            }
+            'team_quality': team_quality,
+            'recent_form': recent_form,
+            'injuries': injuries,
+            'rest_schedule': rest_schedule,
+            'home_away': home_away,
+            'coaching': coaching,
+            'situational': situational,
         }
     
-    def format_prediction_report(self, prediction: Dict, home_team: str, away_team: str) -> str:
-        """Generate detailed prediction report"""
-        report = f"""
-╔══════════════════════════════════════════════════════════════════════╗
-║                    TIER-BASED PREDICTION ANALYSIS                    ║
-╚══════════════════════════════════════════════════════════════════════╝
-
-{home_team} (HOME) vs {away_team} (AWAY)
-
-PREDICTION:
-  {home_team:20s} {prediction['home_win_probability']:6.1%} win probability
-  {away_team:20s} {prediction['away_win_probability']:6.1%} win probability
-  
-  Confidence: {prediction['confidence']:5.1%}
-  Home Advantage: {prediction['home_advantage']:+.3f}
-
-═══════════════════════════════════════════════════════════════════════
-
-COMPONENT BREAKDOWN:
-                          {home_team:^15s}  {away_team:^15s}  Weight
-  ─────────────────────────────────────────────────────────────────────
-"""
+    @staticmethod
+    def _matchup_score_batch(home: np.ndarray, away: np.ndarray) -> np.ndarray:
+        """calculate_matchup_score over aligned home/away batches."""
+        pace_score = 0.5 + ((home['pace'] - away['pace']) / 20) * 0.1
+        home_shooting_advantage = home['three_pct'] - away['three_def']
+        away_shooting_advantage = away['three_pct'] - home['three_def']
+        shooting_score = 0.5 + (home_shooting_advantage - away_shooting_advantage) * 2
+        tov_score = 0.5 + ((away['tov_rate'] - home['tov_rate']) / 10) * 0.2
+        reb_score = 0.5 + ((home['reb_rate'] - away['reb_rate']) / 10) * 0.2
+        matchup = 0.2 * pace_score + 0.4 * shooting_score + 0.2 * tov_score + 0.2 * reb_score
+        return np.clip(matchup, 0, 1)
+    
+    def predict_games_batch(self, home_arr: np.ndarray, away_arr: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Vectorized predict_game over many games at once.
+        
+        Args:
+            home_arr: factors_to_array() of the home teams, one row per game
+            away_arr: factors_to_array() of the away teams, aligned with home_arr
+            
+        Returns:
+            {home_win_probability, away_win_probability, confidence,
+            home_advantage} arrays, one entry per game
+        """
+        if NUMBA_AVAILABLE:
+            fields = list(FACTOR_FIELDS)
+            home_advantage = _home_advantage_batch(
+                structured_to_unstructured(home_arr[fields], dtype=np.float64),
+                structured_to_unstructured(away_arr[fields], dtype=np.float64),
+                self._w, self._w_matchup, self.HOME_COURT_BASE)
+        else:
+            home_scores = self._component_scores_batch(home_arr, is_home=True)
+            away_scores = self._component_scores_batch(away_arr, is_home=False)
+            matchup_score = self._matchup_score_batch(home_arr, away_arr)
+            
+            home_mat = np.stack([home_scores[c] for c in self._cat_order])
+            away_mat = np.stack([away_scores[c] for c in self._cat_order])
+            home_advantage = (self._w @ (home_mat - away_mat)
+                              + self._w_matchup * (2 * matchup_score - 1)
+                              + self.HOME_COURT_BASE)
+        
+        home_win_prob = np.clip(0.5 + home_advantage, 0.01, 0.99)
+        return {
+            'home_win_probability': home_win_prob,
+            'away_win_probability': 1 - home_win_prob,
+            'confidence': np.abs(home_win_prob - 0.5) * 2,
+            'home_advantage': home_advantage,
+        }
+    
+    def format_prediction_report(self, prediction: Prediction, home_team: str, away_team: str) -> str:
+        """Generate detailed prediction report (prediction needs return_breakdown=True)"""
+        lines = [self._REPORT_HEADER.format(home_team=home_team, away_team=away_team, p=prediction)]
         
-        home_scores = prediction['breakdown']['home_scores']
-        away_scores = prediction['breakdown']['away_scores']
+        home_scores = prediction.breakdown['home_scores']
+        away_scores = prediction.breakdown['away_scores']
         
         for category, weight in self.WEIGHTS.items():
             if category != 'matchup':
                 h_score = home_scores[category]
                 a_score = away_scores[category]
-                report += f"  {category.replace('_', ' ').title():20s} {h_score:6.1%}        {a_score:6.1%}      {weight:5.1%}\n"
+                lines.append(f"  {self._CAT_TITLES[category]:20s} {h_score:6.1%}        {a_score:6.1%}      {weight:5.1%}")
         
-        matchup = prediction['breakdown']['matchup_score']
-        report += f"  {'Matchup Edge':20s} {matchup:6.1%}        {1-matchup:6.1%}      {self.WEIGHTS['matchup']:5.1%}\n"
-        report += f"  {'Home Court':20s} {self.HOME_COURT_BASE:+6.1%}        {'—':>6s}      {'—':>5s}\n"
+        matchup = prediction.breakdown['matchup_score']
+        lines.append(f"  {'Matchup Edge':20s} {matchup:6.1%}        {1-matchup:6.1%}      {self.WEIGHTS['matchup']:5.1%}")
+        lines.append(f"  {'Home Court':20s} {self.HOME_COURT_BASE:+6.1%}        {'—':>6s}      {'—':>5s}")
         
-        report += "\n═══════════════════════════════════════════════════════════════════════\n"
+        lines.append("\n═══════════════════════════════════════════════════════════════════════\n")
         
-        return report
+        return "\n".join(lines)
 
 
 # Example usage
@@ -444,5 +725,5 @@ if __name__ == "__main__":
         playoff_position=6,
     )
     
-    prediction = predictor.predict_game(celtics, lakers)
+    prediction = predictor.predict_game(celtics, lakers, return_breakdown=True)
     print(predictor.format_prediction_report(prediction, "Boston Celtics", "Los Angeles Lakers"))
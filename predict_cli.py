@@ -11,6 +11,8 @@ Usage:
 import sys
 import os
 from datetime import datetime, timedelta
+from functools import lru_cache
+from types import MappingProxyType
 try:
     from tabulate import tabulate
 except Exception:
@@ -23,10 +25,17 @@ except Exception:
         for r in rows:
             lines.append(" | ".join(str(r.get(k, '')) for k in keys))
         return "\n".join(lines)
+import numpy as np
 import pandas as pd
 from predictor import predict_game, init_model
 from data.game_context_collector import GameToGameDataCollector
 
+
+@lru_cache(maxsize=1024)
+def cached_predict_game(home_team: str, away_team: str, game_date: str = None) -> dict:
+    """predict_game memoized for the CLI session (the same matchup is shown in several views)."""
+    return predict_game(home_team, away_team, game_date)
+
 # Team name normalization
 TEAM_NAMES = {
     'celtics': 'Boston Celtics',
@@ -61,10 +70,15 @@ TEAM_NAMES = {
     'wizards': 'Washington Wizards',
 }
 
+# Case-folded aliases plus full names ("boston celtics"), built once at import
+_NORMALIZED = MappingProxyType(
+    {k.casefold(): v for k, v in TEAM_NAMES.items()}
+    | {v.casefold(): v for v in TEAM_NAMES.values()}
+)
+
 def normalize_team(team_str):
     """Convert user input to full team name."""
-    team_lower = team_str.lower().strip()
-    return TEAM_NAMES.get(team_lower, None)
+    return _NORMALIZED.get(team_str.casefold().strip())
 
 def get_upcoming_games(team_name, days_ahead=7):
     """Get upcoming games for a team (placeholder - would use nba_api)."""
@@ -81,14 +95,39 @@ def get_upcoming_games(team_name, days_ahead=7):
         })
     return games
 
+def _read_injury_table(injury_file):
+    """Read the injury CSV through a parquet copy that is rewritten whenever the CSV is newer."""
+    parquet_file = os.path.splitext(injury_file)[0] + '.parquet'
+    try:
+        if os.stat(parquet_file).st_mtime >= os.stat(injury_file).st_mtime:
+            return pd.read_parquet(parquet_file)
+    except Exception:  # no parquet copy yet, or pyarrow missing
+        pass
+    df = pd.read_csv(injury_file)
+    try:
+        df.to_parquet(parquet_file, index=False)
+    except Exception:  # pyarrow missing or unwritable dir
+        pass
+    return df
+
+# Parsed current_injuries.csv, reused until the file's mtime changes
+_INJ_CACHE = {'mtime': None, 'df': None}
+
 def load_injuries():
-    """Load current injuries from CSV."""
+    """Load current injuries from CSV, indexed by team (shared; do not modify)."""
     injury_file = os.path.join(os.path.dirname(__file__), 'data', 'injury_reports', 'current_injuries.csv')
     try:
-        df = pd.read_csv(injury_file)
-        return df
+        mtime = os.stat(injury_file).st_mtime
+        if _INJ_CACHE['mtime'] == mtime:
+            return _INJ_CACHE['df']
+        df = _read_injury_table(injury_file)
+        df = df.set_index('team', drop=False)
     except:
         return pd.DataFrame()
+    _INJ_CACHE.update(mtime=mtime, df=df)
+    return df
+
+STATUS_EMOJI = {'OUT': '❌', 'QUESTIONABLE': '⚠️', 'PROBABLE': '✓', 'DOUBTFUL': '?'}
 
 def display_header():
     """Display fancy header."""
@@ -105,13 +144,15 @@ def display_team_predictions(team_name):
     
     # Load injuries
     injuries_df = load_injuries()
-    team_injuries = injuries_df[injuries_df['team'] == team_name] if not injuries_df.empty else pd.DataFrame()
+    team_injuries = injuries_df.loc[[team_name]] if team_name in injuries_df.index else pd.DataFrame()
     
     if not team_injuries.empty:
         print(f"\n⚠️  INJURY ALERT for {team_name}:")
-        for _, row in team_injuries.iterrows():
-            status_emoji = {'OUT': '❌', 'QUESTIONABLE': '⚠️', 'PROBABLE': '✓', 'DOUBTFUL': '?'}.get(row['status'], '•')
-            print(f"   {status_emoji} {row['player']} - {row['status']} ({row['details']})")
+        parts = team_injuries[['player', 'status', 'details']].fillna('').astype(str)
+        status_emoji = parts['status'].map(STATUS_EMOJI).fillna('•')
+        lines = ("   " + status_emoji + " " + parts['player'] + " - " + parts['status']
+                 + " (" + parts['details'] + ")")
+        print("\n".join(lines))
         print()
     
     # Get games
@@ -121,30 +162,38 @@ def display_team_predictions(team_name):
         print(f"❌ No upcoming games found for {team_name}")
         return
     
-    predictions = []
+    rows = []
     
     for game in games:
         opponent = game['opponent']
         home_team = team_name if game['home'] else opponent
         away_team = opponent if game['home'] else team_name
         try:
-            pred = predict_game(home_team, away_team)
+            pred = cached_predict_game(home_team, away_team)
             # predict_game returns a dict with probabilities in 0-1 range
             prob_home = pred['home_win_probability'] * 100
             prob_away = pred['away_win_probability'] * 100
 
             team_prob = prob_home if game['home'] else prob_away
-
-            predictions.append({
-                'Date': game['date'],
-                'Matchup': f"{away_team} @ {home_team}" if game['home'] else f"{home_team} @ {away_team}",
-                f'{team_name} Win %': f"{team_prob:.1f}%",
-                'Confidence': get_confidence_level(team_prob),
-                'Parlay Odds': f"{format_parlay_odds(team_prob)}"
-            })
+            matchup = f"{away_team} @ {home_team}" if game['home'] else f"{home_team} @ {away_team}"
+            rows.append((game['date'], matchup, team_prob))
         except Exception as e:
             print(f"⚠️  Error predicting {opponent}: {str(e)}")
     
+    # Confidence and odds for the whole schedule in one sweep
+    team_probs = np.array([prob for _, _, prob in rows])
+    predictions = [
+        {
+            'Date': date,
+            'Matchup': matchup,
+            f'{team_name} Win %': f"{prob:.1f}%",
+            'Confidence': conf,
+            'Parlay Odds': odds,
+        }
+        for (date, matchup, prob), conf, odds in zip(
+            rows, get_confidence_levels(team_probs), format_parlay_odds_array(team_probs))
+    ]
+    
     if predictions:
         print(tabulate(predictions, headers='keys', tablefmt='grid'))
     
@@ -163,35 +212,37 @@ def display_team_predictions(team_name):
 
 def get_confidence_level(prob):
     """Return confidence level emoji."""
-    if prob > 55:
-        return "🟢 High"
-    elif prob < 45:
-        return "🔴 Low"
-    else:
-        return "🟡 Medium"
+    return str(get_confidence_levels(np.array([prob]))[0])
+
+
+def get_confidence_levels(probs: np.ndarray) -> np.ndarray:
+    """get_confidence_level over an array of win percentages."""
+    return np.where(probs > 55, "🟢 High", np.where(probs < 45, "🔴 Low", "🟡 Medium"))
 
 
 def format_parlay_odds(prob_percent: float) -> str:
     """Rudimentary conversion from probability percent to American odds string."""
-    p = prob_percent / 100.0
-    if p <= 0 or p >= 1:
-        return "—"
-    if p >= 0.5:
-        # Positive odds
-        odds = int((p / (1 - p)) * 100)
-        return f"+{odds}"
-    else:
-        odds = int((-(100 / (p * 100 - 100))))
-        # fallback - show implied negative odds approximation
-        try:
-            neg = int((100 * (1 - p)) / p)
-            return f"-{neg}"
-        except Exception:
-            return "—"
+    return str(format_parlay_odds_array(np.array([prob_percent]))[0])
+
+
+def format_parlay_odds_array(prob_percent: np.ndarray) -> np.ndarray:
+    """format_parlay_odds over an array of win percentages."""
+    p = np.asarray(prob_percent, dtype=float) / 100.0
+    valid = (p > 0) & (p < 1)
+    # Positive odds at >= 50%, implied negative odds approximation below
+    with np.errstate(divide='ignore', invalid='ignore'):
+        odds = np.where(p >= 0.5, (p / (1 - p)) * 100, (100 * (1 - p)) / p)
+    odds = np.where(valid, odds, 0).astype(int)
+    return np.where(~valid, "—", np.char.add(np.where(p >= 0.5, "+", "-"), odds.astype(str)))
 
 
 def compute_expected_margin(prob_percent: float) -> float:
     """Estimate expected point margin from win probability (heuristic)."""
+    return float(compute_expected_margins(np.array([prob_percent]))[0])
+
+
+def compute_expected_margins(prob_percent: np.ndarray) -> np.ndarray:
+    """compute_expected_margin over an array of win percentages."""
     p = prob_percent / 100.0
     # Scale factor chosen conservatively; this is heuristic only
     return (p - 0.5) * 15.0
@@ -254,7 +305,7 @@ def display_next_game_detail(team_name: str, game: dict):
 
     # Prediction and bets
     try:
-        pred = predict_game(home_team, away_team, date)
+        pred = cached_predict_game(home_team, away_team, date)
         prob_home = pred['home_win_probability'] * 100
         prob_away = pred['away_win_probability'] * 100
 
@@ -280,7 +331,7 @@ def display_head_to_head(team1, team2):
     print(f"📊 HEAD-TO-HEAD: {team1} vs {team2}")
     print("-" * 80)
     try:
-        pred = predict_game(team1, team2)
+        pred = cached_predict_game(team1, team2)
         prob_home = pred['home_win_probability'] * 100
         prob_away = pred['away_win_probability'] * 100
 
@@ -6,52 +6,60 @@ Usage:
 """
 
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from itertools import chain
 from pathlib import Path
 from datetime import datetime, timedelta
-import pandas as pd
 
+# predictor (and with it pandas and the model stack) is imported where it is
+# used, so the usage/validation paths start instantly
 sys.path.insert(0, str(Path(__file__).parent))
 
-from predictor import predict_game, init_model, format_prediction
+
+def _fetch_one_date(date_str: str, nicknames: dict) -> list:
+    """Fetch the games scheduled on one date (dated stats scoreboard)."""
+    from nba_api.stats.endpoints import scoreboardv2
+    
+    games = []
+    try:
+        # The live ScoreBoard only ever shows today; ScoreboardV2 takes a date
+        header = scoreboardv2.ScoreboardV2(game_date=date_str, timeout=20).game_header.get_data_frame()
+        for home_id, away_id in zip(header["HOME_TEAM_ID"], header["VISITOR_TEAM_ID"]):
+            games.append({
+                'date': date_str,
+                'home': nicknames[home_id],
+                'away': nicknames[away_id]
+            })
+    except Exception as e:
+        print(f"  Warning: Could not fetch games for {date_str}: {e}")
+    
+    return games
 
 
 def fetch_schedule_for_dates(start_date: str, end_date: str):
     """
     Fetch NBA schedule for date range from NBA API.
+    
+    Dates are fetched concurrently (the calls are network-bound) and returned
+    in date order.
     """
     try:
-        from nba_api.live.nba.endpoints import scoreboard
+        from nba_api.stats.endpoints import scoreboardv2  # noqa: F401 (sample schedule if missing)
+        from nba_api.stats.static import teams as nba_teams
         
-        games = []
-        current = pd.to_datetime(start_date)
-        end = pd.to_datetime(end_date)
+        start = datetime.strptime(start_date, "%Y-%m-%d")
+        n_days = (datetime.strptime(end_date, "%Y-%m-%d") - start).days + 1
+        dates = [(start + timedelta(days=i)).strftime('%Y-%m-%d') for i in range(n_days)]
+        if not dates:
+            return []
         
-        while current <= end:
-            date_str = current.strftime('%Y-%m-%d')
-            try:
-                # Fetch games for this date
-                board = scoreboard.ScoreBoard()
-                data = board.get_dict()
-                
-                if 'scoreboard' in data and 'games' in data['scoreboard']:
-                    for game in data['scoreboard']['games']:
-                        home_team = game['homeTeam']['teamName']
-                        away_team = game['awayTeam']['teamName']
-                        
-                        games.append({
-                            'date': date_str,
-                            'home': home_team,
-                            'away': away_team
-                        })
-            except Exception as e:
-                print(f"  Warning: Could not fetch games for {date_str}: {e}")
-            
-            current += timedelta(days=1)
-        
-        return games
+        nicknames = {t["id"]: t["nickname"] for t in nba_teams.get_teams()}
+        with ThreadPoolExecutor(max_workers=min(8, len(dates))) as ex:
+            return list(chain.from_iterable(ex.map(partial(_fetch_one_date, nicknames=nicknames), dates)))
         
     except ImportError:
-        print("  nba_api.live not available, using sample schedule")
+        print("  nba_api not available, using sample schedule")
         # Fallback to sample schedule
         return [
             # Feb 19, 2026
@@ -79,6 +87,7 @@ def fetch_schedule_for_dates(start_date: str, end_date: str):
 
 def generate_predictions_for_dates(start_date: str, end_date: str):
     """Generate predictions for all games in date range"""
+    from predictor import predict_games_cached, init_model
     
     print("\n" + "="*80)
     print(f"NBA GAME PREDICTIONS: {start_date} to {end_date}")
@@ -105,76 +114,63 @@ def generate_predictions_for_dates(start_date: str, end_date: str):
     
     print(f"✓ Found {len(games)} games\n")
     
-    # Generate predictions
-    predictions = []
-    
-    for game in games:
-        try:
-            pred = predict_game(game['home'], game['away'], game['date'])
-            predictions.append(pred)
-        except Exception as e:
-            print(f"✗ Failed to predict {game['home']} vs {game['away']}: {e}")
+    # Generate predictions for the whole schedule in one vectorized pass
+    # (games already predicted against the current data come from the cache)
+    try:
+        predictions = predict_games_cached([(g['home'], g['away'], g['date']) for g in games])
+    except Exception as e:
+        print(f"✗ Failed to predict games: {e}")
+        return
     
     # Display results
     print("="*80)
     print("PREDICTIONS")
     print("="*80)
     
-    # Group by date
-    by_date = {}
-    for pred in predictions:
-        date = pred['game_date']
-        if date not in by_date:
-            by_date[date] = []
-        by_date[date].append(pred)
-    
     # Display each date
-    for date in sorted(by_date.keys()):
+    has_tiers = 'home_tier' in predictions.columns
+    for date, day in predictions.groupby('game_date', sort=True):
         print(f"\n{'='*80}")
         print(f"📅 {date}")
         print('='*80)
         
-        for pred in by_date[date]:
-            print(f"\n{pred['home_team']} vs {pred['away_team']}")
-            print(f"  {'HOME':15s} {pred['home_win_probability']:6.1%}")
-            print(f"  {'AWAY':15s} {pred['away_win_probability']:6.1%}")
-            print(f"  Prediction: {pred['predicted_winner']} (confidence: {pred['confidence']:5.1%})")
+        for pred in day.itertuples(index=False):
+            print(f"\n{pred.home_team} vs {pred.away_team}")
+            print(f"  {'HOME':15s} {pred.home_win_probability:6.1%}")
+            print(f"  {'AWAY':15s} {pred.away_win_probability:6.1%}")
+            print(f"  Prediction: {pred.predicted_winner} (confidence: {pred.confidence:5.1%})")
             
             # Show key factors
-            if 'model_features' in pred:
-                features = pred['model_features']
-                if 'home_tier' in features:
-                    print(f"  Tiers: {features['home_tier']} vs {features['away_tier']}")
-                if 'home_injuries' in features:
-                    if features['home_injuries'] > 0 or features['away_injuries'] > 0:
-                        print(f"  Injuries: {features['home_injuries']} vs {features['away_injuries']}")
+            if has_tiers:
+                print(f"  Tiers: {pred.home_tier} vs {pred.away_tier}")
+                if pred.home_injuries > 0 or pred.away_injuries > 0:
+                    print(f"  Injuries: {pred.home_injuries} vs {pred.away_injuries}")
     
     # Summary
     print("\n" + "="*80)
     print("SUMMARY")
     print("="*80)
     print(f"Total games predicted: {len(predictions)}")
-    print(f"Model type: {predictions[0].get('model_type', 'unknown') if predictions else 'N/A'}")
+    print(f"Model type: {predictions['model_type'].iloc[0] if len(predictions) else 'N/A'}")
     
     # High confidence picks
-    high_conf = [p for p in predictions if p['confidence'] > 0.30]
-    if high_conf:
+    high_conf = predictions[predictions['confidence'] > 0.30]
+    if len(high_conf):
         print(f"\nHigh confidence picks (>30%):")
-        for p in sorted(high_conf, key=lambda x: x['confidence'], reverse=True)[:5]:
-            print(f"  {p['predicted_winner']:25s} {p['home_win_probability']:5.1%} (vs {p['away_team'] if p['predicted_winner'] == p['home_team'] else p['home_team']})")
+        top = high_conf.nlargest(5, 'confidence', keep='first')
+        opponents = top['away_team'].where(top['predicted_winner'] == top['home_team'], top['home_team'])
+        for winner, home_prob, opponent in zip(top['predicted_winner'], top['home_win_probability'], opponents):
+            print(f"  {winner:25s} {home_prob:5.1%} (vs {opponent})")
     
     # Save to CSV
     output_file = f"predictions_{start_date}_to_{end_date}.csv"
-    df = pd.DataFrame([{
-        'date': p['game_date'],
-        'home_team': p['home_team'],
-        'away_team': p['away_team'],
-        'home_win_prob': p['home_win_probability'],
-        'away_win_prob': p['away_win_probability'],
-        'predicted_winner': p['predicted_winner'],
-        'confidence': p['confidence'],
-        'model_type': p.get('model_type', 'unknown')
-    } for p in predictions])
+    df = predictions[['game_date', 'home_team', 'away_team', 'home_win_probability',
+                      'away_win_probability', 'predicted_winner', 'confidence', 'model_type']]
+    df = df.rename(columns={
+        'game_date': 'date',
+        'home_win_probability': 'home_win_prob',
+        'away_win_probability': 'away_win_prob',
+    })
     
     df.to_csv(output_file, index=False)
     print(f"\n✓ Predictions saved to: {output_file}")
@@ -194,9 +190,9 @@ def main():
     
     # Validate dates
     try:
-        pd.to_datetime(start_date)
-        pd.to_datetime(end_date)
-    except:
+        datetime.strptime(start_date, "%Y-%m-%d")
+        datetime.strptime(end_date, "%Y-%m-%d")
+    except ValueError:
         print(f"\n✗ Invalid date format. Use YYYY-MM-DD")
         print(f"Example: 2026-02-19\n")
         return
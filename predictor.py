@@ -9,12 +9,23 @@ Usage:
     print(f"{result['home_team']} win probability: {result['home_win_probability']:.1%}")
 """
 
+import hashlib
+import json
+import pickle
+import threading
+import numpy as np
 import pandas as pd
 import logging
 from pathlib import Path
 from datetime import datetime
+from functools import lru_cache
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Global model and data cache
@@ -22,31 +33,141 @@ _TIER_MODEL = None
 _DATA_LOADER = None
 _USE_TIER_MODEL = True  # Set to False to use simple fallback
 
+# Serializes init_model so the data load runs once under concurrent callers
+_INIT_LOCK = threading.Lock()
+
+# Loaded TeamDataLoader, reused across runs until a source CSV or the loader
+# code changes
+_LOADER_SNAPSHOT = Path(".cache/data_loader.pkl")
+_LOADER_RESTORED = False  # _DATA_LOADER came from _LOADER_SNAPSHOT
+
+# Modules whose source decides what a pickled TeamDataLoader looks like
+_LOADER_SOURCES = (
+    Path(__file__).parent / "models" / "team_data_loader.py",
+    Path(__file__).parent / "models" / "tier_based_predictor.py",
+)
+
+# predict_games_cached results, one JSON object per line tagged with the data
+# version they were computed against
+_PREDICTION_CACHE = Path(".cache/predictions.jsonl")
+
 
 def init_model(model_path: str = "models/saved_models/game_predictor.pkl",
                data_path: str = "data/processed/historical_games.csv"):
-    """Initialize model and load historical data."""
+    """Initialize model and load historical data (once, even with concurrent callers)."""
     global _TIER_MODEL, _DATA_LOADER
     
-    if _TIER_MODEL is not None:
-        return  # Already initialized
+    with _INIT_LOCK:
+        clear_factor_cache()
+        
+        if _TIER_MODEL is not None:
+            return  # Already initialized
+        
+        logger.info("Initializing tier-based prediction model...")
+        
+        try:
+            from models.tier_based_predictor import TierBasedPredictor
+            
+            # _TIER_MODEL is set last: callers check it without the lock
+            _DATA_LOADER = _load_data_loader()
+            _TIER_MODEL = TierBasedPredictor()
+            
+            logger.info("✓ Tier-based model initialized")
+        except Exception as e:
+            logger.error(f"Failed to load tier-based model: {e}")
+            logger.info("Falling back to simple heuristic model")
+            global _USE_TIER_MODEL
+            _USE_TIER_MODEL = False
+
+
+def _source_mtimes(loader=None) -> tuple:
+    """(path, mtime) of every CSV the loader reads; editing one invalidates the caches."""
+    loader = loader or _DATA_LOADER
+    return tuple(sorted(
+        (str(p), p.stat().st_mtime)
+        for d in (loader.data_dir, loader.injury_dir) if d.exists()
+        for p in d.glob("*.csv")
+    ))
+
+
+@lru_cache(maxsize=1)
+def _loader_code_version() -> str:
+    """Hash of the loader/model source, so a code change invalidates the snapshot."""
+    digest = hashlib.md5()
+    for path in _LOADER_SOURCES:
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def _load_data_loader(use_snapshot: bool = True):
+    """
+    TeamDataLoader with all data loaded, restored from the pickled snapshot in
+    _LOADER_SNAPSHOT when neither the source CSVs nor the loader code changed
+    since it was written.
+    """
+    global _LOADER_RESTORED
+    from models.team_data_loader import TeamDataLoader
     
-    logger.info("Initializing tier-based prediction model...")
+    loader = TeamDataLoader()
+    key = (_loader_code_version(), _source_mtimes(loader))
+    if use_snapshot:
+        try:
+            with open(_LOADER_SNAPSHOT, "rb") as f:
+                snapshot = pickle.load(f)
+            if snapshot["key"] == key:
+                _LOADER_RESTORED = True
+                return snapshot["loader"]
+        except Exception:  # no snapshot yet, or unreadable
+            pass
     
+    _LOADER_RESTORED = False
+    loader.load_all_data()
     try:
-        from models.tier_based_predictor import TierBasedPredictor
-        from models.team_data_loader import TeamDataLoader
-        
-        _TIER_MODEL = TierBasedPredictor()
-        _DATA_LOADER = TeamDataLoader()
-        _DATA_LOADER.load_all_data()
-        
-        logger.info("✓ Tier-based model initialized")
+        _LOADER_SNAPSHOT.parent.mkdir(parents=True, exist_ok=True)
+        with open(_LOADER_SNAPSHOT, "wb") as f:
+            pickle.dump({"key": key, "loader": loader}, f)
     except Exception as e:
-        logger.error(f"Failed to load tier-based model: {e}")
-        logger.info("Falling back to simple heuristic model")
-        global _USE_TIER_MODEL
-        _USE_TIER_MODEL = False
+        logger.debug(f"Could not write {_LOADER_SNAPSHOT}: {e}")
+    return loader
+
+
+def _rebuild_data_loader():
+    """Replace a snapshot-restored _DATA_LOADER with a freshly loaded one."""
+    global _DATA_LOADER
+    with _INIT_LOCK:
+        if _LOADER_RESTORED:
+            logger.warning(f"Stale {_LOADER_SNAPSHOT}; rebuilding the data loader")
+            _DATA_LOADER = _load_data_loader(use_snapshot=False)
+    clear_factor_cache()
+
+
+@lru_cache(maxsize=512)
+def _get_factors_cached(team: str, is_home: bool = True):
+    """In-process memo of the loader's TeamFactors (frozen, so sharing is safe)."""
+    try:
+        return _DATA_LOADER.get_team_factors(team, is_home=is_home)
+    except AttributeError:
+        if not _LOADER_RESTORED:
+            raise
+        # A snapshot that doesn't match the current loader code: rebuild it
+        # rather than letting the caller drop to the heuristic
+        _rebuild_data_loader()
+        return _DATA_LOADER.get_team_factors(team, is_home=is_home)
+
+
+def clear_factor_cache():
+    """Drop the in-process TeamFactors memo (e.g. after the source CSVs change)."""
+    _get_factors_cached.cache_clear()
+
+
+def _heuristic_probs(home_wp: np.ndarray, away_wp: np.ndarray) -> np.ndarray:
+    """Fallback home win probabilities from win% arrays (+3.5% home court)."""
+    home_prob = 0.5 + (home_wp - away_wp) * 0.5 + 0.035
+    return np.clip(home_prob, 0.01, 0.99)
+
+
+if NUMBA_AVAILABLE:
+    _heuristic_probs = njit(cache=True, fastmath=True)(_heuristic_probs)
 
 
 def get_team_stats(team: str) -> dict:
@@ -63,9 +184,9 @@ def get_team_stats(team: str) -> dict:
         init_model()
     
     try:
-        factors = _DATA_LOADER.get_team_factors(team)
+        factors = _get_factors_cached(team)
         return {
-            "win_pct": factors.last_10_record[0] / 10 if sum(factors.last_10_record) > 0 else 0.500,
+            "win_pct": factors.last_10_wp,
             "off_rating": factors.offensive_rating,
             "def_rating": factors.defensive_rating,
             "net_rating": factors.net_rating,
@@ -101,7 +222,7 @@ def predict_game(home_team: str, away_team: str, game_date: str = None) -> dict:
         game_date = datetime.now().strftime("%Y-%m-%d")
     
     try:
-        game_date_dt = pd.to_datetime(game_date)
+        datetime.strptime(game_date, "%Y-%m-%d")
     except Exception:
         raise ValueError(f"Invalid date format: {game_date}. Use YYYY-MM-DD")
     
@@ -109,22 +230,22 @@ def predict_game(home_team: str, away_team: str, game_date: str = None) -> dict:
     if _USE_TIER_MODEL and _DATA_LOADER is not None:
         try:
             # Get team factors
-            home_factors = _DATA_LOADER.get_team_factors(home_team, is_home=True, opponent=away_team)
-            away_factors = _DATA_LOADER.get_team_factors(away_team, is_home=False, opponent=home_team)
+            home_factors = _get_factors_cached(home_team, True)
+            away_factors = _get_factors_cached(away_team, False)
             
             # Make prediction
-            prediction = _TIER_MODEL.predict_game(home_factors, away_factors)
+            prediction = _TIER_MODEL.predict_game(home_factors, away_factors, return_breakdown=True)
             
             return {
                 "home_team": home_team,
                 "away_team": away_team,
                 "game_date": game_date,
-                "home_win_probability": prediction['home_win_probability'],
-                "away_win_probability": prediction['away_win_probability'],
-                "predicted_winner": home_team if prediction['home_win_probability'] > 0.5 else away_team,
-                "confidence": prediction['confidence'],
+                "home_win_probability": prediction.home_win_probability,
+                "away_win_probability": prediction.away_win_probability,
+                "predicted_winner": home_team if prediction.home_win_probability > 0.5 else away_team,
+                "confidence": prediction.confidence,
                 "model_type": "tier_based",
-                "breakdown": prediction.get('breakdown', {}),
+                "breakdown": prediction.breakdown,
                 "model_features": {
                     "home_tier": home_factors.overall_tier.name,
                     "away_tier": away_factors.overall_tier.name,
@@ -143,8 +264,7 @@ def predict_game(home_team: str, away_team: str, game_date: str = None) -> dict:
     
     home_wp = home_stats.get('win_pct', 0.5)
     away_wp = away_stats.get('win_pct', 0.5)
-    home_prob = 0.5 + (home_wp - away_wp) * 0.5 + 0.035
-    home_prob = max(0.01, min(0.99, home_prob))
+    home_prob = float(_heuristic_probs(np.array([home_wp], dtype=float), np.array([away_wp], dtype=float))[0])
     
     return {
         "home_team": home_team,
@@ -162,28 +282,166 @@ def predict_game(home_team: str, away_team: str, game_date: str = None) -> dict:
     }
 
 
-def format_prediction(prediction: dict) -> str:
-    """Format prediction as readable string."""
-    output = f"""
-{prediction['home_team']} vs {prediction['away_team']} ({prediction['game_date']})
-  {prediction['home_team']:15s} {prediction['home_win_probability']:6.1%} win
-  {prediction['away_team']:15s} {prediction['away_win_probability']:6.1%} win
+def predict_games_batch(games: list) -> pd.DataFrame:
+    """
+    Predict many games at once through the tier model's vectorized path.
+    
+    Args:
+        games: (home_team, away_team, game_date) tuples; game_date may be None
+            for today
+        
+    Returns:
+        DataFrame with one row per game and predict_game's fields as columns
+        (home_team, away_team, game_date, home_win_probability,
+        away_win_probability, predicted_winner, confidence, model_type) plus
+        its model_features flattened into columns
+    """
+    if _TIER_MODEL is None:
+        init_model()
+    
+    today = datetime.now().strftime("%Y-%m-%d")
+    out = pd.DataFrame({
+        "home_team": [g[0] for g in games],
+        "away_team": [g[1] for g in games],
+        "game_date": [g[2] if g[2] is not None else today for g in games],
+    }, dtype=object)
+    
+    # Validate each distinct date once
+    for game_date in out["game_date"].unique():
+        try:
+            datetime.strptime(game_date, "%Y-%m-%d")
+        except Exception:
+            raise ValueError(f"Invalid date format: {game_date}. Use YYYY-MM-DD")
+    
+    home_prob = None
+    if _USE_TIER_MODEL and _DATA_LOADER is not None and len(out):
+        try:
+            home_factors = [_get_factors_cached(t, True) for t in out["home_team"]]
+            away_factors = [_get_factors_cached(t, False) for t in out["away_team"]]
+            
+            prediction = _TIER_MODEL.predict_games_batch(
+                _TIER_MODEL.factors_to_array(home_factors),
+                _TIER_MODEL.factors_to_array(away_factors),
+            )
+            home_prob = prediction["home_win_probability"]
+            confidence = prediction["confidence"]
+            out["model_type"] = "tier_based"
+            out["home_tier"] = [f.overall_tier.name for f in home_factors]
+            out["away_tier"] = [f.overall_tier.name for f in away_factors]
+            out["home_net_rating"] = [f.net_rating for f in home_factors]
+            out["away_net_rating"] = [f.net_rating for f in away_factors]
+            out["home_injuries"] = [f.key_players_out for f in home_factors]
+            out["away_injuries"] = [f.key_players_out for f in away_factors]
+        except Exception as e:
+            logger.warning(f"Tier model failed: {e}. Using fallback.")
+    
+    if home_prob is None:
+        # Fallback to simple heuristic
+        home_wp = np.array([get_team_stats(t).get('win_pct', 0.5) for t in out["home_team"]], dtype=float)
+        away_wp = np.array([get_team_stats(t).get('win_pct', 0.5) for t in out["away_team"]], dtype=float)
+        home_prob = _heuristic_probs(home_wp, away_wp)
+        confidence = np.abs(home_prob - 0.5) * 2
+        out["model_type"] = "simple_heuristic"
+        out["home_win_pct"] = home_wp
+        out["away_win_pct"] = away_wp
+    
+    out.insert(3, "home_win_probability", home_prob)
+    out.insert(4, "away_win_probability", 1 - home_prob)
+    out.insert(5, "predicted_winner", np.where(home_prob > 0.5, out["home_team"], out["away_team"]))
+    out.insert(6, "confidence", confidence)
+    return out
+
+
+def _data_version() -> str:
+    """Short hash of the loader/model code and source CSV mtimes; changes whenever either does."""
+    return hashlib.md5(repr((_loader_code_version(), _source_mtimes())).encode()).hexdigest()[:12]
+
+
+def predict_games_cached(games: list) -> pd.DataFrame:
+    """
+    predict_games_batch with results persisted across runs in _PREDICTION_CACHE.
+    
+    Games already predicted against the current data version are read back;
+    only the rest are predicted and appended. Entries from older data versions
+    are dropped. Heuristic fallback predictions are never persisted, and the
+    cache is bypassed entirely when the tier model failed to initialize.
+    
+    Args:
+        games: (home_team, away_team, game_date) tuples; game_date may be None
+            for today
+        
+    Returns:
+        predict_games_batch's DataFrame, one row per game in input order
+    """
+    if _TIER_MODEL is None:
+        init_model()
+    if _DATA_LOADER is None:
+        return predict_games_batch(games)
+    
+    today = datetime.now().strftime("%Y-%m-%d")
+    games = [(home, away, date if date is not None else today) for home, away, date in games]
+    version = _data_version()
+    
+    cached, stale = {}, False
+    try:
+        with open(_PREDICTION_CACHE) as f:
+            for line in f:
+                row = json.loads(line)
+                if row.pop("data_version", None) == version:
+                    cached[(row["home_team"], row["away_team"], row["game_date"])] = row
+                else:
+                    stale = True
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError) as e:
+        logger.debug(f"Ignoring unreadable {_PREDICTION_CACHE}: {e}")
+        cached, stale = {}, True
+    
+    missing = list(dict.fromkeys(g for g in games if g not in cached))
+    fresh = predict_games_batch(missing).to_dict("records") if missing else []
+    for game, row in zip(missing, fresh):
+        cached[game] = row
+    
+    if fresh or stale:
+        try:
+            _PREDICTION_CACHE.parent.mkdir(parents=True, exist_ok=True)
+            # Rewrite when dropping stale entries, otherwise just append
+            rows = cached.values() if stale else fresh
+            with open(_PREDICTION_CACHE, "w" if stale else "a") as f:
+                for row in rows:
+                    if row["model_type"] == "simple_heuristic":
+                        continue
+                    f.write(json.dumps({**row, "data_version": version}, default=lambda o: o.item()) + "\n")
+        except OSError as e:
+            logger.debug(f"Could not write {_PREDICTION_CACHE}: {e}")
+    
+    return pd.DataFrame([cached[g] for g in games])
+
+
+_PREDICTION_TEMPLATE = """{home_team} vs {away_team} ({game_date})
+  {home_team:15s} {home_win_probability:6.1%} win
+  {away_team:15s} {away_win_probability:6.1%} win
   
-  Prediction: {prediction['predicted_winner']} (confidence: {prediction['confidence']:5.1%})
-  Model: {prediction.get('model_type', 'unknown')}
+  Prediction: {predicted_winner} (confidence: {confidence:5.1%})
+  Model: {model_type}
 """
+
+
+def format_prediction(prediction: dict) -> str:
+    """Format prediction as readable string."""
+    lines = [_PREDICTION_TEMPLATE.format_map({**prediction, 'model_type': prediction.get('model_type', 'unknown')})]
     
     # Add tier info if available
     if 'model_features' in prediction:
         features = prediction['model_features']
         if 'home_tier' in features:
-            output += f"\n  Tiers: {features['home_tier']} vs {features['away_tier']}"
+            lines.append("  Tiers: {home_tier} vs {away_tier}".format_map(features))
         if 'home_net_rating' in features:
-            output += f"\n  Net Ratings: {features['home_net_rating']:+.1f} vs {features['away_net_rating']:+.1f}"
+            lines.append("  Net Ratings: {home_net_rating:+.1f} vs {away_net_rating:+.1f}".format_map(features))
         if 'home_injuries' in features:
-            output += f"\n  Key Injuries: {features['home_injuries']} vs {features['away_injuries']}"
+            lines.append("  Key Injuries: {home_injuries} vs {away_injuries}".format_map(features))
     
-    return output.strip()
+    return "\n".join(lines).strip()
 
 
 if __name__ == "__main__":
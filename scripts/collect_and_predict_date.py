@@ -13,17 +13,27 @@ REPO_ROOT = Path(__file__).resolve().parents[1]
 if str(REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(REPO_ROOT))
 
-import pandas as pd
-
-from data.game_context_collector import ScheduleFetcher, InjuryReportScraper, GameToGameDataCollector
-from predictor import predict_game, init_model
+# pandas, the scrapers and the model stack are imported where they are used,
+# so the usage/validation paths start instantly
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+# Schedule column -> accepted source names, in order of preference
+_COL_ALIASES = {
+    'game_date': ['game_date', 'date'],
+    'home_team': ['home_team', 'home', 'homeTeam'],
+    'away_team': ['away_team', 'away', 'awayTeam'],
+}
+
+
 def fetch_schedule_for_date(target_date: str):
     """Return list of games for target_date. Each game is dict with home_team, away_team, game_date."""
+    import numpy as np
+    import pandas as pd
+    from data.game_context_collector import ScheduleFetcher
+
     logger.info(f"Fetching schedule for {target_date}...")
     # Try ScheduleFetcher.get_upcoming_games for the next few days and filter
     df = ScheduleFetcher.get_upcoming_games(days_ahead=3)
@@ -31,19 +41,19 @@ def fetch_schedule_for_date(target_date: str):
         logger.warning("ScheduleFetcher returned no games (nba_api may be unavailable).")
         return []
 
-    # Normalize column names
-    if 'game_date' not in df.columns and 'date' in df.columns:
-        df = df.rename(columns={'date': 'game_date'})
+    # Normalize column names: first alias present wins
+    for col, aliases in _COL_ALIASES.items():
+        present = next((a for a in aliases if a in df.columns), None)
+        if present is None:
+            df = df.assign(**{col: None})
+        elif present != col:
+            df = df.rename(columns={present: col})
 
-    games = []
-    for _, row in df.iterrows():
-        gd = str(row.get('game_date'))
-        if gd.startswith(target_date):
-            games.append({
-                'game_date': target_date,
-                'home_team': row.get('home_team') or row.get('home') or row.get('homeTeam'),
-                'away_team': row.get('away_team') or row.get('away') or row.get('awayTeam'),
-            })
+    # Compare calendar days as datetime64[D]; unparseable dates become NaT and never match
+    days = pd.to_datetime(df['game_date'].astype(str).str[:10], format="%Y-%m-%d", errors="coerce")
+    mask = days.to_numpy(dtype='datetime64[D]') == np.datetime64(target_date, 'D')
+    games = df.loc[mask, ['home_team', 'away_team']].assign(game_date=target_date)
+    games = games[['game_date', 'home_team', 'away_team']].to_dict('records')
 
     logger.info(f"Found {len(games)} games on {target_date}")
     return games
@@ -61,6 +71,10 @@ def main():
         print("Invalid date format. Use YYYY-MM-DD")
         return
 
+    import pandas as pd
+    from data.game_context_collector import ScheduleFetcher, InjuryReportScraper
+    from predictor import predict_games_cached, init_model
+
     # Run injury scraper (attempt)
     logger.info("Running injury scraper (ESPN)...")
     injuries = InjuryReportScraper.scrape_espn_injuries()
@@ -87,27 +101,23 @@ def main():
     except Exception as e:
         logger.warning(f"init_model raised: {e} — continuing with fallback model if available")
 
-    # Predict for each game
-    rows = []
-    for g in games:
-        home = g['home_team']
-        away = g['away_team']
-        try:
-            pred = predict_game(home, away, g['game_date'])
-            rows.append({
-                'date': g['game_date'],
-                'home': home,
-                'away': away,
-                'home_win%': f"{pred['home_win_probability']*100:.1f}%",
-                'away_win%': f"{pred['away_win_probability']*100:.1f}%",
-                'predicted_winner': pred['predicted_winner'],
-                'confidence': f"{pred['confidence']*100:.1f}%",
-            })
-        except Exception as e:
-            logger.error(f"Prediction failed for {home} vs {away}: {e}")
-
-    if rows:
-        df_out = pd.DataFrame(rows)
+    # Predict every game in one vectorized pass (reusing cached predictions)
+    try:
+        preds = predict_games_cached([(g['home_team'], g['away_team'], g['game_date']) for g in games])
+    except Exception as e:
+        logger.error(f"Prediction failed: {e}")
+        preds = pd.DataFrame()
+
+    if len(preds):
+        df_out = pd.DataFrame({
+            'date': preds['game_date'],
+            'home': preds['home_team'],
+            'away': preds['away_team'],
+            'home_win%': (preds['home_win_probability'] * 100).map('{:.1f}%'.format),
+            'away_win%': (preds['away_win_probability'] * 100).map('{:.1f}%'.format),
+            'predicted_winner': preds['predicted_winner'],
+            'confidence': (preds['confidence'] * 100).map('{:.1f}%'.format),
+        })
         print(df_out.to_string(index=False))
     else:
         print("No predictions produced.")
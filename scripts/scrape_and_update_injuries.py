@@ -4,11 +4,12 @@ This script is suitable for running in CI (GitHub Actions) or locally.
 It will attempt to scrape ESPN, and if that returns no data, leave existing CSV untouched.
 If new data is found, it will overwrite `data/injury_reports/current_injuries.csv`.
 """
-import csv
 from datetime import datetime
 from pathlib import Path
 import logging
 
+import pandas as pd
+
 from data.game_context_collector import InjuryReportScraper
 
 logging.basicConfig(level=logging.INFO)
@@ -16,30 +17,25 @@ logger = logging.getLogger(__name__)
 
 
 def write_csv(injuries_by_team, out_path: Path):
-    rows = []
     today = datetime.now().strftime("%Y-%m-%d")
+    columns = {"team": [], "player": [], "status": [], "details": [], "date_updated": []}
     for team, players in injuries_by_team.items():
         for p in players:
-            rows.append({
-                "team": team,
-                "player": p.get("player") or p.get("name") or "",
-                "status": p.get("status", ""),
-                "details": p.get("details", ""),
-                "date_updated": p.get("date_updated", today),
-            })
-
-    if not rows:
+            columns["team"].append(team)
+            columns["player"].append(p.get("player") or p.get("name") or "")
+            columns["status"].append(p.get("status", ""))
+            columns["details"].append(p.get("details", ""))
+            columns["date_updated"].append(p.get("date_updated", today))
+
+    n_rows = len(columns["team"])
+    if not n_rows:
         logger.info("No injury rows to write.")
         return False
 
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    with out_path.open("w", newline='', encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=["team", "player", "status", "details", "date_updated"])
-        writer.writeheader()
-        for r in rows:
-            writer.writerow(r)
+    pd.DataFrame(columns).to_csv(out_path, index=False, encoding="utf-8")
 
-    logger.info(f"Wrote {len(rows)} injury rows to {out_path}")
+    logger.info(f"Wrote {n_rows} injury rows to {out_path}")
     return True
 
 
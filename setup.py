@@ -6,7 +6,7 @@ setup(
     description="Machine learning model for identifying high-value NBA parlays",
     author="Your Name",
     packages=find_packages(),
-    python_requires=">=3.8",
+    python_requires=">=3.10",
     install_requires=[
         "pandas>=2.0.0",
         "numpy>=1.24.0",
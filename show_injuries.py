@@ -4,8 +4,13 @@ import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+import pandas as pd
+
 from data.espn_stats_scraper import get_injuries
 
+# Statuses shown first, in this order, with the full table layout
+STATUS_ORDER = ["Out", "Out For Season", "Out Indefinitely", "Doubtful", "Questionable", "Day-To-Day"]
+
 print("\n" + "="*80)
 print("NBA INJURY REPORT - ALL ACTIVE INJURIES")
 print("="*80)
@@ -16,51 +21,43 @@ if not injuries:
     print("\n  No injury data available from ESPN API")
     print("  (Endpoint may require authentication or be temporarily unavailable)")
 else:
-    # Group by status
-    by_status = {}
-    for inj in injuries:
-        status = inj.get("status", "Unknown")
-        by_status.setdefault(status, []).append(inj)
+    df = pd.DataFrame(injuries)
     
-    # Show each status category
-    for status in ["Out", "Out For Season", "Out Indefinitely", "Doubtful", "Questionable", "Day-To-Day"]:
-        if status in by_status:
-            print(f"\n{'─'*80}")
-            print(f"{status.upper()} ({len(by_status[status])} players)")
-            print(f"{'─'*80}")
-            print(f"{'TEAM':<6} {'PLAYER':<28} {'POS':<5} {'INJURY':<30}")
-            print(f"{'─'*80}")
-            
-            for inj in by_status[status]:
-                team = inj.get('team_abbr', '???')
-                player = inj.get('player', 'Unknown')[:27]
-                pos = inj.get('position', '?')
-                
-                # Build injury description
-                injury_parts = []
-                if inj.get('side'):
-                    injury_parts.append(inj['side'])
-                if inj.get('detail'):
-                    injury_parts.append(inj['detail'])
-                elif inj.get('type'):
-                    injury_parts.append(inj['type'])
-                
-                injury_desc = ' '.join(injury_parts)[:29]
-                
-                print(f"{team:<6} {player:<28} {pos:<5} {injury_desc:<30}")
+    def column(name, default):
+        """String column with missing keys/values replaced by default."""
+        values = df[name] if name in df.columns else pd.Series(None, index=df.index, dtype=object)
+        return values.fillna(default).astype(str)
     
-    # Show any other statuses
-    other_statuses = [s for s in by_status.keys() 
-                     if s not in ["Out", "Out For Season", "Out Indefinitely", 
-                                  "Doubtful", "Questionable", "Day-To-Day"]]
+    team = column('team_abbr', '???')
+    player = column('player', 'Unknown')
+    pos = column('position', '?')
+    detail = column('detail', '')
     
-    for status in other_statuses:
+    # Injury description: side, then detail (or type if no detail)
+    side = column('side', '')
+    cause = detail.where(detail != '', column('type', ''))
+    sep = ((side != '') & (cause != '')).map({True: ' ', False: ''})
+    injury_desc = (side + sep + cause).str[:29]
+    
+    # Known statuses first, then any others in order of appearance
+    statuses = column('status', 'Unknown')
+    others = [s for s in statuses.unique() if s not in STATUS_ORDER]
+    statuses = pd.Categorical(statuses, categories=STATUS_ORDER + others)
+    
+    for status, grp in df.groupby(statuses, observed=True, sort=True):
+        idx = grp.index
         print(f"\n{'─'*80}")
-        print(f"{status.upper()} ({len(by_status[status])} players)")
+        print(f"{status.upper()} ({len(idx)} players)")
         print(f"{'─'*80}")
-        for inj in by_status[status]:
-            print(f"  {inj.get('team_abbr', '???'):<6} {inj.get('player', 'Unknown'):<28} "
-                  f"{inj.get('position', '?'):<5} {inj.get('detail', '')}")
+        if status in STATUS_ORDER:
+            print(f"{'TEAM':<6} {'PLAYER':<28} {'POS':<5} {'INJURY':<30}")
+            print(f"{'─'*80}")
+            lines = (team[idx].str.ljust(6) + " " + player[idx].str[:27].str.ljust(28) + " "
+                     + pos[idx].str.ljust(5) + " " + injury_desc[idx].str.ljust(30))
+        else:
+            lines = ("  " + team[idx].str.ljust(6) + " " + player[idx].str.ljust(28) + " "
+                     + pos[idx].str.ljust(5) + " " + detail[idx])
+        print("\n".join(lines))
     
     print(f"\n{'='*80}")
     print(f"TOTAL INJURIES: {len(injuries)} players")
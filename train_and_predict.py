@@ -2,14 +2,55 @@
 import pandas as pd
 import numpy as np
 import logging
+import joblib
 from pathlib import Path
 from datetime import datetime
 from models.game_predictor import GamePredictor
 from analysis.feature_engineering import FeatureEngineer
 
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
 
+# Columns of historical_games.csv the pipeline reads (plus any model features)
+_GAME_COLS = {"game_date", "home_team", "away_team", "home_score", "away_score", "home_win"}
+
+# Per-team (dates, wins, pts_for, pts_against) for a team with no games
+_EMPTY_STATE = (np.array([], dtype="datetime64[ns]"), np.zeros(1), np.zeros(1), np.zeros(1))
+
+# Recent-form window of FeatureEngineer.compute_recent_form, in nanoseconds
+_RECENT_NS = pd.Timedelta(days=14).value
+
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, nogil=True, cache=True)
+    def _side_features(team_idx, days, cutoffs, placeholder_win, offsets, dates, wins, pts_for, pts_against, out):
+        """
+        _game_features for one side of every game, over the flattened team state.
+        
+        Team t's dates (int64 ns) are dates[offsets[t]:offsets[t + 1]] and its
+        running totals (with the leading 0) start at offsets[t] + t. Writes
+        season win pct, points differential and recent win pct to out[i].
+        """
+        for i in prange(team_idx.size):
+            t = team_idx[i]
+            team_dates = dates[offsets[t]:offsets[t + 1]]
+            base = offsets[t] + t
+            n = np.searchsorted(team_dates, days[i])
+            lo = np.searchsorted(team_dates, cutoffs[i])
+            if n:
+                out[i, 0] = wins[base + n] / n
+                out[i, 1] = pts_for[base + n] / n - pts_against[base + n] / n
+            else:
+                out[i, 0] = 0.5
+                out[i, 1] = 0.0
+            out[i, 2] = (wins[base + n] - wins[base + lo] + placeholder_win) / (n - lo + 1)
+
 
 class GamePredictionPipeline:
     """End-to-end pipeline for training and making game predictions."""
@@ -20,9 +61,16 @@ class GamePredictionPipeline:
             model_path: Path to save/load trained model
         """
         self.model_path = Path(model_path)
+        # History and per-team state saved by train(), next to the model
+        self.games_snapshot_path = self.model_path.parent / "historical_games.parquet"
+        self.team_state_path = self.model_path.parent / "team_state.joblib"
         self.predictor = None
         self.games_df = None
         self.team_stats = None
+        self._team_state = {}  # team -> date-indexed running totals, see _build_team_state
+        self._all_teams = None  # Every team in games_df, for validating predict_game input
+        self._pred_buf = None  # Reused float32 feature matrix for predict_batch
+        self._team_arrays = None  # _team_state flattened for _side_features (built on first use)
 
     def train(self, data_path: str = "data/processed/historical_games.csv"):
         """
@@ -39,17 +87,16 @@ class GamePredictionPipeline:
         logger.info("=" * 60)
         
         # Load historical games
-        logger.info(f"Loading historical games from {data_path}...")
-        games_df = pd.read_csv(data_path)
-        logger.info(f"Loaded {len(games_df)} games")
+        logger.info("Loading historical games from %s...", data_path)
+        games_df = self._read_games(data_path)
+        logger.info("Loaded %d games", len(games_df))
         
-        # Convert game_date to datetime
-        games_df["game_date"] = pd.to_datetime(games_df["game_date"])
         games_df = games_df.sort_values("game_date").reset_index(drop=True)
         
         # Compute team season stats (cumulative as of each game)
         logger.info("Computing team season stats...")
-        self.games_df = games_df.copy()
+        self.games_df = games_df
+        self._build_team_state()
         
         # Feature engineering
         logger.info("Engineering features...")
@@ -62,22 +109,23 @@ class GamePredictionPipeline:
             "home_recent_win_pct", "away_recent_win_pct", "home_win"
         ]
         
-        logger.info(f"Dataset shape: {df_featured.shape}")
-        logger.info(f"Features created: {[c for c in df_featured.columns if c not in games_df.columns]}")
+        logger.info("Dataset shape: %s", df_featured.shape)
+        logger.info("Features created: %s", [c for c in df_featured.columns if c not in games_df.columns])
         
-        # Check for missing values
-        missing = df_featured[required_features].isnull().sum()
-        if missing.any():
-            logger.warning(f"Missing values before dropna: {missing[missing > 0].to_dict()}")
+        # Check for missing values (per-column counts only if there are any)
+        is_missing = df_featured[required_features].isnull()
+        if is_missing.to_numpy().any():
+            missing = is_missing.sum()
+            logger.warning("Missing values before dropna: %s", missing[missing > 0].to_dict())
             df_featured = df_featured.dropna(subset=required_features)
-            logger.info(f"After dropna: {len(df_featured)} games remain")
+            logger.info("After dropna: %d games remain", len(df_featured))
         
         if len(df_featured) < 50:
             logger.error("Insufficient training data")
             return None
         
         # Train model
-        logger.info(f"Training XGBoost classifier on {len(df_featured)} games...")
+        logger.info("Training XGBoost classifier on %d games...", len(df_featured))
         self.predictor = GamePredictor()
         results = self.predictor.train(df_featured, test_size=0.2)
         
@@ -85,10 +133,10 @@ class GamePredictionPipeline:
         logger.info("\n" + "=" * 60)
         logger.info("TRAINING RESULTS")
         logger.info("=" * 60)
-        logger.info(f"Train AUC:        {results['train_auc']:.4f}")
-        logger.info(f"Test AUC:         {results['test_auc']:.4f}")
-        logger.info(f"CV Mean:          {results['cv_mean']:.4f} (±{results['cv_std']:.4f})")
-        logger.info(f"Best Threshold:   {results.get('best_threshold', 0.5):.4f}")
+        logger.info("Train AUC:        %.4f", results['train_auc'])
+        logger.info("Test AUC:         %.4f", results['test_auc'])
+        logger.info("CV Mean:          %.4f (±%.4f)", results['cv_mean'], results['cv_std'])
+        logger.info("Best Threshold:   %.4f", results.get('best_threshold', 0.5))
         
         # Feature importance
         importance_dict = self.predictor.get_feature_importance()
@@ -101,17 +149,22 @@ class GamePredictionPipeline:
         
         logger.info("\nTop 10 Feature Importances:")
         logger.info("-" * 40)
-        for idx, row in importance_df.head(10).iterrows():
-            logger.info(f"  {idx+1:2d}. {row['feature']:30s} {row['importance']:7.4f}")
+        top = importance_df.head(10)
+        for idx, (feature, importance) in enumerate(zip(top["feature"], top["importance"]), start=1):
+            logger.info("  %2d. %-30s %7.4f", idx, feature, importance)
         
         # Save model
         self.model_path.parent.mkdir(parents=True, exist_ok=True)
         self.predictor.save(str(self.model_path))
-        logger.info(f"\nModel saved to: {self.model_path}")
+        logger.info("\nModel saved to: %s", self.model_path)
+        
+        # Save history and per-team state so load_model can skip the CSV
+        self.games_df.to_parquet(self.games_snapshot_path, index=False)
+        joblib.dump({"team_state": self._team_state, "all_teams": self._all_teams}, self.team_state_path)
         
         # Save feature importance
         importance_df.to_csv(self.model_path.parent / "feature_importance.csv", index=False)
-        logger.info(f"Feature importance saved to: {self.model_path.parent / 'feature_importance.csv'}")
+        logger.info("Feature importance saved to: %s", self.model_path.parent / "feature_importance.csv")
         
         logger.info("=" * 60)
         logger.info("TRAINING COMPLETE ✓")
@@ -122,22 +175,159 @@ class GamePredictionPipeline:
     def load_model(self):
         """Load trained model from disk."""
         if not self.model_path.exists():
-            logger.error(f"Model not found at {self.model_path}")
+            logger.error("Model not found at %s", self.model_path)
             return False
         
-        logger.info(f"Loading model from {self.model_path}...")
+        logger.info("Loading model from %s...", self.model_path)
         self.predictor = GamePredictor()
         self.predictor.load(str(self.model_path))
         logger.info("Model loaded ✓")
         
-        # Reload historical games for stats reference
+        # Reload historical games for stats reference: train()'s snapshot,
+        # unless the CSV has changed since it was written
         games_path = Path("data/processed/historical_games.csv")
-        if games_path.exists():
-            self.games_df = pd.read_csv(games_path)
-            self.games_df["game_date"] = pd.to_datetime(self.games_df["game_date"])
+        snapshot_current = (self.games_snapshot_path.exists() and self.team_state_path.exists() and (
+            not games_path.exists() or self.games_snapshot_path.stat().st_mtime >= games_path.stat().st_mtime))
+        if snapshot_current:
+            self.games_df = pd.read_parquet(self.games_snapshot_path, engine="pyarrow")
+            state = joblib.load(self.team_state_path, mmap_mode="r")
+            self._team_state, self._all_teams = state["team_state"], state["all_teams"]
+            self._team_arrays = None
+        elif games_path.exists():
+            self.games_df = self._read_games(games_path)
+            self._build_team_state()
         
         return True
 
+    @staticmethod
+    def _read_games(path) -> pd.DataFrame:
+        """
+        Read a historical games CSV: only the game columns and model features,
+        team names as categoricals and game_date parsed while reading.
+        """
+        games_df = pd.read_csv(
+            path,
+            usecols=lambda col: col in _GAME_COLS or col in GamePredictor.FEATURE_COLS,
+            dtype={"home_team": "category", "away_team": "category"},
+            parse_dates=["game_date"],
+        )
+        return GamePredictionPipeline._compact_dtypes(games_df)
+
+    @staticmethod
+    def _compact_dtypes(games_df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Store team names as one shared categorical, scores as int16 and
+        home_win as int8 (score/result columns with missing values are left
+        as they are).
+        """
+        teams = pd.CategoricalDtype(sorted(set(games_df["home_team"].dropna()) | set(games_df["away_team"].dropna())))
+        games_df = games_df.astype({"home_team": teams, "away_team": teams})
+        for col, dtype in (("home_score", np.int16), ("away_score", np.int16), ("home_win", np.int8)):
+            if games_df[col].notna().all():
+                games_df[col] = games_df[col].astype(dtype)
+        return games_df
+
+    def _build_team_state(self):
+        """
+        Index every team's game log by date with running totals, and collect
+        the set of known teams.
+        
+        For each team in games_df, stores its sorted game dates alongside
+        cumulative wins, points scored and points allowed (each with a leading
+        0), so the season and recent-form features for a new game on any date
+        come from two binary searches instead of re-featurizing the history.
+        """
+        self._team_state = {}
+        self._all_teams = None
+        self._team_arrays = None
+        if self.games_df is None:
+            return
+        
+        df = self.games_df
+        home, away = df["home_team"], df["away_team"]
+        if isinstance(home.dtype, pd.CategoricalDtype) and isinstance(away.dtype, pd.CategoricalDtype):
+            # Read off the category metadata instead of scanning every game
+            self._all_teams = frozenset(home.cat.categories).union(away.cat.categories)
+        else:
+            self._all_teams = frozenset(home.unique()).union(away.unique())
+        home_win = df["home_win"]
+        home_score = df["home_score"].to_numpy(dtype=float)
+        away_score = df["away_score"].to_numpy(dtype=float)
+        
+        # One row per team-game, seen from that team's side
+        log = pd.DataFrame({
+            "team": np.concatenate([df["home_team"].to_numpy(), df["away_team"].to_numpy()]),
+            "game_date": np.tile(df["game_date"].to_numpy(dtype="datetime64[ns]"), 2),
+            "win": np.concatenate([home_win.fillna(0).to_numpy(dtype=float),
+                                   (home_win == False).to_numpy(dtype=float)]),
+            "pts_for": np.concatenate([home_score, away_score]),
+            "pts_against": np.concatenate([away_score, home_score]),
+        }).sort_values("game_date", kind="stable")
+        
+        for team, games in log.groupby("team", sort=False):
+            self._team_state[team] = (
+                games["game_date"].to_numpy(),
+                np.concatenate([[0.0], np.cumsum(games["win"].to_numpy())]),
+                # Missing scores are skipped, as in FeatureEngineer's sums
+                np.concatenate([[0.0], np.nancumsum(games["pts_for"].to_numpy())]),
+                np.concatenate([[0.0], np.nancumsum(games["pts_against"].to_numpy())]),
+            )
+
+    def _game_features(self, home_team: str, away_team: str, game_date: pd.Timestamp) -> dict:
+        """
+        Feature row for a new game, read from _team_state.
+        
+        Matches the last row of FeatureEngineer.add_game_features over the
+        games before game_date plus this game: season stats use every prior
+        game, and recent form uses the 14 days up to game_date, including the
+        game itself with its placeholder home_win=0.
+        """
+        day = np.datetime64(game_date, "ns")
+        cutoff = np.datetime64(game_date - pd.Timedelta(days=14), "ns")
+        row = {"is_home": 1}
+        for side, team in (("home", home_team), ("away", away_team)):
+            dates, wins, pts_for, pts_against = self._team_state.get(team, _EMPTY_STATE)
+            n = int(np.searchsorted(dates, day, side="left"))
+            lo = int(np.searchsorted(dates, cutoff, side="left"))
+            row[f"{side}_season_win_pct"] = wins[n] / n if n else 0.5
+            row[f"{side}_pts_differential"] = pts_for[n] / n - pts_against[n] / n if n else 0.0
+            # The placeholder result is a loss for the home side, a win for the away side
+            row[f"{side}_recent_win_pct"] = (wins[n] - wins[lo] + (side == "away")) / (n - lo + 1)
+        
+        # Other model features in the history are blank on the new game's row
+        for col in GamePredictor.FEATURE_COLS:
+            if col not in row and col in self.games_df.columns:
+                row[col] = np.nan
+        return row
+
+    def _flat_team_state(self):
+        """(team index, offsets, dates, wins, pts_for, pts_against) over all of _team_state, concatenated."""
+        if self._team_arrays is None:
+            states = list(self._team_state.values())
+            self._team_arrays = (
+                {team: i for i, team in enumerate(self._team_state)},
+                np.cumsum([0] + [len(state[0]) for state in states]),
+                np.concatenate([state[0] for state in states]).astype("datetime64[ns]").view(np.int64),
+                *(np.concatenate([state[k] for state in states]) for k in (1, 2, 3)),
+            )
+        return self._team_arrays
+
+    def _batch_features(self, parsed: list) -> pd.DataFrame:
+        """_game_features for every game at once, computed in parallel by _side_features."""
+        team_idx, *arrays = self._flat_team_state()
+        days = pd.DatetimeIndex([game_date for _, _, game_date in parsed]).as_unit("ns").asi8
+        cutoffs = days - _RECENT_NS
+        
+        features = {"is_home": np.ones(len(parsed), dtype=np.int64)}
+        for side, pos, placeholder_win in (("home", 0, 0.0), ("away", 1, 1.0)):
+            idx = np.array([team_idx[game[pos]] for game in parsed], dtype=np.int32)
+            out = np.empty((len(parsed), 3))
+            _side_features(idx, days, cutoffs, placeholder_win, *arrays, out)
+            features[f"{side}_season_win_pct"] = out[:, 0]
+            features[f"{side}_pts_differential"] = out[:, 1]
+            features[f"{side}_recent_win_pct"] = out[:, 2]
+        return pd.DataFrame(features)
+
     def predict_game(self, home_team: str, away_team: str, game_date: str = None) -> dict:
         """
         Predict outcome for a single game.
@@ -145,30 +335,35 @@ class GamePredictionPipeline:
         Args:
             home_team: Home team name (e.g., "Lakers", "Celtics")
             away_team: Away team name
-            game_date: Game date as "YYYY-MM-DD" (defaults to today)
+            game_date: Game date as "YYYY-MM-DD" or a datetime (defaults to today)
             
         Returns:
             {home_win_prob, away_win_prob, confidence, features_used}
         """
-        if self.predictor is None:
-            raise ValueError("Model not loaded. Call load_model() or train() first.")
-        
+        return self.predict_batch([{"home_team": home_team, "away_team": away_team, "game_date": game_date}])[0]
+
+    def _parse_game(self, home_team: str, away_team: str, game_date: str = None) -> pd.Timestamp:
+        """Validate the team names against the history and parse game_date (defaults to today)."""
         # Validate team names
-        if self.games_df is not None:
-            all_teams = set(pd.concat([self.games_df["home_team"], self.games_df["away_team"]]).unique())
+        all_teams = self._all_teams
+        if all_teams is not None:
             if home_team not in all_teams:
                 raise ValueError(f"Unknown home team: {home_team}. Available teams: {sorted(all_teams)}")
             if away_team not in all_teams:
                 raise ValueError(f"Unknown away team: {away_team}. Available teams: {sorted(all_teams)}")
         
         if game_date is None:
-            game_date = datetime.now().strftime("%Y-%m-%d")
+            return pd.Timestamp.today().normalize()
+        if isinstance(game_date, datetime):  # Includes pd.Timestamp
+            return pd.Timestamp(game_date)
         
         try:
-            game_date = pd.to_datetime(game_date)
+            return pd.to_datetime(game_date)
         except Exception as e:
             raise ValueError(f"Invalid date format: {game_date}. Use YYYY-MM-DD format.") from e
-        
+
+    def _featurize_slow(self, home_team: str, away_team: str, game_date: pd.Timestamp) -> dict:
+        """Feature row for a game by re-featurizing the history (teams missing from _team_state)."""
         # Create game record
         game = pd.DataFrame({
             "home_team": [home_team],
@@ -182,42 +377,21 @@ class GamePredictionPipeline:
         
         # Get historical data as of this game (using all historical for team stats)
         if self.games_df is not None:
-            historical = self.games_df[self.games_df["game_date"] < game_date].copy()
+            historical = self.games_df[self.games_df["game_date"] < game_date]
         else:
-            historical = game.copy()
+            historical = game
         
-        # Feature engineering on this game
+        # Feature engineering on this game. Every historical game is earlier, so
+        # appending keeps date order (and add_game_features sorts by date itself)
         combined = pd.concat([historical, game], ignore_index=True)
-        combined = combined.sort_values("game_date").reset_index(drop=True)
         featured = FeatureEngineer.add_game_features(combined)
         
         # Get the last row (our game)
-        game_features = featured.iloc[-1:].copy()
-        
-        # Predict
-        prob = self.predictor.predict(game_features, return_prob=True)[0]  # P(home_win)
-        
-        return {
-            "home_team": home_team,
-            "away_team": away_team,
-            "game_date": str(game_date.date()),
-            "home_win_probability": float(prob),
-            "away_win_probability": float(1 - prob),
-            "predicted_winner": home_team if prob > 0.5 else away_team,
-            "confidence": float(abs(prob - 0.5) * 2),  # 0 = 50%, 1 = very confident
-            "features": {
-                "home_season_wp": float(game_features["home_season_win_pct"].iloc[0]),
-                "away_season_wp": float(game_features["away_season_win_pct"].iloc[0]),
-                "home_recent_wp": float(game_features["home_recent_win_pct"].iloc[0]),
-                "away_recent_wp": float(game_features["away_recent_win_pct"].iloc[0]),
-                "home_pt_diff": float(game_features["home_pts_differential"].iloc[0]),
-                "away_pt_diff": float(game_features["away_pts_differential"].iloc[0]),
-            }
-        }
+        return featured.iloc[-1].to_dict()
 
     def predict_batch(self, games: list) -> list:
         """
-        Predict multiple games at once.
+        Predict multiple games at once, scoring the whole batch in one model call.
         
         Args:
             games: List of dicts with {home_team, away_team, game_date}
@@ -225,16 +399,68 @@ class GamePredictionPipeline:
         Returns:
             List of prediction dicts
         """
-        results = []
-        for game in games:
-            pred = self.predict_game(
-                game["home_team"],
-                game["away_team"],
-                game.get("game_date")
-            )
-            if pred:
-                results.append(pred)
-        return results
+        if self.predictor is None:
+            raise ValueError("Model not loaded. Call load_model() or train() first.")
+        if not games:
+            return []
+        
+        parsed = [
+            (game["home_team"], game["away_team"],
+             self._parse_game(game["home_team"], game["away_team"], game.get("game_date")))
+            for game in games
+        ]
+        indexed = all(home in self._team_state and away in self._team_state for home, away, _ in parsed)
+        if NUMBA_AVAILABLE and indexed:
+            features = self._batch_features(parsed)
+        else:
+            features = pd.DataFrame([
+                self._game_features(*game) if game[0] in self._team_state and game[1] in self._team_state
+                else self._featurize_slow(*game)
+                for game in parsed
+            ])
+        
+        # Score the whole slate in one model call, from a float32 matrix in
+        # training-feature order (models without feature names go through predict)
+        names = self.predictor.feature_names
+        if names:
+            n, k = len(features), len(names)
+            if self._pred_buf is None or self._pred_buf.shape[0] < n or self._pred_buf.shape[1] != k:
+                self._pred_buf = np.empty((max(n, 32), k), dtype=np.float32)
+            X = self._pred_buf[:n]
+            for j, name in enumerate(names):
+                X[:, j] = features[name] if name in features else np.nan
+            X[np.isnan(X)] = 0.5  # Neutral fill, as in GamePredictor.predict
+            probs = self.predictor.predict_raw(X)  # P(home_win)
+        else:
+            probs = self.predictor.predict(features, return_prob=True)
+        
+        # Plain Python floats for the result dicts, one list per feature column
+        columns = zip(*(features[col].tolist() for col in (
+            "home_season_win_pct", "away_season_win_pct", "home_recent_win_pct",
+            "away_recent_win_pct", "home_pts_differential", "away_pts_differential")))
+
+        return [
+            {
+                "home_team": home_team,
+                "away_team": away_team,
+                "game_date": str(game_date.date()),
+                "home_win_probability": float(prob),
+                "away_win_probability": float(1 - prob),
+                "predicted_winner": home_team if prob > 0.5 else away_team,
+                "confidence": float(abs(prob - 0.5) * 2),  # 0 = 50%, 1 = very confident
+                "features": {
+                    "home_season_wp": home_season_wp,
+                    "away_season_wp": away_season_wp,
+                    "home_recent_wp": home_recent_wp,
+                    "away_recent_wp": away_recent_wp,
+                    "home_pt_diff": home_pt_diff,
+                    "away_pt_diff": away_pt_diff,
+                }
+            }
+            for (home_team, away_team, game_date), prob,
+                (home_season_wp, away_season_wp, home_recent_wp, away_recent_wp, home_pt_diff, away_pt_diff)
+            in zip(parsed, probs, columns)
+        ]
 
 
 def main():
@@ -262,12 +488,12 @@ def main():
     for home, away, date in example_games:
         pred = pipeline.predict_game(home, away, date)
         if pred:
-            logger.info(f"\n{home} vs {away} ({date})")
-            logger.info(f"  {home} Win Prob:  {pred['home_win_probability']:.2%}")
-            logger.info(f"  {away} Win Prob:  {pred['away_win_probability']:.2%}")
-            logger.info(f"  Prediction:     {pred['predicted_winner']} (confidence: {pred['confidence']:.1%})")
-            logger.info(f"  {home} Season W%:  {pred['features']['home_season_wp']:.1%}")
-            logger.info(f"  {away} Season W%:  {pred['features']['away_season_wp']:.1%}")
+            logger.info("\n%s vs %s (%s)", home, away, date)
+            logger.info("  %s Win Prob:  %.2f%%", home, pred['home_win_probability'] * 100)
+            logger.info("  %s Win Prob:  %.2f%%", away, pred['away_win_probability'] * 100)
+            logger.info("  Prediction:     %s (confidence: %.1f%%)", pred['predicted_winner'], pred['confidence'] * 100)
+            logger.info("  %s Season W%%:  %.1f%%", home, pred['features']['home_season_wp'] * 100)
+            logger.info("  %s Season W%%:  %.1f%%", away, pred['features']['away_season_wp'] * 100)
 
 
 if __name__ == "__main__":
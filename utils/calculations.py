@@ -3,6 +3,12 @@
 import numpy as np
 from typing import List, Tuple
 
+try:
+    from numba import njit, vectorize
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 
 def calculate_parlay_odds(individual_odds: List[float]) -> float:
     """
@@ -14,11 +20,23 @@ def calculate_parlay_odds(individual_odds: List[float]) -> float:
     Returns:
         Combined parlay decimal odds
     """
+    if isinstance(individual_odds, np.ndarray):
+        if individual_odds.size == 0:
+            raise ValueError("individual_odds cannot be empty")
+        if not (individual_odds > 0).all():
+            raise ValueError("All odds must be positive")
+        return float(individual_odds.prod())
+    
     if not individual_odds:
         raise ValueError("individual_odds cannot be empty")
-    if any(odd <= 0 for odd in individual_odds):
-        raise ValueError("All odds must be positive")
-    return float(np.prod(individual_odds))
+    # Validate and multiply in one pass; for a handful of legs np.prod's
+    # array setup costs more than the arithmetic
+    total = 1.0
+    for odd in individual_odds:
+        if odd <= 0:
+            raise ValueError("All odds must be positive")
+        total *= odd
+    return float(total)
 
 
 def calculate_parlay_probability(individual_probs: List[float]) -> float:
@@ -31,9 +49,21 @@ def calculate_parlay_probability(individual_probs: List[float]) -> float:
     Returns:
         Overall parlay win probability (0-1)
     """
+    if isinstance(individual_probs, np.ndarray):
+        if individual_probs.size == 0:
+            raise ValueError("individual_probs cannot be empty")
+        if not ((individual_probs >= 0) & (individual_probs <= 1)).all():
+            raise ValueError("Probabilities must be between 0 and 1")
+        return float(individual_probs.prod())
+    
     if not individual_probs:
         raise ValueError("individual_probs cannot be empty")
-    return float(np.prod(individual_probs))
+    total = 1.0
+    for prob in individual_probs:
+        if not 0 <= prob <= 1:
+            raise ValueError("Probabilities must be between 0 and 1")
+        total *= prob
+    return float(total)
  
 
 def calculate_expected_value(probability: float, odds: float, wager: float = 100) -> float:
@@ -55,6 +85,48 @@ def calculate_expected_value(probability: float, odds: float, wager: float = 100
     return wager * (probability * (odds - 1) - (1 - probability))
 
 
+def calculate_parlay_probabilities_batch(prob_matrix: np.ndarray) -> np.ndarray:
+    """
+    calculate_parlay_probability for many parlays at once.
+    
+    Use this (and calculate_expected_values_batch) when screening candidate
+    parlays in a loop; the scalar helpers are meant for one-off calls.
+    
+    Args:
+        prob_matrix: (n_parlays, n_legs) leg win probabilities (0-1)
+        
+    Returns:
+        (n_parlays,) parlay win probabilities
+    """
+    prob_matrix = np.asarray(prob_matrix, dtype=np.float64)
+    if prob_matrix.ndim != 2 or prob_matrix.shape[1] == 0:
+        raise ValueError("prob_matrix must be 2-D with at least one leg")
+    if not ((prob_matrix >= 0) & (prob_matrix <= 1)).all():
+        raise ValueError("Probabilities must be between 0 and 1")
+    return prob_matrix.prod(axis=1)
+
+
+def calculate_expected_values_batch(probs: np.ndarray, odds: np.ndarray, wager: float = 100) -> np.ndarray:
+    """
+    calculate_expected_value over arrays of probabilities and decimal odds.
+    
+    Args:
+        probs: Win probabilities (0-1)
+        odds: Decimal odds, broadcastable against probs
+        wager: Wager amount (default 100)
+        
+    Returns:
+        Expected values in currency units
+    """
+    probs = np.asarray(probs, dtype=np.float64)
+    odds = np.asarray(odds, dtype=np.float64)
+    if not ((probs >= 0) & (probs <= 1)).all():
+        raise ValueError("Probability must be between 0 and 1")
+    if not (odds > 0).all():
+        raise ValueError("Odds must be positive")
+    return wager * (probs * (odds - 1) - (1 - probs))
+
+
 def american_to_decimal(american_odds: float) -> float:
     """Convert American odds to decimal odds."""
     if american_odds > 0:
@@ -69,3 +141,26 @@ def decimal_to_american(decimal_odds: float) -> float:
         return (decimal_odds - 1) * 100
     else:
         return -100 / (decimal_odds - 1)
+
+
+if NUMBA_AVAILABLE:
+    # Compiled ufuncs from the scalar definitions, then the scalar helpers
+    # themselves (EV screening calls them in tight loops). No fastmath: the
+    # range checks must still reject NaN.
+    american_to_decimal_array = vectorize(["float64(float64)"], cache=True)(american_to_decimal)
+    decimal_to_american_array = vectorize(["float64(float64)"], cache=True)(decimal_to_american)
+    calculate_expected_value = njit(cache=True)(calculate_expected_value)
+    american_to_decimal = njit(cache=True)(american_to_decimal)
+    decimal_to_american = njit(cache=True)(decimal_to_american)
+else:
+    def american_to_decimal_array(american_odds: np.ndarray) -> np.ndarray:
+        """american_to_decimal elementwise over an array."""
+        american_odds = np.asarray(american_odds, dtype=np.float64)
+        with np.errstate(divide="ignore"):
+            return np.where(american_odds > 0, american_odds / 100 + 1, 100 / np.abs(american_odds) + 1)
+
+    def decimal_to_american_array(decimal_odds: np.ndarray) -> np.ndarray:
+        """decimal_to_american elementwise over an array."""
+        decimal_odds = np.asarray(decimal_odds, dtype=np.float64)
+        with np.errstate(divide="ignore"):
+            return np.where(decimal_odds >= 2, (decimal_odds - 1) * 100, -100 / (decimal_odds - 1))